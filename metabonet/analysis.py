@@ -42,8 +42,9 @@ License:
 import os
 import pickle
 import copy
+import math
 import statistics
-import random
+import multiprocessing
 
 # Relevant
 import networkx as ntx
@@ -51,7 +52,11 @@ import numpy
 
 # Custom
 import metabonet.metabocurator.conversion as conversion
+import metabonet.conversion as conversion_network
 import metabonet.utility as utility
+import metabonet.compact as compact
+import metabonet.topology as topology
+import metabonet.cache as cache
 
 #dir()
 #importlib.reload()
@@ -60,118 +65,20 @@ import metabonet.utility as utility
 # Functionality
 
 
-# TODO: this is a temporary bug fix for...
-# TODO: ntx.algorithms.bipartite.centrality.closeness_centrality()
-
-def bipartite_closeness_centrality(G, nodes, normalized=True):
-    r"""Compute the closeness centrality for nodes in a bipartite network.
-
-    The closeness of a node is the distance to all other nodes in the
-    graph or in the case that the graph is not connected to all other nodes
-    in the connected component containing that node.
-
-    Parameters
-    ----------
-    G : graph
-        A bipartite network
-
-    nodes : list or container
-        Container with all nodes in one bipartite node set.
-
-    normalized : bool, optional
-      If True (default) normalize by connected component size.
-
-    Returns
-    -------
-    closeness : dictionary
-        Dictionary keyed by node with bipartite closeness centrality
-        as the value.
-
-    See Also
-    --------
-    betweenness_centrality,
-    degree_centrality
-    sets,
-    is_bipartite
-
-    Notes
-    -----
-    The nodes input parameter must conatin all nodes in one bipartite node set,
-    but the dictionary returned contains all nodes from both node sets.
-    See :mod:`bipartite documentation <networkx.algorithms.bipartite>`
-    for further details on how bipartite graphs are handled in NetworkX.
-
-
-    Closeness centrality is normalized by the minimum distance possible.
-    In the bipartite case the minimum distance for a node in one bipartite
-    node set is 1 from all nodes in the other node set and 2 from all
-    other nodes in its own set [1]_. Thus the closeness centrality
-    for node `v`  in the two bipartite sets `U` with
-    `n` nodes and `V` with `m` nodes is
-
-    .. math::
-
-        c_{v} = \frac{m + 2(n - 1)}{d}, \mbox{for} v \in U,
-
-        c_{v} = \frac{n + 2(m - 1)}{d}, \mbox{for} v \in V,
-
-    where `d` is the sum of the distances from `v` to all
-    other nodes.
-
-    Higher values of closeness  indicate higher centrality.
-
-    As in the unipartite case, setting normalized=True causes the
-    values to normalized further to n-1 / size(G)-1 where n is the
-    number of nodes in the connected part of graph containing the
-    node.  If the graph is not completely connected, this algorithm
-    computes the closeness centrality for each connected part
-    separately.
-
-    References
-    ----------
-    .. [1] Borgatti, S.P. and Halgin, D. In press. "Analyzing Affiliation
-        Networks". In Carrington, P. and Scott, J. (eds) The Sage Handbook
-        of Social Network Analysis. Sage Publications.
-        http://www.steveborgatti.com/research/publications/bhaffiliations.pdf
-    """
-    closeness = {}
-    path_length = ntx.single_source_shortest_path_length
-    top = set(nodes)
-    bottom = set(G) - top
-    n = float(len(top))
-    m = float(len(bottom))
-    for node in top:
-        sp = dict(path_length(G, node))
-        totsp = sum(sp.values())
-        if totsp > 0.0 and len(G) > 1:
-            closeness[node] = (m + 2 * (n - 1)) / totsp
-            if normalized:
-                s = (len(sp) - 1.0) / (len(G) - 1)
-                closeness[node] *= s
-        else:
-            # TODO: correction of error in original
-            closeness[node] = 0.0
-    for node in bottom:
-        sp = dict(path_length(G, node))
-        totsp = sum(sp.values())
-        if totsp > 0.0 and len(G) > 1:
-            closeness[node] = (n + 2 * (m - 1)) / totsp
-            if normalized:
-                s = (len(sp) - 1.0) / (len(G) - 1)
-                closeness[node] = (closeness[node] / s)
-                closeness[node] *= s
-        else:
-            # TODO: correction of error in original
-            closeness[node] = 0.0
-    return closeness
-
-
-def read_source(directory=None):
+def read_source(directory=None, path_network=None, complete=None):
     """
     Reads and organizes source information from file
 
+    If the network has a store of arrays, analysis needs only this store,
+    information about nodes, and customization, so reads omit the model and
+    the network's elements in format for NetworkX.
+
     arguments:
         directory (str): directory of source files
+        path_network (str): directory of network's files, or None for the
+            network in the directory of source files
+        complete (bool): whether to read the model and the network's elements
+            in format for NetworkX even if a store of arrays exists
 
     raises:
 
@@ -189,19 +96,52 @@ def read_source(directory=None):
     path_source = os.path.join(directory, "source")
     path_customization = os.path.join(path_source, "customization")
 
-    path_network = os.path.join(directory, "network")
-    path_networkx = os.path.join(
-        path_network, "network_networkx.pickle"
+    if path_network is None:
+        path_network = os.path.join(directory, "network")
+    path_nodes_reactions = os.path.join(path_network, "nodes_reactions.pickle")
+    path_nodes_metabolites = os.path.join(
+        path_network, "nodes_metabolites.pickle"
     )
     path_simplification_metabolites = os.path.join(
         path_customization, "simplification_metabolites.tsv"
     )
-    #path_network = os.path.join(directory, "network")
-    #path_nodes_reactions = os.path.join(path_network, "nodes_reactions.pickle")
-    #path_nodes_metabolites = os.path.join(
-    #    path_network, "nodes_metabolites.pickle"
-    #)
     # Read information from file.
+    simplification_metabolites = utility.read_file_table(
+        path_file=path_simplification_metabolites,
+        names=None,
+        delimiter="\t"
+    )
+    # Read compact network from store of arrays if available.
+    if os.path.exists(os.path.join(path_network, "store")):
+        network_compact = compact.read_network_store(
+            path=path_network, mapping=True
+        )
+    else:
+        network_compact = None
+    if (network_compact is not None) and (not complete):
+        # Read only information about nodes.
+        with open(path_nodes_reactions, "rb") as file_source:
+            nodes_reactions = pickle.load(file_source)
+        with open(path_nodes_metabolites, "rb") as file_source:
+            nodes_metabolites = pickle.load(file_source)
+        return {
+            "compartments": None,
+            "processes": None,
+            "reactions": None,
+            "metabolites": None,
+            "nodes": None,
+            "links": None,
+            "nodes_reactions_identifiers": [
+                node["identifier"] for node in nodes_reactions.values()
+            ],
+            "nodes_reactions": nodes_reactions,
+            "nodes_metabolites_identifiers": [
+                node["identifier"] for node in nodes_metabolites.values()
+            ],
+            "nodes_metabolites": nodes_metabolites,
+            "network_compact": network_compact,
+            "simplification_metabolites": simplification_metabolites
+        }
     with open(path_compartments, "rb") as file_source:
         compartments = pickle.load(file_source)
     with open(path_processes, "rb") as file_source:
@@ -210,13 +150,7 @@ def read_source(directory=None):
         reactions = pickle.load(file_source)
     with open(path_metabolites, "rb") as file_source:
         metabolites = pickle.load(file_source)
-    with open(path_networkx, "rb") as file_source:
-        information = pickle.load(file_source)
-    simplification_metabolites = utility.read_file_table(
-        path_file=path_simplification_metabolites,
-        names=None,
-        delimiter="\t"
-    )
+    information = conversion_network.read_networkx(path=path_network)
     # Compile and return information.
     return {
         "compartments": compartments,
@@ -233,6 +167,7 @@ def read_source(directory=None):
             information["nodes_metabolites_identifiers"]
         ),
         "nodes_metabolites": information["nodes_metabolites"],
+        "network_compact": network_compact,
         "simplification_metabolites": simplification_metabolites
     }
 
@@ -269,10 +204,12 @@ def instantiate_networkx(nodes=None, links=None):
 
 def analyze_bipartite_network_nodes(
     network=None,
+    adjacency=None,
     nodes_reactions_identifiers=None,
     nodes_reactions=None,
     nodes_metabolites_identifiers=None,
-    nodes_metabolites=None
+    nodes_metabolites=None,
+    processes=None
 ):
     """
     Analyze individual nodes in a bipartite network.
@@ -280,6 +217,8 @@ def analyze_bipartite_network_nodes(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes_reactions_identifiers (list<str>): identifiers of reactions'
             nodes
         nodes_reactions (dict<dict>): information about network's nodes for
@@ -288,18 +227,30 @@ def analyze_bipartite_network_nodes(
             nodes
         nodes_metabolites (dict<dict>): information about network's nodes for
             metabolites
+        processes (int): count of parallel worker processes
 
     raises:
 
     returns:
-        (dict<dict<dict>>): information about network's nodes
+        (dict<object>): structured arrays of information about network's
+            nodes for reactions and metabolites
 
     """
 
+    # Define matrix of adjacency.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
+    # Determine distances from all nodes in a single pass of searches.
+    topology.determine_breadth_first_distances(
+        adjacency=adjacency,
+        sets=[nodes_reactions_identifiers, nodes_metabolites_identifiers],
+        processes=processes
+    )
     # Reactions.
     reactions = analyze_network_nodes_group(
         type="reaction",
         network=network,
+        adjacency=adjacency,
         nodes_identifiers=nodes_reactions_identifiers,
         nodes=nodes_reactions
     )
@@ -307,6 +258,7 @@ def analyze_bipartite_network_nodes(
     metabolites = analyze_network_nodes_group(
         type="metabolite",
         network=network,
+        adjacency=adjacency,
         nodes_identifiers=nodes_metabolites_identifiers,
         nodes=nodes_metabolites
     )
@@ -320,6 +272,7 @@ def analyze_bipartite_network_nodes(
 def analyze_network_nodes_group(
     type=None,
     network=None,
+    adjacency=None,
     nodes_identifiers=None,
     nodes=None
 ):
@@ -335,11 +288,14 @@ def analyze_network_nodes_group(
     eigenvector centrality
     eccentricity centrality
     eccentricity
+    reachability
     clustering coefficient
 
     arguments:
         type (str): type of nodes in set, reaction or metabolite
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes_identifiers (list<str>): identifiers of nodes in a bipartite set
         nodes (dict<dict>): information about network's nodes in a bipartite
             set
@@ -347,108 +303,121 @@ def analyze_network_nodes_group(
     raises:
 
     returns:
-        (dict<dict>): information about network's nodes
+        (object): structured array of information about network's nodes in
+            order of identifiers
 
     """
 
     # Degree.
     degrees = determine_network_nodes_degrees(
-        network=network, nodes=nodes_identifiers
+        adjacency=adjacency, nodes=nodes_identifiers
     )
     # Centrality.
     centralities = determine_network_nodes_centralities(
         network=network,
-        nodes=nodes_identifiers
+        adjacency=adjacency,
+        nodes=nodes_identifiers,
+        degrees=degrees
     )
     # Distance.
-    # Measurements of distance including diameter and radius are undefined for
-    # non-connected or even less-connected networks.
-    #distances = determine_network_nodes_distances(network=network, nodes=nodes)
+    distances = determine_network_nodes_distances(
+        adjacency=adjacency,
+        nodes=nodes_identifiers
+    )
     # Cluster.
     clusters = determine_network_nodes_clusters(
-        network=network,
+        adjacency=adjacency,
         nodes=nodes_identifiers
     )
     # Rank.
     ranks = determine_network_nodes_ranks(
-        nodes=nodes_identifiers,
         degrees=degrees,
         centralities=centralities
     )
     # Compile information.
-    collection = {}
-    for node_identifier in nodes_identifiers:
-        entry = {
-            "identifier": node_identifier,
-            "type": nodes[node_identifier]["type"],
-            "entity": nodes[node_identifier]["entity"],
-            "name": nodes[node_identifier]["name"],
-            "degree_in": degrees[node_identifier]["degree_in"],
-            "degree_out": degrees[node_identifier]["degree_out"],
-            "degree": degrees[node_identifier]["degree"],
-            "centrality_degree": centralities[node_identifier]["degree"],
-            "centrality_closeness": centralities[node_identifier]["closeness"],
-            "centrality_betweenness": (
-                centralities[node_identifier]["betweenness"]
-            ),
-            #"eccentricity": distances[node]["eccentricity"],
-            "cluster_coefficient": clusters[node_identifier]["coefficient"],
-            "rank": ranks[node_identifier]["rank"],
-            "rank_degree": ranks[node_identifier]["rank_degree"],
-            "rank_centrality_degree": (
-                ranks[node_identifier]["rank_centrality_degree"]
-            ),
-            "rank_centrality_closeness": (
-                ranks[node_identifier]["rank_centrality_closeness"]
-            ),
-            "rank_centrality_betweenness": (
-                ranks[node_identifier]["rank_centrality_betweenness"]
-            ),
-        }
-        if type == "metabolite":
-            entry["reference_hmdb"] = nodes[node_identifier]["reference_hmdb"]
-        collection[node_identifier] = entry
-    return collection
+    columns = {
+        "identifier": nodes_identifiers,
+        "type": [nodes[node]["type"] for node in nodes_identifiers],
+        "entity": [nodes[node]["entity"] for node in nodes_identifiers],
+        "name": [nodes[node]["name"] for node in nodes_identifiers],
+        "degree_in": degrees["degree_in"],
+        "degree_out": degrees["degree_out"],
+        "degree": degrees["degree"],
+        "centrality_degree": centralities["degree"],
+        "centrality_closeness": centralities["closeness"],
+        "centrality_betweenness": centralities["betweenness"],
+        "eccentricity": distances["eccentricity"],
+        "reachability": distances["reachability"],
+        "cluster_coefficient": clusters["coefficient"],
+        "rank": ranks["rank"],
+        "rank_degree": ranks["rank_degree"],
+        "rank_centrality_degree": ranks["rank_centrality_degree"],
+        "rank_centrality_closeness": ranks["rank_centrality_closeness"],
+        "rank_centrality_betweenness": ranks["rank_centrality_betweenness"],
+    }
+    count = len(nodes_identifiers)
+    # Report estimation of approximate betweenness.
+    if "betweenness_estimation" in adjacency:
+        estimation = adjacency["betweenness_estimation"]
+        columns["betweenness_samples"] = numpy.full(
+            count, estimation["samples"], dtype=numpy.int64
+        )
+        columns["betweenness_error"] = numpy.full(
+            count, estimation["error"], dtype=numpy.float64
+        )
+    if type == "metabolite":
+        # Join references in text to keep a fixed type for the column.
+        columns["reference_hmdb"] = [
+            ";".join(nodes[node]["reference_hmdb"])
+            for node in nodes_identifiers
+        ]
+    return utility.define_table_array(columns=columns)
 
 
 def determine_network_nodes_degrees(
-    network=None,
+    adjacency=None,
     nodes=None
 ):
     """
     Determine degrees of nodes in a network.
 
     arguments:
-        network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes (list<str>): identifiers of nodes in a bipartite set
 
     raises:
 
     returns:
-        (dict<dict>): information about degrees of network's nodes
+        (dict<array>): degrees of network's nodes in order of identifiers
 
     """
 
-    # Determine degrees.
-    degrees_in = dict(network.in_degree(nodes))
-    degrees_out = dict(network.out_degree(nodes))
-    degrees = dict(network.degree(nodes))
+    # Determine degrees from counts of out-links in rows and of in-links in
+    # columns of the matrix of adjacency.
+    matrix = adjacency["matrix"]
+    count = matrix.shape[0]
+    degrees_out = numpy.diff(matrix.indptr).astype(numpy.int64)
+    degrees_in = numpy.bincount(matrix.indices, minlength=count)
+    degrees_in = degrees_in.astype(numpy.int64)
+    indices = numpy.fromiter(
+        (adjacency["indices"][node] for node in nodes),
+        dtype=numpy.int64,
+        count=len(nodes)
+    )
     # Compile information.
-    collection = {}
-    for node in nodes:
-        entry = {
-            "identifier": node,
-            "degree_in": degrees_in[node],
-            "degree_out": degrees_out[node],
-            "degree": degrees[node]
-        }
-        collection[node] = entry
-    return collection
+    return {
+        "degree_in": degrees_in[indices],
+        "degree_out": degrees_out[indices],
+        "degree": degrees_in[indices] + degrees_out[indices]
+    }
 
 
 def determine_network_nodes_centralities(
     network=None,
-    nodes=None
+    adjacency=None,
+    nodes=None,
+    degrees=None
 ):
     """
     Determine centralities of nodes in a network.
@@ -459,235 +428,270 @@ def determine_network_nodes_centralities(
     eigenvector centrality (ambiguous definition for bipartite network)
     eccentricity centrality (implementation unavailable)
 
+    Degree centrality of a node in a bipartite set is its degree relative to
+    the order of the other set, as in NetworkX.
+
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes (list<str>): identifiers of nodes in a bipartite set
+        degrees (dict<array>): degrees of network's nodes in order of
+            identifiers
 
     raises:
 
     returns:
-        (dict<dict>): information about centralities of network's nodes
+        (dict<array>): centralities of network's nodes in order of identifiers
 
     """
 
     # Determine centralities.
-    centralities_degree = (
-        ntx.algorithms.bipartite.centrality.degree_centrality(network, nodes)
-    )
+    # ntx.algorithms.bipartite.centrality.degree_centrality(network, nodes)
+    order_other = len(adjacency["identifiers"]) - len(set(nodes))
+    centralities_degree = degrees["degree"] * (1.0 / order_other)
     # Normalize centralities to the order of each node's component if network
     # is discontinuous.
-    centralities_closeness = bipartite_closeness_centrality(
-        network, nodes, normalized=True
+    centralities_closeness = (
+        topology.calculate_bipartite_closeness_centrality(
+            adjacency=adjacency, nodes=nodes, normalized=True
+        )
     )
     centralities_betweenness = (
-        ntx.algorithms.bipartite.centrality.betweenness_centrality(
-            network, nodes
+        topology.calculate_bipartite_betweenness_centrality(
+            adjacency=adjacency, nodes=nodes
         )
     )
     # Compile information.
-    collection = {}
-    for node in nodes:
-        entry = {
-            "identifier": node,
-            "degree": centralities_degree[node],
-            "closeness": centralities_closeness[node],
-            "betweenness": centralities_betweenness[node]
-        }
-        collection[node] = entry
-    return collection
+    return {
+        "degree": centralities_degree,
+        "closeness": numpy.fromiter(
+            (centralities_closeness[node] for node in nodes),
+            dtype=numpy.float64,
+            count=len(nodes)
+        ),
+        "betweenness": numpy.fromiter(
+            (centralities_betweenness[node] for node in nodes),
+            dtype=numpy.float64,
+            count=len(nodes)
+        )
+    }
 
 
 def determine_network_nodes_distances(
-    network=None,
+    adjacency=None,
     nodes=None
 ):
     """
     Determine distances of nodes in a network.
 
+    Eccentricity is the maximal distance from a node to any node that it can
+    reach, since eccentricity is otherwise undefined for networks that are not
+    strongly connected.
+
     arguments:
-        network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes (list<str>): identifiers of nodes in a bipartite set
 
     raises:
 
     returns:
-        (dict<dict>): information about distances of network's nodes
+        (dict<array>): distances of network's nodes in order of identifiers
 
     """
 
     # Determine distances.
-    eccentricities = ntx.algorithms.distance_measures.eccentricity(
-        network, nodes
+    distances = topology.determine_breadth_first_distances(
+        adjacency=adjacency
+    )
+    indices = numpy.fromiter(
+        (adjacency["indices"][node] for node in nodes),
+        dtype=numpy.int64,
+        count=len(nodes)
     )
     # Compile information.
-    collection = {}
-    for node in nodes:
-        entry = {
-            "identifier": node,
-            "eccentricity": eccentricities[node]
-        }
-        collection[node] = entry
-    return collection
+    return {
+        "eccentricity": distances["eccentricities"][indices].astype(
+            numpy.int64
+        ),
+        "reachability": distances["counts"][indices].astype(numpy.int64) - 1
+    }
 
 
 def determine_network_nodes_clusters(
-    network=None,
+    adjacency=None,
     nodes=None
 ):
     """
     Determine cluster coefficients of nodes in a network.
 
     arguments:
-        network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes (list<str>): identifiers of nodes in a bipartite set
 
     raises:
 
     returns:
-        (dict<dict>): information about cluster coefficients of network's nodes
+        (dict<array>): cluster coefficients of network's nodes in order of
+            identifiers
 
     """
 
     # Determine cluster coefficients.
-    clusters = (
-        ntx.algorithms.bipartite.cluster.clustering(
-            network, nodes, mode="dot"
+    # ntx.algorithms.bipartite.cluster.clustering(mode="dot")
+    def calculate():
+        return topology.calculate_bipartite_clustering(
+            adjacency=adjacency, nodes=nodes
         )
+    clusters = cache.determine_value(
+        adjacency=adjacency,
+        name="clustering",
+        parameters={"nodes": cache.define_nodes_key(nodes=nodes)},
+        function=calculate
     )
     # Compile information.
-    collection = {}
-    for node in nodes:
-        entry = {
-            "identifier": node,
-            "coefficient": clusters[node]
-        }
-        collection[node] = entry
-    return collection
+    return {
+        "coefficient": numpy.fromiter(
+            (clusters[node] for node in nodes),
+            dtype=numpy.float64,
+            count=len(nodes)
+        )
+    }
 
 
 def determine_network_nodes_ranks(
-    nodes=None,
     degrees=None,
-    centralities=None
+    centralities=None,
+    ties=None
 ):
     """
     Assign ranks to nodes according to multiple metrics.
 
     arguments:
-        nodes (dict<dict>): information about network's nodes in a bipartite
-            set
-        degrees (dict<dict>): information about degrees of network's nodes
-        centralities (dict<dict>): information about centralities of network's
-            nodes
+        degrees (dict<array>): degrees of network's nodes in order of
+            identifiers
+        centralities (dict<array>): centralities of network's nodes in order
+            of identifiers
+        ties (str): method to rank ties, "ordinal" by order of nodes or
+            "minimum" for shared minimal rank, or None for "ordinal"
 
     raises:
 
     returns:
-        (dict<dict>): information about network's nodes
+        (dict<array>): ranks of network's nodes in order of identifiers
 
     """
 
-    # Sort degrees.
-    ranks_degree = sorted(
-        degrees.values(), key=lambda record: record["degree"], reverse=True
+    # Round centralities so that differences in the last places of floating
+    # point, which depend on the order of summation, do not break ties.
+    centralities = {
+        key: round_values_significance(values=centralities[key], digits=12)
+        for key in ["degree", "closeness", "betweenness"]
+    }
+    # Rank nodes with greatest degrees and centralities first.
+    ranks_degree = determine_ranks(
+        values=degrees["degree"], descending=True, ties=ties
     )
-    # Sort centralities.
-    ranks_centrality_degree = sorted(
-        centralities.values(),
-        key=lambda record: record["degree"],
-        reverse=True
+    ranks_centrality_degree = determine_ranks(
+        values=centralities["degree"], descending=True, ties=ties
     )
-    ranks_centrality_closeness = sorted(
-        centralities.values(),
-        key=lambda record: record["closeness"],
-        reverse=True
+    ranks_centrality_closeness = determine_ranks(
+        values=centralities["closeness"], descending=True, ties=ties
     )
-    ranks_centrality_betweenness = sorted(
-        centralities.values(),
-        key=lambda record: record["betweenness"],
-        reverse=True
+    ranks_centrality_betweenness = determine_ranks(
+        values=centralities["betweenness"], descending=True, ties=ties
     )
-    # Collect ranks for each node.
-    ranks = collect_network_nodes_ranks(
-        nodes=nodes,
-        ranks_degree=ranks_degree,
-        ranks_centrality_degree=ranks_centrality_degree,
-        ranks_centrality_closeness=ranks_centrality_closeness,
-        ranks_centrality_betweenness=ranks_centrality_betweenness
+    # Determine overall rank.
+    ranks_total_raw = calculate_total_rank(
+        factor_degree=0.5,
+        factor_betweenness=0.5,
+        rank_centrality_degree=ranks_centrality_degree,
+        rank_centrality_betweenness=ranks_centrality_betweenness
     )
-    # Return information.
-    return ranks
+    ranks_total = determine_ranks(
+        values=ranks_total_raw, descending=False, ties=ties
+    )
+    # Compile information.
+    return {
+        "rank": ranks_total,
+        "rank_degree": ranks_degree,
+        "rank_centrality_degree": ranks_centrality_degree,
+        "rank_centrality_closeness": ranks_centrality_closeness,
+        "rank_centrality_betweenness": ranks_centrality_betweenness
+    }
 
 
-def collect_network_nodes_ranks(
-    nodes=None,
-    ranks_degree=None,
-    ranks_centrality_degree=None,
-    ranks_centrality_closeness=None,
-    ranks_centrality_betweenness=None
-):
+def determine_ranks(values=None, descending=None, ties=None):
     """
-    Collect ranks of nodes by multiple measurements.
+    Determine ranks of values, starting from one.
+
+    Ordinal ranks of tied values follow the original order of the values,
+    which is the behavior of a stable sort.
+    Minimal ranks of tied values share the rank of the first of them, as in
+    ranks of a competition.
 
     arguments:
-        nodes (dict<dict>): information about network's nodes in a bipartite
-            set
-        ranks_degree (list<dict>): sort list of nodes by degree
-        ranks_centrality_degree (list<dict>): sort list of nodes by degree
-            centrality
-        ranks_centrality_closeness (list<dict>): sort list of nodes by
-            closeness centrality
-        ranks_centrality_betweenness (list<dict>): sort list of nodes by
-            betweenness centrality
+        values (object): array of values
+        descending (bool): whether to rank greatest values first
+        ties (str): method to rank ties, "ordinal" by original order or
+            "minimum" for shared minimal rank, or None for "ordinal"
 
     raises:
+        (ValueError): unrecognized method to rank ties
 
     returns:
-        (dict<dict>): information about nodes' ranks by multiple measurements
+        (object): array of ranks in order of values
 
     """
 
-    ranks = {}
-    for node in nodes:
-        entry = {
-            "identifier": node
-        }
-        ranks[entry["identifier"]] = entry
-    for index, record in enumerate(ranks_degree, start=1):
-        ranks[record["identifier"]]["rank_degree"] = index
-    for index, record in enumerate(ranks_centrality_degree, start=1):
-        ranks[record["identifier"]]["rank_centrality_degree"] = index
-    for index, record in enumerate(ranks_centrality_closeness, start=1):
-        ranks[record["identifier"]]["rank_centrality_closeness"] = index
-    for index, record in enumerate(ranks_centrality_betweenness, start=1):
-        ranks[record["identifier"]]["rank_centrality_betweenness"] = index
-    # Determine overall rank.
-    ranks_total_raw = []
-    for entry in ranks.values():
-        identifier = entry["identifier"]
-        rank_centrality_degree = entry["rank_centrality_degree"]
-        rank_centrality_betweenness = entry["rank_centrality_betweenness"]
-        rank_total_raw = calculate_total_rank(
-            factor_degree=0.5,
-            factor_betweenness=0.5,
-            rank_centrality_degree=rank_centrality_degree,
-            rank_centrality_betweenness=rank_centrality_betweenness
-        )
-        record = {
-            "identifier": identifier,
-            "rank_total_raw": rank_total_raw
-        }
-        ranks_total_raw.append(record)
-    ranks_total_raw_sort = sorted(
-        ranks_total_raw,
-        key=lambda record: record["rank_total_raw"],
-        reverse=False
-    )
-    for index, record in enumerate(ranks_total_raw_sort, start=1):
-        ranks[record["identifier"]]["rank"] = index
+    if ties is None:
+        ties = "ordinal"
+    if ties not in ["ordinal", "minimum"]:
+        raise ValueError("unrecognized method to rank ties: " + str(ties))
+    values = numpy.asarray(values)
+    keys = -values if descending else values
+    # Sort stably so that ties keep original order.
+    order = numpy.argsort(keys, kind="stable")
+    positions = numpy.arange(1, len(values) + 1, dtype=numpy.int64)
+    if ties == "minimum":
+        # Assign each value the position of the first of its ties in sort.
+        keys_sort = keys[order]
+        starts = numpy.ones(len(values), dtype=bool)
+        starts[1:] = keys_sort[1:] != keys_sort[:-1]
+        positions = positions[starts][numpy.cumsum(starts) - 1]
+    ranks = numpy.empty(len(values), dtype=numpy.int64)
+    ranks[order] = positions
     return ranks
 
 
+def round_values_significance(values=None, digits=None):
+    """
+    Rounds values to a count of significant digits.
+
+    Values that differ only in digits beyond this precision become equal.
+
+    arguments:
+        values (object): array of values
+        digits (int): count of significant digits
+
+    raises:
+
+    returns:
+        (object): array of rounded values
+
+    """
+
+    # Format in decimal notation, which rounds correctly at any magnitude.
+    values = numpy.asarray(values, dtype=numpy.float64)
+    return numpy.fromiter(
+        (float(format(value, "." + str(digits) + "g")) for value in values),
+        dtype=numpy.float64,
+        count=len(values)
+    )
+
+
 def calculate_total_rank(
     factor_degree=None,
     factor_betweenness=None,
@@ -701,14 +705,15 @@ def calculate_total_rank(
     arguments:
         factor_degree (float): factor weight for degree centrality
         factor_betweenness (float): factor weight for betweenness centrality
-        rank_centrality_degree (int): rank by degree centrality
-        rank_centrality_betweenness (int): rank by betweenness centrality
+        rank_centrality_degree (int or array): rank by degree centrality
+        rank_centrality_betweenness (int or array): rank by betweenness
+            centrality
 
     raises:
 
     returns:
-        (int): rank by linear combination of ranks by degree centrality and
-            betweenness centrality
+        (float or array): rank by linear combination of ranks by degree
+            centrality and betweenness centrality
 
     """
 
@@ -727,16 +732,27 @@ def calculate_total_rank(
 
 def analyze_bipartite_network(
     network=None,
+    adjacency=None,
     nodes_reactions=None,
-    nodes_metabolites=None
+    nodes_metabolites=None,
+    references=None,
+    tolerance=None,
+    processes=None
 ):
     """
     Analyze a bipartite network.
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes_reactions (list<str>): identifiers of reactions' nodes
         nodes_metabolites (list<str>): identifiers of metabolites' nodes
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        processes (int): count of parallel worker processes
 
     raises:
 
@@ -745,17 +761,34 @@ def analyze_bipartite_network(
 
     """
 
+    # Define matrix of adjacency.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
+    # Determine distances from all nodes in a single pass of searches.
+    topology.determine_breadth_first_distances(
+        adjacency=adjacency,
+        sets=[nodes_reactions, nodes_metabolites],
+        processes=processes
+    )
     # Reactions.
     reactions = analyze_bipartite_network_group(
         network=network,
+        adjacency=adjacency,
         nodes_cis=nodes_reactions,
-        nodes_trans=nodes_metabolites
+        nodes_trans=nodes_metabolites,
+        references=references,
+        tolerance=tolerance,
+        processes=processes
     )
     # Metabolites.
     metabolites = analyze_bipartite_network_group(
         network=network,
+        adjacency=adjacency,
         nodes_cis=nodes_metabolites,
-        nodes_trans=nodes_reactions
+        nodes_trans=nodes_reactions,
+        references=references,
+        tolerance=tolerance,
+        processes=processes
     )
     # Compile information.
     return {
@@ -767,8 +800,12 @@ def analyze_bipartite_network(
 # This function defines the analysis of the network.
 def analyze_bipartite_network_group(
     network=None,
+    adjacency=None,
     nodes_cis=None,
-    nodes_trans=None
+    nodes_trans=None,
+    references=None,
+    tolerance=None,
+    processes=None
 ):
     """
     Analyze a bipartite network with primary relevance to a single bipartite
@@ -776,10 +813,17 @@ def analyze_bipartite_network_group(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes_cis (list<str>): identifiers of nodes in the bipartite set of
             current primary relevance
         nodes_trans (list<str>): identifiers of nodes in the bipartite set of
             current secondary relevance
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        processes (int): count of parallel worker processes
 
     raises:
 
@@ -799,10 +843,12 @@ def analyze_bipartite_network_group(
         if not (bipartite_cis and bipartite_trans):
             print("Error! ... Bipartite node sets are inaccurate!")
     # Scale.
-    scale = determine_network_scale(network=network, nodes=nodes_cis)
+    scale = determine_network_scale(
+        network=network, adjacency=adjacency, nodes=nodes_cis
+    )
     # Connectivity.
     connectivity = determine_network_connectivity(
-        network=network, nodes=nodes_cis
+        network=network, adjacency=adjacency, nodes=nodes_cis
     )
     # Distance.
     # Measurements of distance including diameter and radius are undefined for
@@ -811,36 +857,62 @@ def analyze_bipartite_network_group(
     # Centralization.
     centralization = determine_bipartite_network_centralization(
         network=network,
+        adjacency=adjacency,
         nodes_cis=nodes_cis,
         nodes_trans=nodes_trans,
         method="separate"
     )
+    # Read expensive metrics from cache if possible.
+    key_nodes = cache.define_nodes_key(nodes=nodes_cis)
     # Cluster.
-    cluster_coefficient = ntx.algorithms.bipartite.cluster.average_clustering(
-        network, nodes=nodes_cis, mode="dot"
+    # ntx.algorithms.bipartite.cluster.average_clustering(mode="dot")
+    def calculate_cluster():
+        return topology.calculate_bipartite_average_clustering(
+            adjacency=adjacency, nodes=nodes_cis
+        )
+    cluster_coefficient = cache.determine_value(
+        adjacency=adjacency,
+        name="cluster",
+        parameters={"nodes": key_nodes},
+        function=calculate_cluster
     )
     # Small-world.
-    small_world = calculate_bipartite_network_small_world_coefficient(
-        network=network,
-        nodes_cis=nodes_cis,
-        nodes_trans=nodes_trans
+    def calculate_small_world():
+        return calculate_bipartite_network_small_world_coefficient(
+            network=network,
+            adjacency=adjacency,
+            nodes_cis=nodes_cis,
+            nodes_trans=nodes_trans,
+            references=references,
+            tolerance=tolerance,
+            processes=processes
+        )
+    small_world = cache.determine_value(
+        adjacency=adjacency,
+        name="small_world",
+        parameters={
+            "nodes": key_nodes,
+            "references": references,
+            "tolerance": tolerance
+        },
+        function=calculate_small_world
     )
 
     # Assortativity.
-    # Project bipartite network to unipartite representation.
-    projection = ntx.algorithms.bipartite.projection.projected_graph(
-        network,
-        nodes_cis,
-        multigraph=True
-    )
-    assortativity = (
-        ntx.algorithms.assortativity.degree_assortativity_coefficient(
-            projection,
-            x="out",
-            y="in",
-            weight=None,
-            nodes=None,
+    # Calculate assortativity of the projection of the bipartite network to a
+    # unipartite representation without definition of the projection.
+    # ntx.algorithms.bipartite.projection.projected_graph(multigraph=True)
+    # ntx.algorithms.assortativity.degree_assortativity_coefficient()
+    def calculate_assortativity():
+        return topology.calculate_projection_degree_assortativity(
+            adjacency=adjacency,
+            nodes=nodes_cis
         )
+    assortativity = cache.determine_value(
+        adjacency=adjacency,
+        name="assortativity",
+        parameters={"nodes": key_nodes},
+        function=calculate_assortativity
     )
 
     # Modularity.
@@ -875,13 +947,23 @@ def analyze_bipartite_network_group(
         #"modules_orders": modules_orders,
         "path": small_world["path"],
         "small_world": small_world["small_world"],
+        "small_world_low": small_world["small_world_low"],
+        "small_world_high": small_world["small_world_high"],
+        "small_world_references": small_world["references"],
         "assortativity": assortativity,
     }
+    # Report estimation of approximate betweenness, from which centralization
+    # of betweenness derives.
+    if "betweenness_estimation" in adjacency:
+        estimation = adjacency["betweenness_estimation"]
+        collection["betweenness_samples"] = estimation["samples"]
+        collection["betweenness_error"] = estimation["error"]
     return collection
 
 
 def determine_network_scale(
     network=None,
+    adjacency=None,
     nodes=None
 ):
     """
@@ -889,6 +971,8 @@ def determine_network_scale(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes (list<str>): identifiers of nodes in a bipartite set
 
     raises:
@@ -898,13 +982,22 @@ def determine_network_scale(
 
     """
 
+    # Define matrix of adjacency.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
     # Determine scale.
     #network.number_of_nodes()
     #network.number_of_edges()
-    order_total = network.order()
+    order_total = len(adjacency["identifiers"])
     order_set = len(nodes)
-    size = network.size()
-    density = ntx.algorithms.bipartite.basic.density(network, nodes)
+    size = int(adjacency["matrix"].nnz)
+    # Density of a directional bipartite network as in NetworkX.
+    # ntx.algorithms.bipartite.basic.density(network, nodes)
+    order_other = order_total - order_set
+    if size == 0:
+        density = 0.0
+    else:
+        density = size / (2 * order_set * order_other)
     # Compile information.
     collection = {
         "order_total": order_total,
@@ -917,6 +1010,7 @@ def determine_network_scale(
 
 def determine_network_connectivity(
     network=None,
+    adjacency=None,
     nodes=None
 ):
     """
@@ -924,6 +1018,8 @@ def determine_network_connectivity(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes (list<str>): identifiers of nodes in a bipartite set
 
     raises:
@@ -948,33 +1044,21 @@ def determine_network_connectivity(
     #        network, nodes
     #    )
     #)
-    connection = (
-        ntx.algorithms.components.is_connected(network.to_undirected())
-    )
-    connection_strong = (
-        ntx.algorithms.components.is_strongly_connected(network)
-    )
-    connection_weak = ntx.algorithms.components.is_weakly_connected(network)
-    components_count = (
-        ntx.algorithms.components.number_connected_components(
-            network.to_undirected()
-        )
-    )
-    components = ntx.algorithms.components.connected_components(
-        network.to_undirected()
-    )
-    components_orders = []
-    for component in sorted(components, key=len, reverse=True):
-        components_orders.append(len(component))
-    bipartite = ntx.algorithms.bipartite.is_bipartite(network.to_undirected())
+    # Determine weak components by union-find and strong components by
+    # Tarjan's algorithm from the matrix of adjacency.
+    # Connection of the undirected network is the same as weak connection of
+    # the directional network.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
+    connectivity = topology.determine_connectivity(adjacency=adjacency)
     # Compile information.
     collection = {
-        "connection": connection,
-        "connection_strong": connection_strong,
-        "connection_weak": connection_weak,
-        "components_count": components_count,
-        "components_orders": components_orders,
-        "bipartite": bipartite,
+        "connection": connectivity["connection_weak"],
+        "connection_strong": connectivity["connection_strong"],
+        "connection_weak": connectivity["connection_weak"],
+        "components_count": connectivity["components_count"],
+        "components_orders": list(connectivity["components_orders"]),
+        "bipartite": connectivity["bipartite"],
     }
     return collection
 
@@ -1012,6 +1096,7 @@ def determine_network_distance(
 
 def determine_bipartite_network_centralization(
     network=None,
+    adjacency=None,
     nodes_cis=None,
     nodes_trans=None,
     method=None
@@ -1028,6 +1113,8 @@ def determine_bipartite_network_centralization(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes_cis (list<str>): identifiers of nodes in the bipartite set of
             current primary relevance
         nodes_trans (list<str>): identifiers of nodes in the bipartite set of
@@ -1055,18 +1142,19 @@ def determine_bipartite_network_centralization(
     # Formulas for centralization will be relevant to these normal
     # centralities.
     # Degree centrality.
-    degree = ntx.algorithms.bipartite.centrality.degree_centrality(
-        network, nodes_cis
+    # ntx.algorithms.bipartite.centrality.degree_centrality(network, nodes)
+    degree = topology.calculate_bipartite_degree_centrality(
+        adjacency=adjacency, nodes=nodes_cis
     )
     # Closeness centrality.
     # Centralization formulas might not account for the supplemental
     # normalization to order of node's component.
-    closeness = bipartite_closeness_centrality(
-        network, nodes_cis, normalized=True
+    closeness = topology.calculate_bipartite_closeness_centrality(
+        adjacency=adjacency, nodes=nodes_cis, normalized=True
     )
     # Betweenness centrality.
-    betweenness = ntx.algorithms.bipartite.centrality.betweenness_centrality(
-        network, nodes_cis
+    betweenness = topology.calculate_bipartite_betweenness_centrality(
+        adjacency=adjacency, nodes=nodes_cis
     )
     # Calculate centralization.
     centralization = calculate_bipartite_network_centralization(
@@ -1391,55 +1479,104 @@ def calculate_bipartite_network_centralization_separate(
 
 def calculate_bipartite_network_small_world_coefficient(
     network=None,
+    adjacency=None,
     nodes_cis=None,
-    nodes_trans=None
+    nodes_trans=None,
+    references=None,
+    tolerance=None,
+    processes=None
 ):
     """
     Calculate the small-world coefficient of a bipartite network.
 
+    Random reference networks are independent of each other, so worker
+    processes generate and analyze them in parallel. Each reference network
+    has its own seed from a constant sequence, so the references are the same
+    for any count of processes.
+
+    If tolerance is not None, the count of reference networks doubles until
+    the relative standard errors of the mean cluster coefficient and of the
+    mean path length are both below tolerance, up to 64 times the initial
+    count.
+
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
         nodes_cis (list<str>): identifiers of nodes in the bipartite set of
             current primary relevance
         nodes_trans (list<str>): identifiers of nodes in the bipartite set of
             current secondary relevance
+        references (int): count of random reference networks, or initial
+            count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        processes (int): count of parallel worker processes
 
     raises:
 
     returns:
-        (float): small-world coefficient of network
+        (dict): small-world coefficient of network with its confidence
+            interval and count of reference networks
 
     """
 
+    # Define matrix of adjacency.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
     # Calculate relevant properties of the real network.
     real = calculate_bipartite_network_small_world_properties(
         network=network,
+        adjacency=adjacency,
         nodes_cis=nodes_cis,
-        nodes_trans=nodes_trans
+        nodes_trans=nodes_trans,
+        processes=processes
     )
     # Generate and analyze random bipartite networks.
-    # Initiate random generator.
-    random.seed(a=3141593)
+    # Derive a separate seed for each random network from a constant seed.
+    sequence = numpy.random.SeedSequence(3141593)
+    if references is None:
+        references = 10
+    count = max(2, references)
+    if tolerance is None:
+        maximum = count
+    else:
+        maximum = count * 64
     reference = {
         "clusters": [],
         "paths": []
     }
-    for index in range(10):
-        # Generate random bipartite network with comparable orders of bipartite
-        # sets and size.
-        simulation = generate_random_bipartite_network(
-            order_cis=len(nodes_cis),
-            order_trans=len(nodes_trans),
-            size=network.size()
+    while True:
+        parameters = []
+        for seed in sequence.spawn(count):
+            # Generate random bipartite network with comparable orders of
+            # bipartite sets and size.
+            parameters.append({
+                "order_cis": len(nodes_cis),
+                "order_trans": len(nodes_trans),
+                "size": int(adjacency["matrix"].nnz),
+                "seed": seed
+            })
+        collection = analyze_random_bipartite_networks(
+            parameters=parameters,
+            processes=processes
         )
-        # Calculate relevant properties of the network.
-        properties = calculate_bipartite_network_small_world_properties(
-            network=simulation["network"],
-            nodes_cis=simulation["nodes_cis"],
-            nodes_trans=simulation["nodes_trans"]
+        for properties in collection:
+            reference["clusters"].append(properties["cluster"])
+            reference["paths"].append(properties["path"])
+        # Determine whether estimates of means are sufficiently precise.
+        count = len(reference["clusters"])
+        if count >= maximum:
+            break
+        error_cluster = calculate_relative_standard_error(
+            values=reference["clusters"]
         )
-        reference["clusters"].append(properties["cluster"])
-        reference["paths"].append(properties["path"])
+        error_path = calculate_relative_standard_error(
+            values=reference["paths"]
+        )
+        if max(error_cluster, error_path) <= tolerance:
+            break
+        count = min(count, (maximum - count))
     reference["cluster"] = statistics.mean(reference["clusters"])
     reference["path"] = statistics.mean(reference["paths"])
     # Calculate the small-world coefficient, sigma.
@@ -1447,28 +1584,187 @@ def calculate_bipartite_network_small_world_coefficient(
     dividend = real["cluster"] / reference["cluster"]
     divisor = real["path"] / reference["path"]
     small_world = dividend / divisor
+    # Calculate confidence interval for the small-world coefficient.
+    interval = calculate_small_world_interval(
+        small_world=small_world,
+        clusters=reference["clusters"],
+        paths=reference["paths"]
+    )
     # Compile and return information.
     return {
         "cluster": real["cluster"],
         "path": real["path"],
-        "small_world": small_world
+        "small_world": small_world,
+        "small_world_low": interval["low"],
+        "small_world_high": interval["high"],
+        "references": len(reference["clusters"])
     }
 
 
+def analyze_random_bipartite_networks(
+    parameters=None,
+    processes=None
+):
+    """
+    Generates random bipartite networks and calculates their small-world
+    properties, optionally in parallel processes.
+
+    arguments:
+        parameters (list<dict>): orders of bipartite sets, size, and seed for
+            random generator for each network
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (list<dict<float>>): properties of each network relevant to
+            small-world coefficient
+
+    """
+
+    if (processes is not None) and (processes > 1):
+        with multiprocessing.Pool(
+            processes=min(processes, len(parameters))
+        ) as pool:
+            collection = pool.map(
+                analyze_random_bipartite_network_worker, parameters
+            )
+    else:
+        collection = []
+        for record in parameters:
+            collection.append(
+                analyze_random_bipartite_network_worker(parameters=record)
+            )
+    return collection
+
+
+def calculate_relative_standard_error(values=None):
+    """
+    Calculates the standard error of the mean of values relative to the mean.
+
+    arguments:
+        values (list<float>): values
+
+    raises:
+
+    returns:
+        (float): relative standard error of mean
+
+    """
+
+    mean = statistics.mean(values)
+    if mean == 0:
+        return math.inf
+    error = statistics.stdev(values) / math.sqrt(len(values))
+    return error / abs(mean)
+
+
+def calculate_small_world_interval(
+    small_world=None,
+    clusters=None,
+    paths=None
+):
+    """
+    Calculates a confidence interval of 95% for the small-world coefficient.
+
+    The interval derives from the standard errors and covariance of the
+    reference networks' mean cluster coefficient and mean path length by
+    propagation of error on the logarithm of the coefficient.
+
+    arguments:
+        small_world (float): small-world coefficient of network
+        clusters (list<float>): cluster coefficients of reference networks
+        paths (list<float>): mean path lengths of reference networks
+
+    raises:
+
+    returns:
+        (dict<float>): lower and upper bounds of interval
+
+    """
+
+    count = len(clusters)
+    cluster = statistics.mean(clusters)
+    path = statistics.mean(paths)
+    covariance = numpy.cov(numpy.array([clusters, paths]), ddof=1) / count
+    # Sigma is proportional to path / cluster of references.
+    variance = (
+        (covariance[0, 0] / (cluster ** 2)) +
+        (covariance[1, 1] / (path ** 2)) -
+        (2 * covariance[0, 1] / (cluster * path))
+    )
+    # Quantile of the standard normal distribution for 95% confidence.
+    margin = 1.959964 * math.sqrt(max(variance, 0.0))
+    return {
+        "low": small_world * math.exp(-margin),
+        "high": small_world * math.exp(margin)
+    }
+
+
+def analyze_random_bipartite_network_worker(parameters=None):
+    """
+    Generates a random bipartite network and calculates its small-world
+    properties within a worker process.
+
+    arguments:
+        parameters (dict): orders of bipartite sets, size, and seed for random
+            generator
+
+    raises:
+
+    returns:
+        (dict<float>): properties of network relevant to small-world
+            coefficient
+
+    """
+
+    # Generate links of random bipartite network.
+    # Properties derive from the matrix of adjacency alone, so the network
+    # does not need an instance in NetworkX.
+    links = generate_random_bipartite_links(
+        order_cis=parameters["order_cis"],
+        order_trans=parameters["order_trans"],
+        size=parameters["size"],
+        generator=numpy.random.default_rng(parameters["seed"])
+    )
+    nodes_cis = []
+    for index in range(parameters["order_cis"]):
+        nodes_cis.append("cis_" + str(index))
+    nodes_trans = []
+    for index in range(parameters["order_trans"]):
+        nodes_trans.append("trans_" + str(index))
+    adjacency = topology.define_adjacency(
+        identifiers=(nodes_cis + nodes_trans),
+        sources=links["sources"],
+        targets=links["targets"]
+    )
+    # Calculate relevant properties of the network.
+    return calculate_bipartite_network_small_world_properties(
+        adjacency=adjacency,
+        nodes_cis=nodes_cis,
+        nodes_trans=nodes_trans
+    )
+
+
 def calculate_bipartite_network_small_world_properties(
     network=None,
+    adjacency=None,
     nodes_cis=None,
-    nodes_trans=None
+    nodes_trans=None,
+    processes=None
 ):
     """
     Calculate the small-world properties of a bipartite network.
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes_cis (list<str>): identifiers of nodes in the bipartite set of
             current primary relevance
         nodes_trans (list<str>): identifiers of nodes in the bipartite set of
             current secondary relevance
+        processes (int): count of parallel worker processes
 
     raises:
 
@@ -1478,15 +1774,23 @@ def calculate_bipartite_network_small_world_properties(
 
     """
 
+    # Define matrix of adjacency.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
     # Calculate network's average cluster coefficient for focal bipartite set
     # of nodes.
-    cluster_coefficient = ntx.algorithms.bipartite.cluster.average_clustering(
-        network, nodes=nodes_cis, mode="dot"
+    # ntx.algorithms.bipartite.cluster.average_clustering(mode="dot")
+    cluster_coefficient = topology.calculate_bipartite_average_clustering(
+        adjacency=adjacency, nodes=nodes_cis
     )
     # Calculate network's average length of shortest paths between pairs from
     # the focal bipartite set of nodes.
     path = calculate_mean_path_length_bipartite_network(
-        network=network, nodes_cis=nodes_cis, nodes_trans=nodes_trans
+        network=network,
+        adjacency=adjacency,
+        nodes_cis=nodes_cis,
+        nodes_trans=nodes_trans,
+        processes=processes
     )
     # Compile and return information.
     return {
@@ -1497,8 +1801,10 @@ def calculate_bipartite_network_small_world_properties(
 
 def calculate_mean_path_length_bipartite_network(
     network=None,
+    adjacency=None,
     nodes_cis=None,
-    nodes_trans=None
+    nodes_trans=None,
+    processes=None
 ):
     """
     Calculate the mean length of paths between all pairs of nodes in a single
@@ -1506,10 +1812,13 @@ def calculate_mean_path_length_bipartite_network(
 
     arguments:
         network (object): instance of network in NetworkX
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency, or None to define from network
         nodes_cis (list<str>): identifiers of nodes in the bipartite set of
             current primary relevance
         nodes_trans (list<str>): identifiers of nodes in the bipartite set of
             current secondary relevance
+        processes (int): count of parallel worker processes
 
     raises:
 
@@ -1520,22 +1829,17 @@ def calculate_mean_path_length_bipartite_network(
 
     # networkx.algorithms.shortest_paths.generic.average_shortest_path_length
 
-    # Determine lengths of shortest paths between all pairs of nodes.
-    call = ntx.algorithms.shortest_paths.unweighted
-    lengths = dict(call.all_pairs_shortest_path_length(network))
-    # Filter lengths of paths for pairs of nodes in focal bipartite set.
-    values = []
-    for source in lengths.keys():
-        if source in nodes_cis:
-            # Source belongs to focal bipartite set.
-            for target in lengths[source].keys():
-                if target in nodes_cis:
-                    # Target belongs to focal bipartite set.
-                    # Path is relevant.
-                    # Include the path's length in the collection.
-                    values.append(lengths[source][target])
+    # Determine lengths of shortest paths from each node in focal bipartite
+    # set to other nodes in the same set.
+    if adjacency is None:
+        adjacency = topology.define_network_adjacency(network=network)
+    lengths = topology.calculate_mean_path_length(
+        adjacency=adjacency,
+        nodes=nodes_cis,
+        processes=processes
+    )
     # Calculate mean of paths' lengths.
-    dividend = sum(values)
+    dividend = lengths["sum"]
     divisor = (len(nodes_cis) * (len(nodes_cis) - 1))
     # Check count of paths.
     # The theoretical maximal count of paths = (count) * (count - 1) where
@@ -1543,143 +1847,81 @@ def calculate_mean_path_length_bipartite_network(
     # The actual count of paths is likely to be less than the theoretical
     # maximum since in a directional network paths might not exist between some
     # pairs of nodes.
-    if len(values) > divisor:
+    if lengths["count"] > divisor:
         print("potential error... more paths than possible!")
     path_mean = dividend / divisor
     # Return information.
     return path_mean
 
 
-def generate_random_bipartite_network(
+def generate_random_bipartite_links(
     order_cis=None,
     order_trans=None,
-    size=None
+    size=None,
+    generator=None
 ):
     """
-    Generates a random bipartite network.
-
-    arguments:
-        order_cis (int): count of nodes in cis bipartite set
-        order_trans (int): count of nodes in trans bipartite set
-        size (int): count of links
-
-    raises:
-
-    returns:
-        (dict): information about network
-
-    """
-
-    # Generate random bipartite network with comparable orders of bipartite
-    # sets and size.
-    # ntx.algorithms.bipartite.generators.gnmk_random_graph()
-    # The generator for random bipartite network in NetworkX always creates
-    # directional links from nodes in top bipartite set to nodes in bottom
-    # bipartite set.
-    # The product networks are not random and are non-navigable between nodes of
-    # the same bipartite set.
-    network_elements = generate_random_bipartite_network_elements(
-        order_cis=order_cis,
-        order_trans=order_trans,
-        size=size
-    )
-    # Convert network elements for NetworkX.
-    nodes_networkx = []
-    for node in network_elements["nodes_cis"]:
-        node_networkx = (node["identifier"], node)
-        nodes_networkx.append(node_networkx)
-    for node in network_elements["nodes_trans"]:
-        node_networkx = (node["identifier"], node)
-        nodes_networkx.append(node_networkx)
-    links_networkx = []
-    for link in network_elements["links"]:
-        link_networkx = (link["source"], link["target"], link)
-        links_networkx.append(link_networkx)
-    # Instantiate network in NetworkX.
-    network = instantiate_networkx(
-        nodes=nodes_networkx,
-        links=links_networkx
-    )
-    # Return information.
-    return {
-        "network": network,
-        "nodes_cis": network_elements["nodes_cis_identifiers"],
-        "nodes_trans": network_elements["nodes_trans_identifiers"]
-    }
+    Generates unique random links between nodes of two bipartite sets.
 
-
-def generate_random_bipartite_network_elements(
-    order_cis=None,
-    order_trans=None,
-    size=None
-):
-    """
-    Generates elements for a random bipartite network.
+    Indices of nodes in cis bipartite set precede indices of nodes in trans
+    bipartite set. Each draw selects a source node at random from both sets
+    and a target node at random from the other set. Draws proceed in bulk, and
+    only the first occurrence of each link counts, which is equivalent to
+    drawing links one at a time and rejecting redundant links.
 
     arguments:
         order_cis (int): count of nodes in cis bipartite set
         order_trans (int): count of nodes in trans bipartite set
         size (int): count of links
+        generator (object): random generator from NumPy
 
     raises:
+        (ValueError): if size exceeds count of possible links
 
     returns:
-        (dict): information about network's elements
+        (dict<numpy.ndarray<int>>): indices of links' source and target nodes
 
     """
 
-    # Create nodes.
-    nodes_cis = []
-    nodes_cis_identifiers = []
-    for index in range(order_cis):
-        identifier = ("cis_" + str(index))
-        record = {
-            "identifier": identifier,
-            "type": "cis"
-        }
-        nodes_cis.append(record)
-        nodes_cis_identifiers.append(identifier)
-    nodes_trans = []
-    nodes_trans_identifiers = []
-    for index in range(order_trans):
-        identifier = ("trans_" + str(index))
-        record = {
-            "identifier": identifier,
-            "type": "cis"
-        }
-        nodes_trans.append(record)
-        nodes_trans_identifiers.append(identifier)
-    nodes_identifiers = nodes_cis_identifiers + nodes_trans_identifiers
-    # Create links.
-    count = 0
-    links = {}
-    while count < size:
-        # Select source node at random.
-        source = random.choice(nodes_identifiers)
-        # Determine to which bipartite set the source belongs.
-        # Select target node at random from other bipartite set.
-        if source in nodes_cis_identifiers:
-            target = random.choice(nodes_trans_identifiers)
-        elif source in nodes_trans_identifiers:
-            target = random.choice(nodes_cis_identifiers)
-        # Determine link identifier.
-        identifier = source + "_-_" + target
-        if identifier in links.keys():
-            continue
-        else:
-            links[identifier] = {
-                "identifier": identifier,
-                "source": source,
-                "target": target
-            }
-            count += 1
-    # Compile and return information.
+    # Encode each directional link as a single integer key.
+    # Keys for links from cis to trans nodes precede keys for links from trans
+    # to cis nodes.
+    forward = order_cis * order_trans
+    if size > (2 * forward):
+        raise ValueError("size exceeds count of possible links")
+    keys = numpy.zeros(0, dtype=numpy.int64)
+    while len(keys) < size:
+        draws = max(2 * (size - len(keys)), 1024)
+        # Select source nodes at random.
+        sources = generator.integers(0, (order_cis + order_trans), size=draws)
+        cis = sources < order_cis
+        # Select target nodes at random from other bipartite set.
+        targets = generator.integers(
+            0, numpy.where(cis, order_trans, order_cis)
+        )
+        keys_draws = numpy.where(
+            cis,
+            (sources * order_trans + targets),
+            (forward + (sources - order_cis) * order_cis + targets)
+        )
+        # Keep first occurrences of links in order of draws.
+        keys = numpy.concatenate((keys, keys_draws))
+        firsts = numpy.unique(keys, return_index=True)[1]
+        keys = keys[numpy.sort(firsts)][:size]
+    # Decode indices of source and target nodes.
+    cis = keys < forward
+    keys_trans = keys - forward
+    sources = numpy.where(
+        cis, (keys // max(order_trans, 1)),
+        (order_cis + keys_trans // max(order_cis, 1))
+    )
+    targets = numpy.where(
+        cis, (order_cis + keys % max(order_trans, 1)),
+        (keys_trans % max(order_cis, 1))
+    )
     return {
-        "nodes_cis": nodes_cis,
-        "nodes_cis_identifiers": nodes_cis_identifiers,
-        "nodes_trans": nodes_trans,
-        "nodes_trans_identifiers": nodes_trans_identifiers,
-        "links": list(links.values())
+        "sources": sources,
+        "targets": targets
     }
 
 
@@ -1710,10 +1952,12 @@ def query_metabolite_node(
     """
 
     print("executing query...")
-    # Convert to undirected to detect both reactant and product reactions.
-    network_undirected = network.to_undirected()
-    # Determine count of reactions.
-    reactions_nodes_neighbors = list(network_undirected.neighbors(node))
+    # Collect neighbors in both directions to detect both reactant and
+    # product reactions without conversion of the entire network.
+    # Module service answers many such queries from indices in memory.
+    reactions_nodes_neighbors = list(dict.fromkeys(
+        ntx.all_neighbors(network, node)
+    ))
     print("count of reactions: " + str(len(reactions_nodes_neighbors)))
     # Determine counts of compartments and processes.
     reactions_neighbors = dict()
@@ -1743,7 +1987,7 @@ def query_metabolite_node(
     print("count of compartments: " + str(len(compartments_unique)))
     print("count of processes: " + str(len(processes_unique)))
     # Convert reactions to a text report.
-    reactions_neighbors_records = conversion.convert_reactions_export_text(
+    reactions_neighbors_columns = conversion.convert_reactions_export_text(
         reactions=reactions_neighbors,
         metabolites=metabolites,
         compartments=compartments,
@@ -1751,7 +1995,7 @@ def query_metabolite_node(
     )
     # Compile information.
     information = {
-        "reactions_neighbors": reactions_neighbors_records
+        "reactions_neighbors": reactions_neighbors_columns
     }
     # Return information.
     return information
@@ -1770,8 +2014,8 @@ def report_metabolite_degrees(
     arguments:
         metabolites_query (list<dict<str>>): information about metabolites of
             interest
-        metabolites_nodes (dict<dict>): information about network's nodes for
-            metabolites
+        metabolites_nodes (object): structured array of information about
+            network's nodes for metabolites
 
     raises:
 
@@ -1781,20 +2025,11 @@ def report_metabolite_degrees(
     """
 
     metabolites_report = []
+    entities = metabolites_nodes["entity"]
+    degrees = metabolites_nodes["degree"]
     for record in metabolites_query:
-        record_metabolite = record["metabolite"]
-        # Collect degrees of all nodes that represent the metabolite.
-        nodes_degrees = []
-        for node in metabolites_nodes.values():
-            node_metabolite = node["entity"]
-            if (node_metabolite == record_metabolite):
-                node_degree = node["degree"]
-                nodes_degrees.append(node_degree)
-        if len(nodes_degrees) > 0:
-            # Calculate total degree of all of these nodes.
-            degree_total = sum(nodes_degrees)
-        else:
-            degree_total = 0
+        # Calculate total degree of all nodes that represent the metabolite.
+        degree_total = int(degrees[entities == record["metabolite"]].sum())
         record["degree_total"] = degree_total
         metabolites_report.append(record)
     # Return information.
@@ -1822,21 +2057,22 @@ def write_product_metabolite(directory=None, information=None):
         path, "metabolite_reactions_neighbors.txt"
     )
     # Write information to file.
-    utility.write_file_table(
-        information=information["reactions_neighbors"],
+    utility.write_file_table_columns(
+        columns=information["reactions_neighbors"],
         path_file=path_metabolite_reactions_text,
-        names=information["reactions_neighbors"][0].keys(),
         delimiter="\t"
     )
 
 
-def write_product(directory=None, information=None):
+def write_product(directory=None, information=None, path_network=None):
     """
     Writes product information to file
 
     arguments:
         directory (str): directory for product files
         information (object): information to write to file
+        path_network (str): directory of network's files, or None for the
+            network in the directory for product files
 
     raises:
 
@@ -1845,11 +2081,12 @@ def write_product(directory=None, information=None):
     """
 
     # Specify directories and files.
-    path_network = os.path.join(directory, "network")
+    if path_network is None:
+        path_network = os.path.join(directory, "network")
     path = os.path.join(path_network, "analysis")
     utility.confirm_path_directory(path)
-    path_nodes_reactions = os.path.join(path, "nodes_reactions.pickle")
-    path_nodes_metabolites = os.path.join(path, "nodes_metabolites.pickle")
+    path_nodes_reactions = os.path.join(path, "nodes_reactions.npz")
+    path_nodes_metabolites = os.path.join(path, "nodes_metabolites.npz")
     path_nodes_reactions_text = os.path.join(path, "nodes_reactions.tsv")
     path_nodes_metabolites_text = os.path.join(path, "nodes_metabolites.tsv")
     path_network_reactions = os.path.join(path, "network_reactions.tsv")
@@ -1858,22 +2095,27 @@ def write_product(directory=None, information=None):
         path, "simplification_metabolites.tsv"
     )
     # Write information to file.
-
-    with open(path_nodes_reactions, "wb") as file_product:
-        pickle.dump(information["nodes_reactions"], file_product)
-    utility.write_file_table(
-        information=list(information["nodes_reactions"].values()),
+    # Write tables of nodes in binary columnar format and in text.
+    utility.write_file_table_array(
+        table=information["nodes_reactions"],
+        path_file=path_nodes_reactions
+    )
+    utility.write_file_table_columns(
+        columns=utility.collect_table_array_columns(
+            table=information["nodes_reactions"]
+        ),
         path_file=path_nodes_reactions_text,
-        names=list(information["nodes_reactions"].values())[0].keys(),
         delimiter="\t"
     )
-
-    with open(path_nodes_metabolites, "wb") as file_product:
-        pickle.dump(information["nodes_metabolites"], file_product)
-    utility.write_file_table(
-        information=list(information["nodes_metabolites"].values()),
+    utility.write_file_table_array(
+        table=information["nodes_metabolites"],
+        path_file=path_nodes_metabolites
+    )
+    utility.write_file_table_columns(
+        columns=utility.collect_table_array_columns(
+            table=information["nodes_metabolites"]
+        ),
         path_file=path_nodes_metabolites_text,
-        names=list(information["nodes_metabolites"].values())[0].keys(),
         delimiter="\t"
     )
     utility.write_file_table(
@@ -1906,7 +2148,17 @@ def write_product(directory=None, information=None):
 # Procedure
 
 
-def execute_procedure(directory=None):
+def execute_procedure(
+    directory=None,
+    processes=None,
+    approximate=None,
+    samples=None,
+    error=None,
+    references=None,
+    tolerance=None,
+    caching=None,
+    path_network=None
+):
     """
     Function to execute module's main behavior.
 
@@ -1914,6 +2166,22 @@ def execute_procedure(directory=None):
 
     arguments:
         directory (str): path to directory for source and product files
+        processes (int): count of parallel worker processes for betweenness
+            centrality, path lengths, and random reference networks
+        approximate (bool): whether to estimate betweenness centrality from
+            samples of source nodes
+        samples (int): count of source nodes to sample for approximate
+            betweenness centrality, or None to determine count adaptively
+        error (float): maximal relative error of approximate betweenness
+            centrality for adaptive count of samples, or None for 0.05
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        caching (bool): whether to read and write expensive metrics in a cache
+            on disk with keys from the content of the network
+        path_network (str): directory of network's files, or None for the
+            network in the directory for source and product files
 
     raises:
 
@@ -1923,12 +2191,44 @@ def execute_procedure(directory=None):
     print("executing the new analysis procedure... with assortativity!!!")
 
     # Read source information from file.
-    source = read_source(directory=directory)
-    # Instantiate network in NetworkX.
-    network = instantiate_networkx(
-        nodes=source["nodes"],
-        links=source["links"]
+    if path_network is None:
+        path_network = os.path.join(directory, "network")
+    source = read_source(directory=directory, path_network=path_network)
+    # Define matrix of adjacency, preferably from compact network.
+    # Analysis needs an instance of network in NetworkX only without a
+    # compact network.
+    if source["network_compact"] is not None:
+        network = None
+        adjacency = topology.define_compact_adjacency(
+            network=source["network_compact"]
+        )
+    else:
+        network = instantiate_networkx(
+            nodes=source["nodes"],
+            links=source["links"]
+        )
+        adjacency = topology.define_network_adjacency(network=network)
+    # Attach cache of metrics with keys from content of network.
+    if caching:
+        cache.attach_cache(
+            adjacency=adjacency,
+            path=os.path.join(path_network, "cache")
+        )
+    # Determine betweenness centralities for both bipartite sets in parallel.
+    topology.determine_betweenness(
+        adjacency=adjacency,
+        approximate=approximate,
+        samples=samples,
+        tolerance=error,
+        processes=processes
     )
+    if approximate:
+        estimation = adjacency["betweenness_estimation"]
+        print(
+            "... estimated betweenness from " + str(estimation["samples"]) +
+            " samples with relative error " + str(estimation["error"]) +
+            " ..."
+        )
 
     if False:
         # Query individual metabolite.
@@ -1956,16 +2256,22 @@ def execute_procedure(directory=None):
     # Analyze entire network.
     report_network = analyze_bipartite_network(
         network=network,
+        adjacency=adjacency,
         nodes_reactions=source["nodes_reactions_identifiers"],
-        nodes_metabolites=source["nodes_metabolites_identifiers"]
+        nodes_metabolites=source["nodes_metabolites_identifiers"],
+        references=references,
+        tolerance=tolerance,
+        processes=processes
     )
     # Analyze network's individual nodes.
     report_nodes = analyze_bipartite_network_nodes(
         network=network,
+        adjacency=adjacency,
         nodes_reactions_identifiers=source["nodes_reactions_identifiers"],
         nodes_reactions=source["nodes_reactions"],
         nodes_metabolites_identifiers=source["nodes_metabolites_identifiers"],
-        nodes_metabolites=source["nodes_metabolites"]
+        nodes_metabolites=source["nodes_metabolites"],
+        processes=processes
     )
     # Prepare reports.
     # Report node degrees in metabolite simplifications.
@@ -1982,4 +2288,8 @@ def execute_procedure(directory=None):
         "simplification_metabolites": simplification_metabolites
     }
     #Write product information to file.
-    write_product(directory=directory, information=information)
+    write_product(
+        directory=directory,
+        information=information,
+        path_network=path_network
+    )
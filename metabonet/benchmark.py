@@ -0,0 +1,650 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to measure the performance of procedures
+# on the model in a directory.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import time
+import tracemalloc
+import tempfile
+import pickle
+import json
+
+# Relevant
+import networkx as ntx
+
+# Custom
+import metabonet.utility as utility
+import metabonet.candidacy as candidacy
+import metabonet.network as network
+import metabonet.conversion as conversion
+import metabonet.analysis as analysis
+import metabonet.topology as topology
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+def measure_function(function=None):
+    """
+    Measures time and peak memory of a function.
+
+    Measurement of memory traces allocations, which slows execution, so
+    measurements of time and memory are from separate executions.
+
+    arguments:
+        function (object): function without arguments
+
+    raises:
+
+    returns:
+        (dict): measurements of function, and function's value
+
+    """
+
+    # Measure time.
+    start = time.perf_counter()
+    value = function()
+    duration = time.perf_counter() - start
+    # Measure peak memory.
+    tracemalloc.start()
+    function()
+    memory_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # Compile and return information.
+    return {
+        "time": round(duration, 3),
+        "memory_peak": round((memory_peak / 1048576), 1),
+        "value": value
+    }
+
+
+def measure_candidacy(
+    source=None,
+    compartmentalization=None,
+    simplification=None
+):
+    """
+    Measures time and peak memory of evaluation of candidacy.
+
+    arguments:
+        source (dict): source information about compartments, processes,
+            reactions, and metabolites
+        compartmentalization (bool): whether compartmentalization is relevant
+        simplification (bool): whether to simplify representations of specific
+            entities in network
+
+    raises:
+
+    returns:
+        (dict): measurements of evaluation of candidacy
+
+    """
+
+    def evaluate_candidacy():
+        reference = candidacy.prepare_candidacy_reference(
+            reactions=source["reactions"],
+            filtration_compartments=source["filtration_compartments"],
+            filtration_processes=source["filtration_processes"],
+            simplification_reactions=source["simplification_reactions"],
+            simplification_metabolites=source["simplification_metabolites"]
+        )
+        return candidacy.collect_candidacy(
+            source=source,
+            reference=reference,
+            compartmentalization=compartmentalization,
+            simplification=simplification
+        )
+    measurements = measure_function(function=evaluate_candidacy)
+    information = measurements["value"]
+    # Compile and return information.
+    return {
+        "benchmark": "candidacy",
+        "compartmentalization": compartmentalization,
+        "simplification": simplification,
+        "reactions": len(source["reactions"]),
+        "reactions_candidacy": len(information["reactions"]),
+        "metabolites_candidacy": len(information["metabolites"]),
+        "time": measurements["time"],
+        "memory_peak": measurements["memory_peak"]
+    }
+
+
+def execute_benchmark_candidacy(directory=None):
+    """
+    Measures performance of evaluation of candidacy for the compartmental
+    network.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (list<dict>): measurements of evaluation of candidacy
+
+    """
+
+    source = candidacy.read_source(directory=directory)
+    records = []
+    for simplification in [True, False]:
+        record = measure_candidacy(
+            source=source,
+            compartmentalization=True,
+            simplification=simplification
+        )
+        print(record)
+        records.append(record)
+    return records
+
+
+def define_network_elements(
+    source=None,
+    compartmentalization=None,
+    simplification=None
+):
+    """
+    Defines information about network's nodes and links for benchmarks.
+
+    arguments:
+        source (dict): source information about compartments, processes,
+            reactions, and metabolites
+        compartmentalization (bool): whether compartmentalization is relevant
+        simplification (bool): whether to simplify representations of specific
+            entities in network
+
+    raises:
+
+    returns:
+        (dict<dict<dict>>): information about network's nodes and links
+
+    """
+
+    reference = candidacy.prepare_candidacy_reference(
+        reactions=source["reactions"],
+        filtration_compartments=source["filtration_compartments"],
+        filtration_processes=source["filtration_processes"],
+        simplification_reactions=source["simplification_reactions"],
+        simplification_metabolites=source["simplification_metabolites"]
+    )
+    information_candidacy = candidacy.collect_candidacy(
+        source=source,
+        reference=reference,
+        compartmentalization=compartmentalization,
+        simplification=simplification
+    )
+    return network.define_network_elements(
+        component=False,
+        reactions_candidacy=information_candidacy["reactions"],
+        metabolites_candidacy=information_candidacy["metabolites"],
+        reactions=source["reactions"],
+        metabolites=source["metabolites"],
+        compartments=source["compartments"],
+        processes=source["processes"]
+    )
+
+
+def measure_conversion(elements=None, method=None, path=None):
+    """
+    Measures time and peak memory of conversion of network's elements to
+    formats for NetworkX and CytoScape and writing to file.
+
+    Methods of conversion:
+    1. "complete": conversion of all elements before serialization
+    2. "stream": conversion and serialization of one element at a time
+    3. "stream_gzip": streaming to files in GZIP format
+
+    arguments:
+        elements (dict<dict<dict>>): information about network's nodes and
+            links
+        method (str): method of conversion
+        path (str): directory for temporary files
+
+    raises:
+
+    returns:
+        (dict): measurements of conversion
+
+    """
+
+    def convert_complete():
+        networkx = conversion.convert_networkx(
+            nodes_reactions=elements["nodes_reactions"],
+            nodes_metabolites=elements["nodes_metabolites"],
+            links=elements["links"]
+        )
+        cytoscape = conversion.convert_cytoscape(
+            nodes_reactions=elements["nodes_reactions"],
+            nodes_metabolites=elements["nodes_metabolites"],
+            links=elements["links"]
+        )
+        path_networkx = os.path.join(path, "network_networkx.pickle")
+        path_cytoscape = os.path.join(path, "network_cytoscape.json")
+        with open(path_networkx, "wb") as file_product:
+            pickle.dump(networkx, file_product)
+        with open(path_cytoscape, "w") as file_product:
+            json.dump(cytoscape, file_product)
+
+    def convert_stream():
+        networkx = conversion.convert_networkx(
+            nodes_reactions=elements["nodes_reactions"],
+            nodes_metabolites=elements["nodes_metabolites"],
+            links=elements["links"]
+        )
+        conversion.write_product(
+            directory=path,
+            information={
+                "networkx": networkx,
+                "nodes_reactions": elements["nodes_reactions"],
+                "nodes_metabolites": elements["nodes_metabolites"],
+                "links": elements["links"]
+            },
+            compression=(method == "stream_gzip")
+        )
+    if method == "complete":
+        function = convert_complete
+    else:
+        function = convert_stream
+    measurements = measure_function(function=function)
+    # Determine sizes of files.
+    size = 0
+    for root, directories, files in os.walk(path):
+        for name in files:
+            size += os.path.getsize(os.path.join(root, name))
+    # Compile and return information.
+    return {
+        "benchmark": "conversion",
+        "method": method,
+        "nodes": (
+            len(elements["nodes_reactions"]) +
+            len(elements["nodes_metabolites"])
+        ),
+        "links": len(elements["links"]),
+        "size": round((size / 1048576), 1),
+        "time": measurements["time"],
+        "memory_peak": measurements["memory_peak"]
+    }
+
+
+def execute_benchmark_conversion(directory=None):
+    """
+    Measures performance of conversion of network's elements for the
+    compartmental network with replication of hub metabolites.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (list<dict>): measurements of conversion
+
+    """
+
+    source = candidacy.read_source(directory=directory)
+    elements = define_network_elements(
+        source=source,
+        compartmentalization=True,
+        simplification=True
+    )
+    records = []
+    for method in ["complete", "stream", "stream_gzip"]:
+        with tempfile.TemporaryDirectory() as path:
+            record = measure_conversion(
+                elements=elements,
+                method=method,
+                path=path
+            )
+        print(record)
+        records.append(record)
+    return records
+
+
+def execute_benchmark_reports(directory=None):
+    """
+    Measures performance of preparation and writing of reports about
+    candidate reactions and metabolites relative to evaluation of candidacy.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (list<dict>): measurements of reports
+
+    """
+
+    source = candidacy.read_source(directory=directory)
+    records = []
+    for simplification in [True, False]:
+        record_candidacy = measure_candidacy(
+            source=source,
+            compartmentalization=True,
+            simplification=simplification
+        )
+        reference = candidacy.prepare_candidacy_reference(
+            reactions=source["reactions"],
+            filtration_compartments=source["filtration_compartments"],
+            filtration_processes=source["filtration_processes"],
+            simplification_reactions=source["simplification_reactions"],
+            simplification_metabolites=source["simplification_metabolites"]
+        )
+        information = candidacy.collect_candidacy(
+            source=source,
+            reference=reference,
+            compartmentalization=True,
+            simplification=simplification
+        )
+        with tempfile.TemporaryDirectory() as path:
+            def report():
+                utility.write_file_table_columns(
+                    columns=candidacy.convert_metabolites_text(
+                        metabolites=information["metabolites"]
+                    ),
+                    path_file=os.path.join(path, "metabolites.tsv"),
+                    delimiter="\t"
+                )
+                utility.write_file_table_columns(
+                    columns=candidacy.convert_reactions_text(
+                        reactions=information["reactions"]
+                    ),
+                    path_file=os.path.join(path, "reactions.tsv"),
+                    delimiter="\t"
+                )
+            measurements = measure_function(function=report)
+        record = {
+            "benchmark": "reports",
+            "compartmentalization": True,
+            "simplification": simplification,
+            "reactions_candidacy": len(information["reactions"]),
+            "metabolites_candidacy": len(information["metabolites"]),
+            "time": measurements["time"],
+            "memory_peak": measurements["memory_peak"],
+            "time_candidacy": record_candidacy["time"],
+            "fraction": round(
+                (measurements["time"] / max(record_candidacy["time"], 0.001)),
+                3
+            )
+        }
+        print(record)
+        records.append(record)
+    return records
+
+
+def define_worker_counts():
+    """
+    Defines counts of worker processes for benchmarks of scaling.
+
+    Counts double from one up to the count of processors, and include the
+    count of processors.
+
+    arguments:
+
+    raises:
+
+    returns:
+        (list<int>): counts of worker processes
+
+    """
+
+    maximum = os.cpu_count() or 1
+    counts = []
+    count = 1
+    while count < maximum:
+        counts.append(count)
+        count *= 2
+    counts.append(maximum)
+    return counts
+
+
+def execute_benchmark_betweenness(directory=None):
+    """
+    Measures performance of bipartite betweenness centrality in NetworkX and
+    by parallel Brandes's algorithm with increasing counts of worker
+    processes.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (list<dict>): measurements of betweenness centrality
+
+    """
+
+    path_network = os.path.join(directory, "network")
+    information = conversion.read_networkx(path=path_network)
+    network_instance = analysis.instantiate_networkx(
+        nodes=information["nodes"],
+        links=information["links"]
+    )
+    nodes = information["nodes_reactions_identifiers"]
+    # Measure only time, since traces of memory omit worker processes.
+    start = time.perf_counter()
+    reference = ntx.algorithms.bipartite.centrality.betweenness_centrality(
+        network_instance, nodes
+    )
+    duration = time.perf_counter() - start
+    record = {
+        "benchmark": "betweenness",
+        "method": "networkx",
+        "processes": 1,
+        "nodes": network_instance.order(),
+        "links": network_instance.size(),
+        "time": round(duration, 3),
+        "speedup": 1.0,
+        "difference": 0.0
+    }
+    print(record)
+    records = [record]
+    for processes in define_worker_counts():
+        start = time.perf_counter()
+        adjacency = topology.define_network_adjacency(
+            network=network_instance
+        )
+        betweenness = topology.calculate_bipartite_betweenness_centrality(
+            adjacency=adjacency,
+            nodes=nodes,
+            processes=processes
+        )
+        duration = time.perf_counter() - start
+        difference = max(
+            abs(betweenness[node] - reference[node]) for node in reference
+        )
+        record = {
+            "benchmark": "betweenness",
+            "method": "brandes",
+            "processes": processes,
+            "nodes": network_instance.order(),
+            "links": network_instance.size(),
+            "time": round(duration, 3),
+            "speedup": round((records[0]["time"] / max(duration, 0.001)), 2),
+            "difference": difference
+        }
+        print(record)
+        records.append(record)
+    return records
+
+
+def execute_benchmark_assortativity(directory=None):
+    """
+    Measures performance of degree assortativity of projections of the
+    bipartite network in NetworkX and from the matrix of adjacency without
+    definition of projections.
+
+    Projections of networks with hubs are large, so the benchmark is most
+    relevant to networks without simplification of hubs.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (list<dict>): measurements of assortativity
+
+    """
+
+    path_network = os.path.join(directory, "network")
+    information = conversion.read_networkx(path=path_network)
+    network_instance = analysis.instantiate_networkx(
+        nodes=information["nodes"],
+        links=information["links"]
+    )
+    adjacency = topology.define_network_adjacency(network=network_instance)
+    records = []
+    for set_nodes in ["reactions", "metabolites"]:
+        nodes = information["nodes_" + set_nodes + "_identifiers"]
+        def project():
+            projection = ntx.algorithms.bipartite.projection.projected_graph(
+                network_instance, nodes, multigraph=True
+            )
+            return (
+                ntx.algorithms.assortativity.degree_assortativity_coefficient(
+                    projection, x="out", y="in", weight=None, nodes=None
+                )
+            )
+        def calculate():
+            return topology.calculate_projection_degree_assortativity(
+                adjacency=adjacency, nodes=nodes
+            )
+        reference = measure_function(function=project)
+        for method, function in [("networkx", project), ("sparse", calculate)]:
+            if method == "networkx":
+                measurements = reference
+            else:
+                measurements = measure_function(function=function)
+            record = {
+                "benchmark": "assortativity",
+                "set": set_nodes,
+                "method": method,
+                "nodes": network_instance.order(),
+                "links": network_instance.size(),
+                "time": measurements["time"],
+                "memory_peak": measurements["memory_peak"],
+                "speedup": round(
+                    (reference["time"] / max(measurements["time"], 0.001)), 2
+                ),
+                "assortativity": measurements["value"],
+                "identical": (measurements["value"] == reference["value"])
+            }
+            print(record)
+            records.append(record)
+    return records
+
+
+# Names of benchmarks and functions to execute them.
+benchmarks = {
+    "candidacy": execute_benchmark_candidacy,
+    "conversion": execute_benchmark_conversion,
+    "reports": execute_benchmark_reports,
+    "betweenness": execute_benchmark_betweenness,
+    "assortativity": execute_benchmark_assortativity
+}
+
+
+def write_product(directory=None, information=None):
+    """
+    Writes product information to file
+
+    arguments:
+        directory (str): directory for product files
+        information (object): information to write to file
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    path = os.path.join(directory, "benchmark")
+    utility.confirm_path_directory(path)
+    # Write information to file.
+    for name, records in information.items():
+        path_benchmark = os.path.join(path, (name + ".tsv"))
+        utility.write_file_table(
+            information=records,
+            path_file=path_benchmark,
+            names=records[0].keys(),
+            delimiter="\t"
+        )
+
+
+###############################################################################
+# Procedure
+
+
+def execute_procedure(names=None, directory=None):
+    """
+    Function to execute module's main behavior.
+
+    The purpose of this procedure is to measure performance of procedures on
+    the model in a directory.
+
+    arguments:
+        names (list<str>): names of benchmarks to execute
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+
+    """
+
+    information = {}
+    for name in names:
+        # Report status.
+        print("... executing " + name + " benchmark ...")
+        information[name] = benchmarks[name](directory=directory)
+    #Write product information to file.
+    write_product(directory=directory, information=information)
+
+
+if (__name__ == "__main__"):
+    execute_procedure()
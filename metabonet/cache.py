@@ -0,0 +1,277 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to store expensive metrics from analysis of
+# networks on disk under keys from the content of each network, so that
+# analysis of an unchanged network reads these metrics rather than
+# calculating them again.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import pickle
+import hashlib
+import json
+import tempfile
+
+# Relevant
+import numpy
+
+# Custom
+import metabonet.utility as utility
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Version of metrics' calculations.
+# Increment version to invalidate all cached metrics after changes to
+# calculations.
+version = 1
+
+
+def define_network_key(adjacency=None):
+    """
+    Defines a key from the content of a network.
+
+    The key derives from identifiers of nodes in order of indices and from
+    links between them. Cached metrics include arrays in order of indices, so
+    the key depends on this order.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    raises:
+
+    returns:
+        (str): hexadecimal digest of network's content
+
+    """
+
+    matrix = adjacency["matrix"].tocsr()
+    matrix.sort_indices()
+    digest = hashlib.sha256()
+    for identifier in adjacency["identifiers"]:
+        digest.update(identifier.encode("utf-8"))
+        digest.update(b"\n")
+    digest.update(matrix.indptr.astype(numpy.int64).tobytes())
+    digest.update(matrix.indices.astype(numpy.int64).tobytes())
+    return digest.hexdigest()
+
+
+def define_nodes_key(nodes=None):
+    """
+    Defines a key from identifiers of a set of nodes.
+
+    arguments:
+        nodes (list<str>): identifiers of nodes
+
+    raises:
+
+    returns:
+        (str): hexadecimal digest of identifiers
+
+    """
+
+    digest = hashlib.sha256()
+    for node in sorted(nodes):
+        digest.update(node.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def attach_cache(adjacency=None, path=None):
+    """
+    Attaches a directory for cache of metrics to a matrix of adjacency.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        path (str): path to directory for cache
+
+    raises:
+
+    returns:
+
+    """
+
+    utility.confirm_path_directory(path)
+    adjacency["cache"] = {
+        "path": path,
+        "network": define_network_key(adjacency=adjacency)
+    }
+
+
+def define_key(adjacency=None, name=None, parameters=None):
+    """
+    Defines a key for a metric of a network.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, matrix of
+            adjacency, and cache
+        name (str): name of metric
+        parameters (dict): parameters of metric's calculation
+
+    raises:
+
+    returns:
+        (str): hexadecimal digest of network, metric, and parameters
+
+    """
+
+    content = json.dumps(
+        {
+            "version": version,
+            "network": adjacency["cache"]["network"],
+            "name": name,
+            "parameters": parameters
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def read_value(path=None):
+    """
+    Reads a metric from cache.
+
+    arguments:
+        path (str): path to file for metric
+
+    raises:
+
+    returns:
+        (object): value of metric, or None if cache lacks metric
+
+    """
+
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file_source:
+            return pickle.load(file_source)
+    except (EOFError, pickle.UnpicklingError):
+        return None
+
+
+def write_value(path=None, value=None):
+    """
+    Writes a metric to cache.
+
+    Writes proceed to a temporary file that then replaces the file for the
+    metric, so concurrent analyses never read incomplete files.
+
+    arguments:
+        path (str): path to file for metric
+        value (object): value of metric
+
+    raises:
+
+    returns:
+
+    """
+
+    descriptor, path_temporary = tempfile.mkstemp(
+        dir=os.path.dirname(path), suffix=".tmp"
+    )
+    with os.fdopen(descriptor, "wb") as file_product:
+        pickle.dump(value, file_product, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path_temporary, path)
+
+
+def determine_value(
+    adjacency=None,
+    name=None,
+    parameters=None,
+    function=None
+):
+    """
+    Determines a metric of a network from cache or by calculation.
+
+    If the matrix of adjacency has no cache, calculation occurs without
+    cache.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, matrix of
+            adjacency, and optional cache
+        name (str): name of metric
+        parameters (dict): parameters of metric's calculation, which must be
+            suitable for JSON
+        function (object): function without arguments to calculate metric
+
+    raises:
+
+    returns:
+        (object): value of metric
+
+    """
+
+    if "cache" not in adjacency:
+        return function()
+    key = define_key(adjacency=adjacency, name=name, parameters=parameters)
+    path = os.path.join(adjacency["cache"]["path"], (key + ".pickle"))
+    value = read_value(path=path)
+    if value is None:
+        value = function()
+        write_value(path=path, value=value)
+    return value
+
+
+def remove_cache(path=None):
+    """
+    Removes all cached metrics from a directory.
+
+    arguments:
+        path (str): path to directory for cache
+
+    raises:
+
+    returns:
+
+    """
+
+    if os.path.exists(path):
+        for name in os.listdir(path):
+            if name.endswith(".pickle") or name.endswith(".tmp"):
+                utility.remove_file(os.path.join(path, name))
+    utility.remove_empty_directory(path)
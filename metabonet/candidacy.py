@@ -41,7 +41,6 @@ License:
 # Standard
 import os
 import pickle
-import copy
 
 # Relevant
 
@@ -131,30 +130,29 @@ def read_source(directory=None):
     }
 
 
-# Candidate reactions.
+# Reference for candidacy.
 
 
-def collect_candidate_reactions(
+def prepare_candidacy_reference(
     reactions=None,
-    compartmentalization=None,
     filtration_compartments=None,
     filtration_processes=None,
-    simplification=None,
     simplification_reactions=None,
     simplification_metabolites=None
 ):
     """
-    Collects information about candidate reactions.
+    Prepares reference information for evaluation of candidacy.
+
+    This reference is independent of parameters for compartmentalization and
+    simplification, so a single reference supports multiple evaluations of
+    candidacy for the same model.
 
     arguments:
         reactions (dict<dict>): information about reactions
-        compartmentalization (bool): whether compartmentalization is relevant
         filtration_compartments (list<dict<str>>): information about whether to
             remove metabolites and reactions relevant to specific compartments
         filtration_processes (list<dict<str>>): information about whether to
             remove metabolites and reactions relevant to specific processes
-        simplification (bool): whether to simplify representations of specific
-            entities in network
         simplification_reactions (list<dict<str>>): information about whether
             to simplify representations of specific reactions
         simplification_metabolites (list<dict<str>>): information about whether
@@ -163,22 +161,245 @@ def collect_candidate_reactions(
     raises:
 
     returns:
-        (dict<dict>): information about candidate reactions
+        (dict<dict>): reference information for evaluation of candidacy
 
     """
 
-    reactions_candidacy = {}
+    # Organize filters and simplifications for access by identifier.
+    filtration_compartments_reference = organize_sets_relevance(
+        filters=filtration_compartments
+    )
+    filtration_processes_reference = organize_sets_relevance(
+        filters=filtration_processes
+    )
+    simplification_reactions_reference = organize_reactions_simplification(
+        simplification_reactions=simplification_reactions
+    )
+    simplification_metabolites_reference = (
+        organize_metabolites_simplification(
+            simplification_metabolites=simplification_metabolites
+        )
+    )
+    # Collect reactions' canonical participants.
+    participants = collect_reactions_canonical_participants(
+        reactions=reactions,
+        filtration_compartments=filtration_compartments_reference,
+        simplification_metabolites=simplification_metabolites_reference
+    )
+    # Collect reactions' replicates.
+    replicates = collect_reactions_replicates(reactions=reactions)
+    # Compile and return information.
+    return {
+        "filtration_compartments": filtration_compartments_reference,
+        "filtration_processes": filtration_processes_reference,
+        "simplification_reactions": simplification_reactions_reference,
+        "simplification_metabolites": simplification_metabolites_reference,
+        "participants": participants,
+        "replicates": replicates
+    }
+
+
+def organize_sets_relevance(filters=None):
+    """
+    Organizes information about relevance of metabolic sets by identifier.
+
+    arguments:
+        filters (list<dict<str>>): information about relevance of specific sets
+
+    raises:
+
+    returns:
+        (dict<bool>): relevance of specific sets
+
+    """
+
+    # The first record for a set has priority.
+    sets_relevance = {}
+    for record in filters:
+        relevance = record["relevance"] == "True"
+        sets_relevance.setdefault(record["identifier"], relevance)
+    return sets_relevance
+
+
+def organize_reactions_simplification(simplification_reactions=None):
+    """
+    Organizes information about simplification of reactions by identifier.
+
+    arguments:
+        simplification_reactions (list<dict<str>>): information about whether
+            to simplify representations of specific reactions
+
+    raises:
+
+    returns:
+        (dict<bool>): designations of reactions for omission
+
+    """
+
+    # The first record for a reaction has priority.
+    reactions_omission = {}
+    for record in simplification_reactions:
+        omission = record["omission"] == "True"
+        reactions_omission.setdefault(record["identifier"], omission)
+    return reactions_omission
+
+
+def organize_metabolites_simplification(simplification_metabolites=None):
+    """
+    Organizes information about simplification of metabolites by identifier.
+
+    There might be multiple records for a metabolite in different
+    compartments.
+
+    arguments:
+        simplification_metabolites (list<dict<str>>): information about whether
+            to simplify representations of specific metabolites
+
+    raises:
+
+    returns:
+        (dict<list<dict>>): designations of metabolites in compartments for
+            omission or replication
+
+    """
+
+    metabolites_simplification = {}
+    for record in simplification_metabolites:
+        designation = {
+            "compartment": record["compartment"],
+            "omission": record["omission"] == "True",
+            "replication": record["replication"] == "True"
+        }
+        designations = metabolites_simplification.setdefault(
+            record["metabolite"], []
+        )
+        designations.append(designation)
+    return metabolites_simplification
+
+
+def collect_reactions_canonical_participants(
+    reactions=None,
+    filtration_compartments=None,
+    simplification_metabolites=None
+):
+    """
+    Collects information about reactions' canonical participants.
+
+    A canonical participant includes the relevance of the participant's
+    compartment and the participant's designations for simplification.
+    Designations for simplification only apply if simplification is relevant.
+
+    arguments:
+        reactions (dict<dict>): information about reactions
+        filtration_compartments (dict<bool>): relevance of specific
+            compartments
+        simplification_metabolites (dict<list<dict>>): designations of
+            metabolites in compartments for omission or replication
+
+    raises:
+
+    returns:
+        (dict<list<dict>>): information about reactions' canonical participants
+
+    """
+
+    reactions_participants = {}
+    for reaction in reactions.values():
+        participants = []
+        for participant in reaction["participants"]:
+            relevance = determine_set_relevance(
+                identifier=participant["compartment"],
+                filters=filtration_compartments
+            )
+            simplification_match = determine_metabolite_simplification(
+                metabolite_identifier=participant["metabolite"],
+                compartment_identifier=participant["compartment"],
+                simplification=True,
+                simplification_metabolites=simplification_metabolites
+            )
+            record = {
+                "participant": participant,
+                "relevance": relevance,
+                "omission": simplification_match["omission"],
+                "replication": simplification_match["replication"]
+            }
+            participants.append(record)
+        reactions_participants[reaction["identifier"]] = participants
+    return reactions_participants
+
+
+def collect_reactions_replicates(reactions=None):
+    """
+    Collects identifiers of each reaction's other replicate reactions.
+
+    arguments:
+        reactions (dict<dict>): information about reactions
+
+    raises:
+
+    returns:
+        (dict<list<str>>): identifiers of each reaction's replicates
+
+    """
+
+    reactions_replicates = {}
     for reaction in reactions.values():
+        identifier = reaction["identifier"]
+        replicates = []
+        for replicate in reaction["replicates"]:
+            if replicate != identifier:
+                replicates.append(replicate)
+        reactions_replicates[identifier] = replicates
+    return reactions_replicates
+
+
+# Candidate reactions.
+
+
+def collect_candidate_reactions(
+    identifiers=None,
+    reactions=None,
+    reactions_candidacy=None,
+    reference=None,
+    reactions_signatures=None,
+    signatures_families=None
+):
+    """
+    Collects information about candidate reactions.
+
+    Candidacy of a redundant reaction depends on the candidacy of its
+    replicates, so the order of reactions determines which replicate is a
+    candidate.
+
+    arguments:
+        identifiers (list<str>): identifiers of reactions to evaluate in order
+        reactions (dict<dict>): information about reactions
+        reactions_candidacy (dict<dict>): information about candidate reactions
+            from previous evaluation
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+        reactions_signatures (dict<dict>): information about reactions'
+            relevance and signatures of participation
+        signatures_families (dict<set<str>>): identifiers of relevant reactions
+            with each signature of participation
+
+    raises:
+
+    returns:
+        (dict<dict>): information about candidate reactions
+
+    """
+
+    # Collect candidate reactions.
+    reactions_candidacy = dict(reactions_candidacy)
+    for identifier in identifiers:
         candidacy, record = collect_candidate_reaction(
-            reaction_identifier= reaction["identifier"],
+            reaction_identifier=identifier,
             reactions=reactions,
             reactions_candidacy=reactions_candidacy,
-            compartmentalization=compartmentalization,
-            filtration_compartments=filtration_compartments,
-            filtration_processes=filtration_processes,
-            simplification=simplification,
-            simplification_reactions=simplification_reactions,
-            simplification_metabolites=simplification_metabolites
+            reference=reference,
+            reactions_signatures=reactions_signatures,
+            signatures_families=signatures_families
         )
         if candidacy:
             reactions_candidacy[record["identifier"]] = record
@@ -188,12 +409,9 @@ def collect_candidate_reaction(
     reaction_identifier=None,
     reactions=None,
     reactions_candidacy=None,
-    compartmentalization=None,
-    filtration_compartments=None,
-    filtration_processes=None,
-    simplification=None,
-    simplification_reactions=None,
-    simplification_metabolites=None
+    reference=None,
+    reactions_signatures=None,
+    signatures_families=None
 ):
     """
     Collects information about a candidate reaction.
@@ -202,17 +420,12 @@ def collect_candidate_reaction(
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
         reactions_candidacy (dict<dict>): information about candidate reactions
-        compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
-        filtration_processes (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific processes
-        simplification (bool): whether to simplify representations of specific
-            entities in network
-        simplification_reactions (list<dict<str>>): information about whether
-            to simplify representations of specific reactions
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+        reactions_signatures (dict<dict>): information about reactions'
+            relevance and signatures of participation
+        signatures_families (dict<set<str>>): identifiers of relevant reactions
+            with each signature of participation
 
     raises:
 
@@ -227,12 +440,9 @@ def collect_candidate_reaction(
         reaction_identifier= reaction_identifier,
         reactions=reactions,
         reactions_candidacy=reactions_candidacy,
-        compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        filtration_processes=filtration_processes,
-        simplification=simplification,
-        simplification_reactions=simplification_reactions,
-        simplification_metabolites=simplification_metabolites
+        reference=reference,
+        reactions_signatures=reactions_signatures,
+        signatures_families=signatures_families
     )
     # Return information.
     return candidacy
@@ -241,12 +451,9 @@ def determine_reaction_candidacy(
     reaction_identifier=None,
     reactions=None,
     reactions_candidacy=None,
-    compartmentalization=None,
-    filtration_compartments=None,
-    filtration_processes=None,
-    simplification=None,
-    simplification_reactions=None,
-    simplification_metabolites=None
+    reference=None,
+    reactions_signatures=None,
+    signatures_families=None
 ):
     """
     Determines whether a reaction is a candidate for representation in a
@@ -256,17 +463,12 @@ def determine_reaction_candidacy(
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
         reactions_candidacy (dict<dict>): information about candidate reactions
-        compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
-        filtration_processes (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific processes
-        simplification (bool): whether to simplify representations of specific
-            entities in network
-        simplification_reactions (list<dict<str>>): information about whether
-            to simplify representations of specific reactions
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+        reactions_signatures (dict<dict>): information about reactions'
+            relevance and signatures of participation
+        signatures_families (dict<set<str>>): identifiers of relevant reactions
+            with each signature of participation
 
     raises:
 
@@ -277,27 +479,14 @@ def determine_reaction_candidacy(
     """
 
     # Relevance.
-    relevance = determine_reaction_relevance(
-        reaction_identifier=reaction_identifier,
-        reactions=reactions,
-        compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        filtration_processes=filtration_processes,
-        simplification=simplification,
-        simplification_reactions=simplification_reactions,
-        simplification_metabolites=simplification_metabolites
-    )
+    relevance = reactions_signatures[reaction_identifier]["relevance"]
     # Redundancy.
     redundancy = determine_reaction_redundancy(
         reaction_identifier= reaction_identifier,
-        reactions=reactions,
         reactions_candidacy=reactions_candidacy,
-        compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        filtration_processes=filtration_processes,
-        simplification=simplification,
-        simplification_reactions=simplification_reactions,
-        simplification_metabolites=simplification_metabolites
+        reference=reference,
+        reactions_signatures=reactions_signatures,
+        signatures_families=signatures_families
     )
     # Determine whether reaction is a candidate.
     candidacy = relevance and not redundancy[0]
@@ -315,12 +504,9 @@ def determine_reaction_candidacy(
 def determine_reaction_relevance(
     reaction_identifier=None,
     reactions=None,
+    reference=None,
     compartmentalization=None,
-    filtration_compartments=None,
-    filtration_processes=None,
-    simplification=None,
-    simplification_reactions=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
     Determines whether a reaction is relevant.
@@ -341,17 +527,11 @@ def determine_reaction_relevance(
     arguments:
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
-        filtration_processes (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific processes
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_reactions (list<dict<str>>): information about whether
-            to simplify representations of specific reactions
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -364,22 +544,21 @@ def determine_reaction_relevance(
     simplification_match = determine_reaction_simplification(
         reaction_identifier=reaction_identifier,
         simplification=simplification,
-        simplification_reactions=simplification_reactions
+        simplification_reactions=reference["simplification_reactions"]
     )
     # Process.
     process = determine_reaction_process_relevance(
         reaction_identifier=reaction_identifier,
         reactions=reactions,
-        filtration_processes=filtration_processes
+        filtration_processes=reference["filtration_processes"]
     )
     # Behavior.
     behavior = determine_reaction_behavior_relevance(
         reaction_identifier=reaction_identifier,
         reactions=reactions,
+        reference=reference,
         compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
+        simplification=simplification
     )
     # Determine whether reaction is relevant.
     relevance = (not simplification_match) and process and behavior
@@ -397,8 +576,8 @@ def determine_reaction_simplification(
         reaction_identifier (str): identifier of a reaction
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_reactions (list<dict<str>>): information about whether
-            to simplify representations of specific reactions
+        simplification_reactions (dict<bool>): designations of reactions for
+            omission
 
     raises:
 
@@ -407,18 +586,9 @@ def determine_reaction_simplification(
 
     """
 
-    def match_reaction_simplification(record):
-        return record["identifier"] == reaction_identifier
     # Determine whether to consider simplifications.
     if simplification:
-        match = utility.find(
-            match=match_reaction_simplification,
-            sequence=simplification_reactions
-        )
-        if match is not None:
-            omission = match["omission"] == "True"
-        else:
-            omission = False
+        omission = simplification_reactions.get(reaction_identifier, False)
     else:
         omission = False
     return omission
@@ -435,8 +605,7 @@ def determine_reaction_process_relevance(
     arguments:
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
-        filtration_processes (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific processes
+        filtration_processes (dict<bool>): relevance of specific processes
 
     raises:
 
@@ -464,7 +633,7 @@ def determine_set_relevance(identifier=None, filters=None):
 
     arguments:
         identifier (str): identifier of a set
-        filters (list<dict<str>>): information about relevance of specific sets
+        filters (dict<bool>): relevance of specific sets
 
     raises:
 
@@ -473,28 +642,17 @@ def determine_set_relevance(identifier=None, filters=None):
 
     """
 
-    def match(record):
-        return record["identifier"] == identifier
-    record = utility.find(
-        match=match,
-        sequence=filters
-    )
-    if record is not None:
-        relevance = record["relevance"] == "True"
-        return relevance
-    else:
-        # If a set does not have a record in filters, then assume that it is
-        # relevant.
-        return True
+    # If a set does not have a record in filters, then assume that it is
+    # relevant.
+    return filters.get(identifier, True)
 
 
 def determine_reaction_behavior_relevance(
     reaction_identifier=None,
     reactions=None,
+    reference=None,
     compartmentalization=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
     Determines whether a reaction's behavior is relevant.
@@ -512,13 +670,11 @@ def determine_reaction_behavior_relevance(
     arguments:
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -535,10 +691,8 @@ def determine_reaction_behavior_relevance(
         # product participant that are chemically distinct.
         participation = determine_reaction_conversion_participation(
             reaction_identifier=reaction_identifier,
-            reactions=reactions,
-            filtration_compartments=filtration_compartments,
-            simplification=simplification,
-            simplification_metabolites=simplification_metabolites
+            reference=reference,
+            simplification=simplification
         )
     elif reaction["transport"]:
         # Reaction does not involve chemical conversion.
@@ -551,9 +705,8 @@ def determine_reaction_behavior_relevance(
             participation = determine_reaction_transport_participation(
                 reaction_identifier=reaction_identifier,
                 reactions=reactions,
-                filtration_compartments=filtration_compartments,
-                simplification=simplification,
-                simplification_metabolites=simplification_metabolites
+                reference=reference,
+                simplification=simplification
             )
         else:
             participation = False
@@ -562,10 +715,8 @@ def determine_reaction_behavior_relevance(
 
 def determine_reaction_conversion_participation(
     reaction_identifier=None,
-    reactions=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    reference=None,
+    simplification=None
 ):
     """
     Determines whether a reaction involves relevant participation for
@@ -573,13 +724,10 @@ def determine_reaction_conversion_participation(
 
     arguments:
         reaction_identifier (str): identifier of a reaction
-        reactions (dict<dict>): information about reactions
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -591,10 +739,8 @@ def determine_reaction_conversion_participation(
     # Determine relevant participants.
     participants = determine_reaction_relevant_participants(
         reaction_identifier=reaction_identifier,
-        reactions=reactions,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
+        reference=reference,
+        simplification=simplification
     )
     # Determine whether any reactant participants and product participants are
     # relevant.
@@ -614,9 +760,8 @@ def determine_reaction_conversion_participation(
 def determine_reaction_transport_participation(
     reaction_identifier=None,
     reactions=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    reference=None,
+    simplification=None
 ):
     """
     Determines whether a reaction involves relevant participation for transport
@@ -625,12 +770,10 @@ def determine_reaction_transport_participation(
     arguments:
         reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -642,10 +785,8 @@ def determine_reaction_transport_participation(
     # Determine relevant participants.
     participants = determine_reaction_relevant_participants(
         reaction_identifier=reaction_identifier,
-        reactions=reactions,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
+        reference=reference,
+        simplification=simplification
     )
     # Determine whether any reactant participants and product participants
     # match transport.
@@ -686,10 +827,8 @@ def determine_reaction_transport_participation(
 
 def determine_reaction_relevant_participants(
     reaction_identifier=None,
-    reactions=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    reference=None,
+    simplification=None
 ):
     """
     Determines a reaction's relevant participants.
@@ -703,13 +842,10 @@ def determine_reaction_relevant_participants(
 
     arguments:
         reaction_identifier (str): identifier of a reaction
-        reactions (dict<dict>): information about reactions
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -718,32 +854,20 @@ def determine_reaction_relevant_participants(
 
     """
 
-    reaction = reactions[reaction_identifier]
-    participants_original = reaction["participants"]
+    participants_canonical = reference["participants"][reaction_identifier]
     # Collect relevant participants.
     participants_novel = []
-    for participant in participants_original:
-        # Determine relevance of participant's compartment.
-        compartment = participant["compartment"]
-        compartment_relevance = determine_set_relevance(
-            identifier=compartment,
-            filters=filtration_compartments
-        )
+    for record in participants_canonical:
         # Determine relevance of participant's metabolite.
-        metabolite = participant["metabolite"]
-        simplification_match = determine_metabolite_simplification(
-            metabolite_identifier=metabolite,
-            compartment_identifier=compartment,
-            simplification=simplification,
-            simplification_metabolites=simplification_metabolites
-        )
-        metabolite_relevance = (
-            (not simplification_match["omission"]) and
-            (not simplification_match["replication"])
-        )
+        if simplification:
+            metabolite_relevance = (
+                (not record["omission"]) and (not record["replication"])
+            )
+        else:
+            metabolite_relevance = True
         # Determine whether participant is relevant.
-        if metabolite_relevance and compartment_relevance:
-            participants_novel.append(participant)
+        if metabolite_relevance and record["relevance"]:
+            participants_novel.append(record["participant"])
     return participants_novel
 
 
@@ -763,8 +887,8 @@ def determine_metabolite_simplification(
         compartment_identifier (str): identifier of a compartment
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
+        simplification_metabolites (dict<list<dict>>): designations of
+            metabolites in compartments for omission or replication
 
     raises:
 
@@ -774,8 +898,6 @@ def determine_metabolite_simplification(
 
     """
 
-    def match_metabolite(record):
-        return record["metabolite"] == metabolite_identifier
     def match_compartment(record):
         return (
             (record["compartment"] == "all") or
@@ -784,33 +906,22 @@ def determine_metabolite_simplification(
     # Determine whether to consider simplifications.
     if simplification:
         # There might be multiple records for a metabolite.
-        simplifications_metabolite = utility.find_all(
-            match=match_metabolite,
-            sequence=simplification_metabolites
+        simplifications_metabolite = simplification_metabolites.get(
+            metabolite_identifier, []
         )
-        if simplifications_metabolite is not None:
-            # Determine whether any of metabolite's simplifications match the
-            # compartment.
-            # There should be a single record for a metabolite in a specific
-            # compartment.
-            simplification_compartment = utility.find(
-                match=match_compartment,
-                sequence=simplifications_metabolite
-            )
-            if simplification_compartment is not None:
-                omission = simplification_compartment["omission"] == "True"
-                replication = (
-                    simplification_compartment["replication"] == "True"
-                )
-                record = {
-                    "omission": omission,
-                    "replication": replication
-                }
-            else:
-                record = {
-                    "omission": False,
-                    "replication": False
-                }
+        # Determine whether any of metabolite's simplifications match the
+        # compartment.
+        # There should be a single record for a metabolite in a specific
+        # compartment.
+        simplification_compartment = utility.find(
+            match=match_compartment,
+            sequence=simplifications_metabolite
+        )
+        if simplification_compartment is not None:
+            record = {
+                "omission": simplification_compartment["omission"],
+                "replication": simplification_compartment["replication"]
+            }
         else:
             record = {
                 "omission": False,
@@ -824,279 +935,221 @@ def determine_metabolite_simplification(
     return record
 
 
-def determine_reaction_redundancy(
-    reaction_identifier=None,
+def collect_reactions_signatures(
     reactions=None,
-    reactions_candidacy=None,
+    reference=None,
     compartmentalization=None,
-    filtration_compartments=None,
-    filtration_processes=None,
-    simplification=None,
-    simplification_reactions=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
-    Determines whether a reaction is redundant.
-
-    A reaction is redundant if its participants are identical to those of
-    another relevant reaction.
-    The relevance of compartmentalization determines whether compartments
-    influence this comparison of participants.
+    Collects information about reactions' relevance and signatures of
+    participation.
 
     arguments:
-        reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
-        reactions_candidacy (dict<dict>): information about candidate reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
-        filtration_processes (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific processes
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_reactions (list<dict<str>>): information about whether
-            to simplify representations of specific reactions
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
     returns:
-        (tuple<bool, list<str>>): whether reaction is redundant, and relevant
-            redundant replicate reactions
+        (dict<dict>): information about reactions' relevance and signatures of
+            participation
 
     """
 
-    reaction = reactions[reaction_identifier]
-    replicates = reaction["replicates"]
-    # Determine relevant replicates.
-    # Assume that all replicates correspond to records in reactions.
-    def match_relevance(replicate):
-        identity = (replicate == reaction_identifier)
+    reactions_signatures = {}
+    for reaction in reactions.values():
         relevance = determine_reaction_relevance(
-            reaction_identifier=replicate,
+            reaction_identifier=reaction["identifier"],
             reactions=reactions,
+            reference=reference,
             compartmentalization=compartmentalization,
-            filtration_compartments=filtration_compartments,
-            filtration_processes=filtration_processes,
-            simplification=simplification,
-            simplification_reactions=simplification_reactions,
-            simplification_metabolites=simplification_metabolites
+            simplification=simplification
         )
-        return (not identity) and relevance
-    replicates_relevant = list(filter(match_relevance, replicates))
-    # Determine redundant replicates.
-    def match_redundancy(replicate):
-        redundancy = determine_replicate_reactions_redundancy(
-            reaction_one_identifier=reaction_identifier,
-            reaction_two_identifier=replicate,
+        signature = determine_reaction_signature(
+            reaction_identifier=reaction["identifier"],
             reactions=reactions,
+            reference=reference,
             compartmentalization=compartmentalization,
-            filtration_compartments=filtration_compartments,
-            simplification=simplification,
-            simplification_metabolites=simplification_metabolites
+            simplification=simplification
         )
-        return redundancy
-    replicates_redundant = list(filter(match_redundancy, replicates_relevant))
-    # Determine whether reaction is priority replicate.
-    priority = determine_redundant_reaction_priority(
-        reaction_identifier=reaction_identifier,
-        reactions_replicates=replicates_redundant,
-        reactions=reactions,
-        reactions_candidacy=reactions_candidacy
-    )
-    redundancy = not priority
-    return (redundancy, replicates_redundant)
+        record = {
+            "identifier": reaction["identifier"],
+            "relevance": relevance,
+            "signature": signature
+        }
+        reactions_signatures[record["identifier"]] = record
+    return reactions_signatures
 
 
-def determine_replicate_reactions_redundancy(
-    reaction_one_identifier=None,
-    reaction_two_identifier=None,
-    reactions=None,
-    compartmentalization=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
-):
+def collect_signatures_families(reactions_signatures=None):
     """
-    Determines whether two replicate reactions are redundant.
+    Collects relevant reactions with identical signatures of participation.
+
+    Relevant reactions with identical signatures are redundant if they are also
+    replicates.
 
     arguments:
-        reaction_one_identifier (str): identifier of a reaction
-        reaction_two_identifier (str): identifier of a reaction
-        reactions (dict<dict>): information about reactions
-        compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
-        simplification (bool): whether to simplify representations of specific
-            entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
+        reactions_signatures (dict<dict>): information about reactions'
+            relevance and signatures of participation
 
     raises:
 
     returns:
-        (bool): whether reactions are redundant
+        (dict<set<str>>): identifiers of relevant reactions with each signature
+            of participation
 
     """
 
-    reaction_one = reactions[reaction_one_identifier]
-    reaction_two = reactions[reaction_two_identifier]
-    # Determine whether reactions have redundant reversibility.
-    reversibility = (
-        reaction_one["reversibility"] == reaction_two["reversibility"]
-    )
-    # Determine whether reactions have redundant participants.
-    # Determine relevant participants.
-    participation = determine_reactions_participation_redundancy(
-        reaction_one_identifier=reaction_one_identifier,
-        reaction_two_identifier=reaction_two_identifier,
-        reactions=reactions,
-        compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
-    )
-    # Determine whether reactions are redundant.
-    return reversibility and participation
+    signatures_families = {}
+    for record in reactions_signatures.values():
+        if record["relevance"]:
+            family = signatures_families.setdefault(record["signature"], set())
+            family.add(record["identifier"])
+    return signatures_families
 
 
-def determine_reactions_participation_redundancy(
-    reaction_one_identifier=None,
-    reaction_two_identifier=None,
+def determine_reaction_signature(
+    reaction_identifier=None,
     reactions=None,
+    reference=None,
     compartmentalization=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
-    Determines whether two replicate reactions have redundant participation.
+    Determines a reaction's signature of participation.
+
+    Redundant reactions have identical reversibility and identical relevant
+    participants.
+    The relevance of compartmentalization determines whether compartments
+    influence the signature of participants.
 
     arguments:
-        reaction_one_identifier (str): identifier of a reaction
-        reaction_two_identifier (str): identifier of a reaction
+        reaction_identifier (str): identifier of a reaction
         reactions (dict<dict>): information about reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
     returns:
-        (bool): whether reactions' participants are redundant
+        (tuple<bool, frozenset<tuple<str>>>): reaction's reversibility and
+            signature of relevant participants
 
     """
 
     # Determine relevant participants.
-    participants_one = determine_reaction_relevant_participants(
-        reaction_identifier=reaction_one_identifier,
-        reactions=reactions,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
-    )
-    participants_two = determine_reaction_relevant_participants(
-        reaction_identifier=reaction_two_identifier,
-        reactions=reactions,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
+    participants = determine_reaction_relevant_participants(
+        reaction_identifier=reaction_identifier,
+        reference=reference,
+        simplification=simplification
     )
-    # Determine whether participants are redundant.
+    # Determine signature of participants.
     if compartmentalization:
-        redundancy = determine_participants_attributes_mutual_redundancy(
-            participants_one=participants_one,
-            participants_two=participants_two,
-            attributes=["metabolite", "role", "compartment"]
-        )
+        attributes = ["metabolite", "role", "compartment"]
     else:
-        redundancy = determine_participants_attributes_mutual_redundancy(
-            participants_one=participants_one,
-            participants_two=participants_two,
-            attributes=["metabolite", "role"]
-        )
-    return redundancy
+        attributes = ["metabolite", "role"]
+    signature = determine_participants_attributes_signature(
+        participants=participants,
+        attributes=attributes
+    )
+    reversibility = reactions[reaction_identifier]["reversibility"]
+    return (reversibility, signature)
 
 
-def determine_participants_attributes_mutual_redundancy(
-    participants_one=None,
-    participants_two=None,
+def determine_participants_attributes_signature(
+    participants=None,
     attributes=None
 ):
     """
-    Determines whether participants of two reactions are redundant.
+    Determines a canonical signature of a reaction's participants.
+
+    Participants of two reactions are redundant if every participant of each
+    reaction matches attributes of any participant of the other reaction.
+    This mutual inclusion is equivalent to equality of the sets of
+    participants' attributes.
 
     arguments:
-        participants_one (str): participants of a reaction
-        participants_two (str): participants of a reaction
+        participants (list<dict<str>>): participants of a reaction
         attributes (list<str>): names of attributes by which to compare
             participants
 
     raises:
 
     returns:
-        (bool): whether reactions' participants are redundant
+        (frozenset<tuple<str>>): signature of participants
 
     """
 
-    comparison_one = determine_participants_attributes_redundancy(
-        participants_one=participants_one,
-        participants_two=participants_two,
-        attributes=attributes
-    )
-    comparison_two = determine_participants_attributes_redundancy(
-        participants_one=participants_two,
-        participants_two=participants_one,
-        attributes=attributes
+    return frozenset(
+        tuple(participant[attribute] for attribute in attributes)
+        for participant in participants
     )
-    return comparison_one and comparison_two
 
 
-def determine_participants_attributes_redundancy(
-    participants_one=None,
-    participants_two=None,
-    attributes=None
+def determine_reaction_redundancy(
+    reaction_identifier=None,
+    reactions_candidacy=None,
+    reference=None,
+    reactions_signatures=None,
+    signatures_families=None
 ):
     """
-    Determines whether participants of two reactions are redundant.
+    Determines whether a reaction is redundant.
+
+    A reaction is redundant if its participants are identical to those of
+    another relevant reaction.
+    The relevance of compartmentalization determines whether compartments
+    influence this comparison of participants.
 
     arguments:
-        participants_one (str): participants of a reaction
-        participants_two (str): participants of a reaction
-        attributes (list<str>): names of attributes by which to compare
-            participants
+        reaction_identifier (str): identifier of a reaction
+        reactions_candidacy (dict<dict>): information about candidate reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+        reactions_signatures (dict<dict>): information about reactions'
+            relevance and signatures of participation
+        signatures_families (dict<set<str>>): identifiers of relevant reactions
+            with each signature of participation
 
     raises:
 
     returns:
-        (bool): whether reactions' participants are redundant
+        (tuple<bool, list<str>>): whether reaction is redundant, and relevant
+            redundant replicate reactions
 
     """
 
-    iteration_one = []
-    for participant_one in participants_one:
-        iteration_two = []
-        for participant_two in participants_two:
-            iteration_three = []
-            for attribute in attributes:
-                match = (
-                    participant_one[attribute] == participant_two[attribute]
-                )
-                iteration_three.append(match)
-            iteration_two.append(all(iteration_three))
-        iteration_one.append(any(iteration_two))
-    return all(iteration_one)
+    replicates = reference["replicates"][reaction_identifier]
+    # Determine relevant, redundant replicates.
+    # Relevant reactions with identical signatures of participation are
+    # redundant.
+    signature = reactions_signatures[reaction_identifier]["signature"]
+    family = signatures_families.get(signature, set())
+    replicates_redundant = []
+    for replicate in replicates:
+        if replicate in family:
+            replicates_redundant.append(replicate)
+    # Determine whether reaction is priority replicate.
+    priority = determine_redundant_reaction_priority(
+        reaction_identifier=reaction_identifier,
+        reactions_replicates=replicates_redundant,
+        reactions_candidacy=reactions_candidacy
+    )
+    redundancy = not priority
+    return (redundancy, replicates_redundant)
 
 
 def determine_redundant_reaction_priority(
     reaction_identifier=None,
     reactions_replicates=None,
-    reactions=None,
     reactions_candidacy=None,
 ):
     """
@@ -1109,7 +1162,6 @@ def determine_redundant_reaction_priority(
         reaction_identifier (str): identifier of a reaction
         reactions_replicates (list<str>): identifiers of relevant, redundant
             reactions
-        reactions (dict<dict>): information about reactions
         reactions_candidacy (dict<dict>): information about candidate reactions
 
     raises:
@@ -1142,11 +1194,10 @@ def collect_candidate_reactions_metabolites(
     metabolites=None,
     reactions=None,
     reactions_candidacy=None,
+    reference=None,
     compartmentalization=None,
     compartments=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
     Collects information about candidate metabolites.
@@ -1155,62 +1206,87 @@ def collect_candidate_reactions_metabolites(
         metabolites (dict<dict>): information about metabolites
         reactions (dict<dict>): information about reactions
         reactions_candidacy (dict<dict>): information about candidate reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
         compartments (dict<dict>): information about compartments
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
     returns:
-        (dict<dict>): information about candidate reactions and candidate
-            metabolites
+        (dict<dict>): information about candidate reactions and each candidate
+            reaction's candidate metabolites
 
     """
 
     reactions_candidacy_metabolites = {}
-    metabolites_candidacy = {}
+    reactions_metabolites = {}
     for reaction_candidacy in reactions_candidacy.values():
         candidates = collect_candidate_reaction_metabolites(
             reaction_candidacy_identifier=reaction_candidacy["identifier"],
             reactions=reactions,
             reactions_candidacy=reactions_candidacy,
             metabolites=metabolites,
+            reference=reference,
             compartmentalization=compartmentalization,
             compartments=compartments,
-            filtration_compartments=filtration_compartments,
-            simplification=simplification,
-            simplification_metabolites=simplification_metabolites
+            simplification=simplification
         )
-        # Collect candidate reaction.
+        # Collect candidate reaction and its candidate metabolites.
         reactions_candidacy_metabolites[reaction_candidacy["identifier"]] = (
             candidates["reaction"]
         )
-        # Determine whether candidate metabolites are novel.
-        for metabolite in candidates["metabolites"]:
-            if metabolite["identifier"] not in metabolites_candidacy.keys():
-                metabolites_candidacy[metabolite["identifier"]] = metabolite
+        reactions_metabolites[reaction_candidacy["identifier"]] = (
+            candidates["metabolites"]
+        )
     # Compile and return information.
     return {
         "reactions": reactions_candidacy_metabolites,
-        "metabolites": metabolites_candidacy
+        "reactions_metabolites": reactions_metabolites
     }
 
 
+def collect_reactions_candidate_metabolites(
+    reactions_candidacy=None,
+    reactions_metabolites=None
+):
+    """
+    Collects information about candidate metabolites from candidate reactions.
+
+    The first record for a candidate metabolite has priority.
+
+    arguments:
+        reactions_candidacy (dict<dict>): information about candidate reactions
+        reactions_metabolites (dict<list<dict>>): information about each
+            candidate reaction's candidate metabolites
+
+    raises:
+
+    returns:
+        (dict<dict>): information about candidate metabolites
+
+    """
+
+    metabolites_candidacy = {}
+    for identifier in reactions_candidacy:
+        # Determine whether candidate metabolites are novel.
+        for metabolite in reactions_metabolites[identifier]:
+            if metabolite["identifier"] not in metabolites_candidacy:
+                metabolites_candidacy[metabolite["identifier"]] = metabolite
+    return metabolites_candidacy
+
+
 def collect_candidate_reaction_metabolites(
     reaction_candidacy_identifier=None,
     metabolites=None,
     reactions=None,
     reactions_candidacy=None,
+    reference=None,
     compartmentalization=None,
     compartments=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
     Collects information about a candidate reaction's candidate metabolites.
@@ -1220,14 +1296,12 @@ def collect_candidate_reaction_metabolites(
         metabolites (dict<dict>): information about metabolites
         reactions (dict<dict>): information about reactions
         reactions_candidacy (dict<dict>): information about candidate reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
         compartmentalization (bool): whether compartmentalization is relevant
         compartments (dict<dict>): information about compartments
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -1238,19 +1312,18 @@ def collect_candidate_reaction_metabolites(
     """
 
     # Access information.
-    reaction_candidacy = copy.deepcopy(
+    # Novel record for candidate reaction shares values with the original
+    # record, which remains unchanged.
+    reaction_candidacy = dict(
         reactions_candidacy[reaction_candidacy_identifier]
     )
-    reaction = reactions[reaction_candidacy["reaction"]]
-    participants = reaction["participants"]
+    participants = reference["participants"][reaction_candidacy["reaction"]]
     # Determine candidate participants.
     participants_candidacy = determine_reaction_candidate_participants(
         reaction_candidacy_identifier=reaction_candidacy_identifier,
-        participants_original=participants,
+        participants_canonical=participants,
         compartmentalization=compartmentalization,
-        filtration_compartments=filtration_compartments,
-        simplification=simplification,
-        simplification_metabolites=simplification_metabolites
+        simplification=simplification
     )
     # Include information about candidate participants in information about
     # candidate reaction.
@@ -1285,11 +1358,9 @@ def collect_candidate_reaction_metabolites(
 
 def determine_reaction_candidate_participants(
     reaction_candidacy_identifier=None,
-    participants_original=None,
+    participants_canonical=None,
     compartmentalization=None,
-    filtration_compartments=None,
-    simplification=None,
-    simplification_metabolites=None
+    simplification=None
 ):
     """
     Determines a reaction's candidate participants.
@@ -1297,17 +1368,16 @@ def determine_reaction_candidate_participants(
     Candidate participants include metabolites with designations for
     simplification by replication.
 
+    Records for candidate participants are novel so that information about
+    participants in the model remains unchanged.
+
     arguments:
         reaction_candidacy_identifier (str): identifier of a candidate reaction
-        participants_original (list<dict<str>>): information about metabolites
-            and compartments that participate in a reaction
+        participants_canonical (list<dict>): information about a reaction's
+            canonical participants
         compartmentalization (bool): whether compartmentalization is relevant
-        filtration_compartments (list<dict<str>>): information about whether to
-            remove metabolites and reactions relevant to specific compartments
         simplification (bool): whether to simplify representations of specific
             entities in network
-        simplification_metabolites (list<dict<str>>): information about whether
-            to simplify representations of specific metabolites
 
     raises:
 
@@ -1318,36 +1388,33 @@ def determine_reaction_candidate_participants(
 
     # Collect candidate participants.
     participants_novel = []
-    for participant in participants_original:
-        # Determine relevance of participant's compartment.
-        compartment = participant["compartment"]
-        compartment_relevance = determine_set_relevance(
-            identifier=compartment,
-            filters=filtration_compartments
-        )
+    for record in participants_canonical:
+        participant = record["participant"]
         # Determine candidacy of participant's metabolite.
-        metabolite = participant["metabolite"]
-        simplification_match = determine_metabolite_simplification(
-            metabolite_identifier=metabolite,
-            compartment_identifier=compartment,
-            simplification=simplification,
-            simplification_metabolites=simplification_metabolites
-        )
-        participant["replication"] = simplification_match["replication"]
-        # Designate identifier for candidate metabolites for participant.
-        metabolite_candidacy = determine_candidate_metabolite_identifier(
-            compartmentalization=compartmentalization,
-            replication=simplification_match["replication"],
-            metabolite_identifier=metabolite,
-            compartment_identifier=compartment,
-            reaction_candidacy_identifier=reaction_candidacy_identifier
-        )
-        participant["metabolite_candidacy"] = metabolite_candidacy
+        if simplification:
+            omission = record["omission"]
+            replication = record["replication"]
+        else:
+            omission = False
+            replication = False
         # Determine whether participant is a candidate.
         # Metabolites with designation for simplification by replication are
         # still candidates.
-        if compartment_relevance and not simplification_match["omission"]:
-            participants_novel.append(participant)
+        if record["relevance"] and not omission:
+            # Designate identifier for candidate metabolites for participant.
+            metabolite_candidacy = determine_candidate_metabolite_identifier(
+                compartmentalization=compartmentalization,
+                replication=replication,
+                metabolite_identifier=participant["metabolite"],
+                compartment_identifier=participant["compartment"],
+                reaction_candidacy_identifier=reaction_candidacy_identifier
+            )
+            participant_candidacy = dict(participant)
+            participant_candidacy["replication"] = replication
+            participant_candidacy["metabolite_candidacy"] = (
+                metabolite_candidacy
+            )
+            participants_novel.append(participant_candidacy)
     return participants_novel
 
 
@@ -1515,20 +1582,18 @@ def collect_candidate_metabolites_reactions(
 
     # Collect references to candidate reactions in which each candidate
     # metabolite participates.
-    metabolites_reactions = utility.collect_records_targets_by_categories(
-        target="identifier",
-        category="metabolites_candidacy",
-        records=list(reactions_candidacy.values())
-    )
+    # Keys of dictionaries preserve order of unique candidate reactions.
+    metabolites_reactions = {}
+    for reaction_candidacy in reactions_candidacy.values():
+        for metabolite in reaction_candidacy["metabolites_candidacy"]:
+            reactions = metabolites_reactions.setdefault(metabolite, {})
+            reactions[reaction_candidacy["identifier"]] = True
     metabolites_candidacy_reactions = {}
     for metabolite, reactions in metabolites_reactions.items():
-        metabolite_candidacy = copy.deepcopy(
-            metabolites_candidacy[metabolite]
-        )
-        # Collect unique candidate reaction.
-        reactions_candidacy_unique = utility.collect_unique_elements(
-            reactions
-        )
+        # Novel record for candidate metabolite shares values with the
+        # original record, which remains unchanged.
+        metabolite_candidacy = dict(metabolites_candidacy[metabolite])
+        reactions_candidacy_unique = list(reactions.keys())
         metabolite_candidacy["reactions_candidacy"] = (
             reactions_candidacy_unique
         )
@@ -1548,33 +1613,35 @@ def convert_reactions_text(reactions=None):
         reactions (dict<dict>): information about reactions
 
     returns:
-        (list<dict>): information about reactions
+        (dict<list>): information about reactions in columns
 
     raises:
 
     """
 
-    records = []
-    for reaction in reactions.values():
-        # Compile information.
-        record = {
-            "identifier": reaction["identifier"],
-            "reaction": reaction["reaction"],
-            "name": reaction["name"],
-            "replicates": ";".join(reaction["replicates"]),
-            "metabolites_candidacy": ";".join(
-                reaction["metabolites_candidacy"]
-            ),
-            "metabolites_candidacy_count": (
-                reaction["metabolites_candidacy_count"]
-            )
-        }
-        records.append(record)
-    records.sort(
-        key=lambda record: record["metabolites_candidacy_count"],
+    records = list(reactions.values())
+    # Compile information.
+    columns = {}
+    for key in ["identifier", "reaction", "name"]:
+        columns[key] = utility.collect_value_from_records(
+            key=key, records=records
+        )
+    columns["replicates"] = [
+        ";".join(reaction["replicates"]) for reaction in records
+    ]
+    columns["metabolites_candidacy"] = [
+        ";".join(reaction["metabolites_candidacy"]) for reaction in records
+    ]
+    columns["metabolites_candidacy_count"] = (
+        utility.collect_value_from_records(
+            key="metabolites_candidacy_count", records=records
+        )
+    )
+    return utility.sort_table_columns(
+        columns=columns,
+        key="metabolites_candidacy_count",
         reverse=True
     )
-    return records
 
 
 def convert_metabolites_text(metabolites=None):
@@ -1585,32 +1652,497 @@ def convert_metabolites_text(metabolites=None):
         metabolites (dict<dict>): information about metabolites
 
     returns:
-        (list<dict>): information about metabolites
+        (dict<list>): information about metabolites in columns
 
     raises:
 
     """
 
-    records = []
-    for metabolite in metabolites.values():
-        record = {
-            "identifier": metabolite["identifier"],
-            "name": metabolite["name"],
-            "metabolite": metabolite["metabolite"],
-            "compartment": metabolite["compartment"],
-            "reactions_candidacy": ";".join(
-                metabolite["reactions_candidacy"]
-            ),
-            "reactions_candidacy_count": (
-                metabolite["reactions_candidacy_count"]
-            )
-        }
-        records.append(record)
-    records.sort(
-        key=lambda record: record["reactions_candidacy_count"],
+    records = list(metabolites.values())
+    columns = {}
+    for key in ["identifier", "name", "metabolite", "compartment"]:
+        columns[key] = utility.collect_value_from_records(
+            key=key, records=records
+        )
+    columns["reactions_candidacy"] = [
+        ";".join(metabolite["reactions_candidacy"]) for metabolite in records
+    ]
+    columns["reactions_candidacy_count"] = utility.collect_value_from_records(
+        key="reactions_candidacy_count", records=records
+    )
+    return utility.sort_table_columns(
+        columns=columns,
+        key="reactions_candidacy_count",
         reverse=True
     )
-    return records
+
+
+def collect_candidacy(
+    source=None,
+    reference=None,
+    compartmentalization=None,
+    simplification=None
+):
+    """
+    Collects information about candidate reactions and metabolites.
+
+    arguments:
+        source (dict): source information about compartments, processes,
+            reactions, and metabolites
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+        compartmentalization (bool): whether compartmentalization is relevant
+        simplification (bool): whether to simplify representations of specific
+            entities in network
+
+    raises:
+
+    returns:
+        (dict): information about candidate reactions and metabolites
+
+    """
+
+    # Determine relevance and signature of participation for all reactions.
+    reactions_signatures = collect_reactions_signatures(
+        reactions=source["reactions"],
+        reference=reference,
+        compartmentalization=compartmentalization,
+        simplification=simplification
+    )
+    # Group relevant reactions with identical signatures in families.
+    signatures_families = collect_signatures_families(
+        reactions_signatures=reactions_signatures
+    )
+    # Collect candidate reactions.
+    reactions_candidacy = collect_candidate_reactions(
+        identifiers=list(source["reactions"].keys()),
+        reactions=source["reactions"],
+        reactions_candidacy={},
+        reference=reference,
+        reactions_signatures=reactions_signatures,
+        signatures_families=signatures_families
+    )
+    # Collect candidate metabolites.
+    # Include references to candidate metabolites with information about
+    # candidate reactions.
+    reactions_metabolites_candidacy = collect_candidate_reactions_metabolites(
+        metabolites=source["metabolites"],
+        reactions=source["reactions"],
+        reactions_candidacy=reactions_candidacy,
+        reference=reference,
+        compartmentalization=compartmentalization,
+        compartments=source["compartments"],
+        simplification=simplification
+    )
+    information = compile_candidacy(
+        reactions_candidacy=reactions_metabolites_candidacy["reactions"],
+        reactions_metabolites=(
+            reactions_metabolites_candidacy["reactions_metabolites"]
+        )
+    )
+    # Include information for incremental evaluation of candidacy.
+    information["signatures"] = reactions_signatures
+    information["families"] = signatures_families
+    return information
+
+
+def compile_candidacy(
+    reactions_candidacy=None,
+    reactions_metabolites=None
+):
+    """
+    Compiles information about candidate reactions and metabolites.
+
+    arguments:
+        reactions_candidacy (dict<dict>): information about candidate reactions
+        reactions_metabolites (dict<list<dict>>): information about each
+            candidate reaction's candidate metabolites
+
+    raises:
+
+    returns:
+        (dict): information about candidate reactions and metabolites
+
+    """
+
+    # Collect candidate metabolites.
+    metabolites_candidacy = collect_reactions_candidate_metabolites(
+        reactions_candidacy=reactions_candidacy,
+        reactions_metabolites=reactions_metabolites
+    )
+    # Include references to candidate reactions with information about
+    # candidate metabolites.
+    metabolites_candidacy_reactions = collect_candidate_metabolites_reactions(
+        reactions_candidacy=reactions_candidacy,
+        metabolites_candidacy=metabolites_candidacy,
+    )
+    # Prepare reports of information for review.
+    metabolites_report = convert_metabolites_text(
+        metabolites=metabolites_candidacy_reactions
+    )
+    reactions_report = convert_reactions_text(
+        reactions=reactions_candidacy
+    )
+    # Compile and return information.
+    return {
+        "metabolites": metabolites_candidacy_reactions,
+        "reactions": reactions_candidacy,
+        "reactions_metabolites": reactions_metabolites,
+        "metabolites_report": metabolites_report,
+        "reactions_report": reactions_report,
+    }
+
+
+# Incremental candidacy.
+
+
+def read_source_incrementation(directory=None):
+    """
+    Reads information from previous evaluation of candidacy from file.
+
+    arguments:
+        directory (str): directory of source files
+
+    raises:
+
+    returns:
+        (dict): information from previous evaluation of candidacy, or None if
+            there is no previous evaluation
+
+    """
+
+    # Specify directories and files.
+    path = os.path.join(directory, "candidacy")
+    path_incrementation = os.path.join(path, "incrementation.pickle")
+    # Read information from file.
+    if not os.path.exists(path_incrementation):
+        return None
+    with open(path_incrementation, "rb") as file_source:
+        incrementation = pickle.load(file_source)
+    return incrementation
+
+
+def determine_model_signature(directory=None):
+    """
+    Determines a signature of the model's files.
+
+    A change to any of the model's files invalidates information from previous
+    evaluation of candidacy.
+
+    arguments:
+        directory (str): directory of source files
+
+    raises:
+
+    returns:
+        (dict<tuple<int>>): sizes and times of modification of model's files
+
+    """
+
+    path = os.path.join(directory, "model")
+    signature = {}
+    for name in ["compartments", "processes", "reactions", "metabolites"]:
+        status = os.stat(os.path.join(path, (name + ".pickle")))
+        signature[name] = (status.st_size, status.st_mtime_ns)
+    return signature
+
+
+def collect_reactions_sets_index(reactions=None, reference=None):
+    """
+    Collects identifiers of reactions that involve each metabolite,
+    compartment, and process, and each reaction's replicates.
+
+    The index of replicates is symmetric, so that a reaction is in the index of
+    each of its replicates.
+
+    arguments:
+        reactions (dict<dict>): information about reactions
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+
+    raises:
+
+    returns:
+        (dict<dict<set<str>>>): identifiers of reactions by metabolites,
+            compartments, processes, and replicates
+
+    """
+
+    index = {
+        "metabolites": {},
+        "compartments": {},
+        "processes": {},
+        "replicates": {}
+    }
+    for reaction in reactions.values():
+        identifier = reaction["identifier"]
+        for participant in reaction["participants"]:
+            index["metabolites"].setdefault(
+                participant["metabolite"], set()
+            ).add(identifier)
+            index["compartments"].setdefault(
+                participant["compartment"], set()
+            ).add(identifier)
+        for process in reaction["processes"]:
+            index["processes"].setdefault(process, set()).add(identifier)
+        for replicate in reference["replicates"][identifier]:
+            index["replicates"].setdefault(identifier, set()).add(replicate)
+            index["replicates"].setdefault(replicate, set()).add(identifier)
+    return index
+
+
+def determine_dictionary_differences(previous=None, novel=None):
+    """
+    Determines keys with different values between two dictionaries.
+
+    arguments:
+        previous (dict): previous information
+        novel (dict): novel information
+
+    raises:
+
+    returns:
+        (set<str>): keys with different values
+
+    """
+
+    differences = set()
+    for key in set(previous.keys()).union(novel.keys()):
+        if previous.get(key) != novel.get(key):
+            differences.add(key)
+    return differences
+
+
+def collect_reactions_affected(
+    reference_previous=None,
+    reference_novel=None,
+    index=None
+):
+    """
+    Collects identifiers of reactions that involve changes to filters or
+    simplifications.
+
+    Candidacy of a redundant reaction depends on the candidacy of its
+    replicates, so reactions affected include all replicates of reactions that
+    involve changes.
+
+    arguments:
+        reference_previous (dict<dict>): reference information from previous
+            evaluation of candidacy
+        reference_novel (dict<dict>): reference information for current
+            evaluation of candidacy
+        index (dict<dict<set<str>>>): identifiers of reactions by metabolites,
+            compartments, processes, and replicates
+
+    raises:
+
+    returns:
+        (set<str>): identifiers of reactions affected
+
+    """
+
+    # Determine which filters and simplifications differ.
+    categories = {
+        "filtration_compartments": "compartments",
+        "filtration_processes": "processes",
+        "simplification_metabolites": "metabolites"
+    }
+    reactions_affected = determine_dictionary_differences(
+        previous=reference_previous["simplification_reactions"],
+        novel=reference_novel["simplification_reactions"]
+    )
+    for key, category in categories.items():
+        differences = determine_dictionary_differences(
+            previous=reference_previous[key],
+            novel=reference_novel[key]
+        )
+        for identifier in differences:
+            reactions_affected.update(index[category].get(identifier, set()))
+    # Include all replicates of affected reactions.
+    queue = list(reactions_affected)
+    while len(queue) > 0:
+        identifier = queue.pop()
+        for replicate in index["replicates"].get(identifier, set()):
+            if replicate not in reactions_affected:
+                reactions_affected.add(replicate)
+                queue.append(replicate)
+    return reactions_affected
+
+
+def collect_candidacy_incrementally(
+    source=None,
+    incrementation=None,
+    compartmentalization=None,
+    simplification=None
+):
+    """
+    Collects information about candidate reactions and metabolites from
+    previous evaluation of candidacy.
+
+    This procedure evaluates only those reactions that involve metabolites,
+    compartments, processes, or reactions with changes to filters or
+    simplifications, along with all of these reactions' replicates.
+
+    arguments:
+        source (dict): source information about compartments, processes,
+            reactions, and metabolites
+        incrementation (dict): information from previous evaluation of
+            candidacy
+        compartmentalization (bool): whether compartmentalization is relevant
+        simplification (bool): whether to simplify representations of specific
+            entities in network
+
+    raises:
+
+    returns:
+        (dict): information about candidate reactions and metabolites, and
+            reference information for evaluation of candidacy
+
+    """
+
+    reactions = source["reactions"]
+    reference_previous = incrementation["reference"]
+    # Organize filters and simplifications for access by identifier.
+    reference = {
+        "filtration_compartments": organize_sets_relevance(
+            filters=source["filtration_compartments"]
+        ),
+        "filtration_processes": organize_sets_relevance(
+            filters=source["filtration_processes"]
+        ),
+        "simplification_reactions": organize_reactions_simplification(
+            simplification_reactions=source["simplification_reactions"]
+        ),
+        "simplification_metabolites": organize_metabolites_simplification(
+            simplification_metabolites=source["simplification_metabolites"]
+        ),
+        "replicates": reference_previous["replicates"]
+    }
+    # Determine reactions affected by changes.
+    reactions_affected = collect_reactions_affected(
+        reference_previous=reference_previous,
+        reference_novel=reference,
+        index=incrementation["index"]
+    )
+    identifiers = []
+    for identifier in reactions.keys():
+        if identifier in reactions_affected:
+            identifiers.append(identifier)
+    reactions_subset = {}
+    for identifier in identifiers:
+        reactions_subset[identifier] = reactions[identifier]
+    # Update affected reactions' canonical participants.
+    participants = dict(reference_previous["participants"])
+    participants.update(collect_reactions_canonical_participants(
+        reactions=reactions_subset,
+        filtration_compartments=reference["filtration_compartments"],
+        simplification_metabolites=reference["simplification_metabolites"]
+    ))
+    reference["participants"] = participants
+    # Update affected reactions' relevance and signatures of participation.
+    reactions_signatures = dict(incrementation["signatures"])
+    signatures_families = {}
+    for signature, family in incrementation["families"].items():
+        family_novel = family.difference(reactions_affected)
+        if len(family_novel) > 0:
+            signatures_families[signature] = family_novel
+    reactions_signatures_affected = collect_reactions_signatures(
+        reactions=reactions_subset,
+        reference=reference,
+        compartmentalization=compartmentalization,
+        simplification=simplification
+    )
+    reactions_signatures.update(reactions_signatures_affected)
+    for record in reactions_signatures_affected.values():
+        if record["relevance"]:
+            family = signatures_families.setdefault(record["signature"], set())
+            family.add(record["identifier"])
+    # Collect affected candidate reactions.
+    # Candidacy of affected reactions is independent of unaffected reactions.
+    reactions_candidacy_affected = collect_candidate_reactions(
+        identifiers=identifiers,
+        reactions=reactions,
+        reactions_candidacy={},
+        reference=reference,
+        reactions_signatures=reactions_signatures,
+        signatures_families=signatures_families
+    )
+    reactions_metabolites_candidacy = collect_candidate_reactions_metabolites(
+        metabolites=source["metabolites"],
+        reactions=reactions,
+        reactions_candidacy=reactions_candidacy_affected,
+        reference=reference,
+        compartmentalization=compartmentalization,
+        compartments=source["compartments"],
+        simplification=simplification
+    )
+    # Combine affected and unaffected candidate reactions in original order.
+    reactions_candidacy = {}
+    reactions_metabolites = {}
+    for identifier in reactions.keys():
+        if identifier in reactions_affected:
+            candidates = reactions_metabolites_candidacy
+        else:
+            candidates = incrementation
+        if identifier in candidates["reactions"]:
+            reactions_candidacy[identifier] = (
+                candidates["reactions"][identifier]
+            )
+            reactions_metabolites[identifier] = (
+                candidates["reactions_metabolites"][identifier]
+            )
+    information = compile_candidacy(
+        reactions_candidacy=reactions_candidacy,
+        reactions_metabolites=reactions_metabolites
+    )
+    information["signatures"] = reactions_signatures
+    information["families"] = signatures_families
+    print(
+        "... evaluated candidacy of " + str(len(reactions_affected)) +
+        " of " + str(len(reactions)) + " reactions ..."
+    )
+    # Compile and return information.
+    return {
+        "candidacy": information,
+        "reference": reference
+    }
+
+
+def verify_candidacy_incrementation(
+    information_incrementation=None,
+    information_rebuild=None
+):
+    """
+    Verifies that incremental evaluation of candidacy matches complete
+    evaluation of candidacy.
+
+    arguments:
+        information_incrementation (dict): information about candidate
+            reactions and metabolites from incremental evaluation
+        information_rebuild (dict): information about candidate reactions and
+            metabolites from complete evaluation
+
+    raises:
+
+    returns:
+        (bool): whether incremental evaluation matches complete evaluation
+
+    """
+
+    keys = [
+        "reactions", "metabolites", "reactions_report", "metabolites_report"
+    ]
+    match = True
+    for key in keys:
+        if information_incrementation[key] != information_rebuild[key]:
+            print(
+                "Error! ... Incremental candidacy differs from complete " +
+                "candidacy in " + key + "!"
+            )
+            match = False
+    if match:
+        print("... incremental candidacy matches complete candidacy ...")
+    return match
 
 
 def write_product(directory=None, information=None):
@@ -1639,20 +2171,41 @@ def write_product(directory=None, information=None):
         pickle.dump(information["reactions"], file_product)
     with open(path_metabolites, "wb") as file_product:
         pickle.dump(information["metabolites"], file_product)
-    utility.write_file_table(
-        information=information["metabolites_report"],
+    utility.write_file_table_columns(
+        columns=information["metabolites_report"],
         path_file=path_metabolites_report,
-        names=information["metabolites_report"][0].keys(),
         delimiter="\t"
     )
-    utility.write_file_table(
-        information=information["reactions_report"],
+    utility.write_file_table_columns(
+        columns=information["reactions_report"],
         path_file=path_reactions_report,
-        names=information["reactions_report"][0].keys(),
         delimiter="\t"
     )
 
 
+def write_product_incrementation(directory=None, information=None):
+    """
+    Writes information for incremental evaluation of candidacy to file
+
+    arguments:
+        directory (str): directory for product files
+        information (object): information to write to file
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    path = os.path.join(directory, "candidacy")
+    utility.confirm_path_directory(path)
+    path_incrementation = os.path.join(path, "incrementation.pickle")
+    # Write information to file.
+    with open(path_incrementation, "wb") as file_product:
+        pickle.dump(information, file_product)
+
+
 ###############################################################################
 # Procedure
 
@@ -1660,6 +2213,8 @@ def write_product(directory=None, information=None):
 def execute_procedure(
     compartmentalization=None,
     simplification=None,
+    incrementation=None,
+    verification=None,
     directory=None
 ):
     """
@@ -1668,13 +2223,22 @@ def execute_procedure(
     The purpose of this procedure is to evaluate the candidacy of metabolites
     and reactions for representation in a network.
 
+    Incremental evaluation of candidacy uses information from the previous
+    evaluation to evaluate only those reactions that changes to filters or
+    simplifications affect.
+
     arguments:
         compartmentalization (bool): whether compartmentalization is relevant
         simplification (bool): whether to simplify representations of specific
             entities in network
+        incrementation (bool): whether to evaluate candidacy incrementally from
+            previous evaluation
+        verification (bool): whether to verify incremental evaluation against
+            complete evaluation
         directory (str): path to directory for source and product files
 
     raises:
+        (ValueError): incremental evaluation differs from complete evaluation
 
     returns:
 
@@ -1682,48 +2246,101 @@ def execute_procedure(
 
     # Read source information from file.
     source = read_source(directory=directory)
-    # Collect candidate reactions.
-    reactions_candidacy = collect_candidate_reactions(
-        reactions=source["reactions"],
-        compartmentalization=compartmentalization,
-        filtration_compartments=source["filtration_compartments"],
-        filtration_processes=source["filtration_processes"],
-        simplification=simplification,
-        simplification_reactions=source["simplification_reactions"],
-        simplification_metabolites=source["simplification_metabolites"]
-    )
-    # Collect candidate metabolites.
-    # Include references to candidate metabolites with information about
-    # candidate reactions.
-    reactions_metabolites_candidacy = collect_candidate_reactions_metabolites(
-        metabolites=source["metabolites"],
-        reactions=source["reactions"],
-        reactions_candidacy=reactions_candidacy,
-        compartmentalization=compartmentalization,
-        compartments=source["compartments"],
-        filtration_compartments=source["filtration_compartments"],
-        simplification=simplification,
-        simplification_metabolites=source["simplification_metabolites"]
-    )
-    # Include references to candidate reactions with information about
-    # candidate metabolites.
-    metabolites_candidacy = collect_candidate_metabolites_reactions(
-        reactions_candidacy=reactions_metabolites_candidacy["reactions"],
-        metabolites_candidacy=reactions_metabolites_candidacy["metabolites"],
-    )
-    # Prepare reports of information for review.
-    metabolites_report = convert_metabolites_text(
-        metabolites=metabolites_candidacy
-    )
-    reactions_report = convert_reactions_text(
-        reactions=reactions_metabolites_candidacy["reactions"]
-    )
-    # Compile information.
-    information = {
-        "metabolites": metabolites_candidacy,
-        "reactions": reactions_metabolites_candidacy["reactions"],
-        "metabolites_report": metabolites_report,
-        "reactions_report": reactions_report,
-    }
+    if incrementation:
+        previous = read_source_incrementation(directory=directory)
+        model = determine_model_signature(directory=directory)
+        parameters = {
+            "compartmentalization": compartmentalization,
+            "simplification": simplification
+        }
+        # Determine whether information from previous evaluation is valid.
+        validity = (
+            (previous is not None) and
+            (previous["parameters"] == parameters) and
+            (previous["model"] == model)
+        )
+    else:
+        validity = False
+    if validity:
+        # Evaluate candidacy of affected reactions and metabolites.
+        collection = collect_candidacy_incrementally(
+            source=source,
+            incrementation=previous,
+            compartmentalization=compartmentalization,
+            simplification=simplification
+        )
+        reference = collection["reference"]
+        information = collection["candidacy"]
+        index = previous["index"]
+    else:
+        # Prepare reference information for evaluation of candidacy.
+        reference = prepare_candidacy_reference(
+            reactions=source["reactions"],
+            filtration_compartments=source["filtration_compartments"],
+            filtration_processes=source["filtration_processes"],
+            simplification_reactions=source["simplification_reactions"],
+            simplification_metabolites=source["simplification_metabolites"]
+        )
+        # Evaluate candidacy of reactions and metabolites.
+        information = collect_candidacy(
+            source=source,
+            reference=reference,
+            compartmentalization=compartmentalization,
+            simplification=simplification
+        )
+        if incrementation:
+            index = collect_reactions_sets_index(
+                reactions=source["reactions"],
+                reference=reference
+            )
+    if validity and verification:
+        # Evaluate candidacy completely for comparison.
+        reference_rebuild = prepare_candidacy_reference(
+            reactions=source["reactions"],
+            filtration_compartments=source["filtration_compartments"],
+            filtration_processes=source["filtration_processes"],
+            simplification_reactions=source["simplification_reactions"],
+            simplification_metabolites=source["simplification_metabolites"]
+        )
+        information_rebuild = collect_candidacy(
+            source=source,
+            reference=reference_rebuild,
+            compartmentalization=compartmentalization,
+            simplification=simplification
+        )
+        match = verify_candidacy_incrementation(
+            information_incrementation=information,
+            information_rebuild=information_rebuild
+        )
+        if not match:
+            # Remove information from previous evaluation so that the next
+            # incremental evaluation is complete, and write no products.
+            utility.remove_file(os.path.join(
+                directory, "candidacy", "incrementation.pickle"
+            ))
+            raise ValueError(
+                "incremental candidacy differs from complete candidacy; " +
+                "products are unchanged, and the next incremental " +
+                "evaluation will be complete"
+            )
+    elif verification:
+        print(
+            "... skipped verification, as no valid information from a " +
+            "previous incremental evaluation exists ..."
+        )
     #Write product information to file.
     write_product(directory=directory, information=information)
+    if incrementation:
+        write_product_incrementation(
+            directory=directory,
+            information={
+                "parameters": parameters,
+                "model": model,
+                "reference": reference,
+                "index": index,
+                "signatures": information["signatures"],
+                "families": information["families"],
+                "reactions": information["reactions"],
+                "reactions_metabolites": information["reactions_metabolites"]
+            }
+        )
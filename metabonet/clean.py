@@ -45,6 +45,8 @@ import os
 
 # Custom
 import metabonet.utility as utility
+import metabonet.compact as compact
+import metabonet.cache as cache
 
 #dir()
 #importlib.reload()
@@ -86,11 +88,21 @@ def execute_procedure(directory=None):
     utility.remove_file(os.path.join(path_candidacy, "reactions.pickle"))
     utility.remove_file(os.path.join(path_candidacy, "reactions.tsv"))
     utility.remove_file(os.path.join(path_candidacy, "metabolites.tsv"))
+    utility.remove_file(os.path.join(
+        path_candidacy, "incrementation.pickle"
+    ))
     utility.remove_empty_directory(path_candidacy)
     # Network.
     utility.remove_file(os.path.join(path_network, "links.pickle"))
     utility.remove_file(os.path.join(path_network, "nodes_metabolites.pickle"))
     utility.remove_file(os.path.join(path_network, "nodes_reactions.pickle"))
+    utility.remove_file(os.path.join(path_network, "network_compact.pickle"))
+    path_store = os.path.join(path_network, "store")
+    for name in compact.arrays:
+        utility.remove_file(os.path.join(path_store, (name + ".npy")))
+    utility.remove_empty_directory(path_store)
+    cache.remove_cache(path=os.path.join(path_network, "cache"))
+    utility.remove_file(os.path.join(path_network, "query.socket"))
     utility.remove_empty_directory(path_network)
     # Conversion.
     utility.remove_file(os.path.join(
@@ -108,9 +120,8 @@ def execute_procedure(directory=None):
     utility.remove_file(os.path.join(path_measurement, "metabolites.tsv"))
     utility.remove_empty_directory(path_measurement)
     # Analysis.
-    utility.remove_file(os.path.join(
-        path_analysis, "nodes_metabolites.pickle"
-    ))
+    utility.remove_file(os.path.join(path_analysis, "nodes_reactions.npz"))
+    utility.remove_file(os.path.join(path_analysis, "nodes_metabolites.npz"))
     utility.remove_file(os.path.join(path_analysis, "nodes_reactions.tsv"))
     utility.remove_file(os.path.join(path_analysis, "nodes_metabolites.tsv"))
     utility.remove_file(os.path.join(path_analysis, "network_reactions.tsv"))
@@ -118,6 +129,7 @@ def execute_procedure(directory=None):
     utility.remove_file(os.path.join(
         path_analysis, "simplification_metabolites.tsv"
     ))
+    utility.remove_file(os.path.join(path_analysis, "concurrence.tsv"))
     utility.remove_empty_directory(path_analysis)
     # Plot.
     utility.remove_file(os.path.join(path_plot, "measurements_one.svg"))
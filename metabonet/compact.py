@@ -0,0 +1,420 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to represent a bipartite network compactly
+# with integer identifiers of nodes and arrays of adjacency.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import pickle
+
+# Relevant
+import numpy
+
+# Custom
+import metabonet.utility as utility
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Codes for types of nodes and roles of links.
+types = {"reaction": 0, "metabolite": 1}
+roles = {"reactant": 0, "product": 1}
+# Names of arrays in compact representation of network.
+arrays = [
+    "identifiers",
+    "types",
+    "replications",
+    "out_pointers",
+    "out_neighbors",
+    "in_pointers",
+    "in_neighbors",
+    "in_links",
+    "links_roles",
+    "links_replications"
+]
+
+
+class CompactBipartiteNetwork(object):
+    """
+    Compact representation of a bipartite network.
+
+    Integer identifiers of nodes are indices in the table of identifiers.
+    Nodes for reactions precede nodes for metabolites.
+    Adjacency of out-links and in-links is in compressed sparse row format.
+    Attributes of links follow the order of out-links, and indices of in-links
+    refer to positions of out-links.
+
+    attributes:
+        identifiers (numpy.ndarray<str>): identifiers of nodes
+        types (numpy.ndarray<int8>): type of each node
+        replications (numpy.ndarray<bool>): whether each node has
+            simplification by replication
+        out_pointers (numpy.ndarray<int64>): start of each node's out-links
+        out_neighbors (numpy.ndarray<int32>): target of each out-link
+        in_pointers (numpy.ndarray<int64>): start of each node's in-links
+        in_neighbors (numpy.ndarray<int32>): source of each in-link
+        in_links (numpy.ndarray<int64>): position of each in-link among
+            out-links
+        links_roles (numpy.ndarray<int8>): role of each link
+        links_replications (numpy.ndarray<bool>): whether each link has
+            simplification by replication
+
+    """
+
+    def __init__(
+        self,
+        identifiers=None,
+        types=None,
+        replications=None,
+        out_pointers=None,
+        out_neighbors=None,
+        in_pointers=None,
+        in_neighbors=None,
+        in_links=None,
+        links_roles=None,
+        links_replications=None
+    ):
+        self.identifiers = identifiers
+        self.types = types
+        self.replications = replications
+        self.out_pointers = out_pointers
+        self.out_neighbors = out_neighbors
+        self.in_pointers = in_pointers
+        self.in_neighbors = in_neighbors
+        self.in_links = in_links
+        self.links_roles = links_roles
+        self.links_replications = links_replications
+        self.indices = None
+
+    def __getstate__(self):
+        # Omit the index of identifiers, which is simple to reconstruct.
+        state = dict(self.__dict__)
+        state["indices"] = None
+        return state
+
+    def count_nodes(self):
+        """
+        Counts nodes.
+
+        returns:
+            (int): count of nodes
+
+        """
+
+        return len(self.identifiers)
+
+    def count_links(self):
+        """
+        Counts links.
+
+        returns:
+            (int): count of links
+
+        """
+
+        return len(self.out_neighbors)
+
+    def determine_index(self, identifier=None):
+        """
+        Determines the integer identifier of a node.
+
+        arguments:
+            identifier (str): identifier of a node
+
+        returns:
+            (int): integer identifier of node
+
+        """
+
+        if self.indices is None:
+            self.indices = {}
+            for index, value in enumerate(self.identifiers.tolist()):
+                self.indices[value] = index
+        return self.indices[identifier]
+
+    def collect_nodes_type(self, type=None):
+        """
+        Collects integer identifiers of nodes of a type.
+
+        arguments:
+            type (str): type of nodes, reaction or metabolite
+
+        returns:
+            (numpy.ndarray<int64>): integer identifiers of nodes
+
+        """
+
+        return numpy.flatnonzero(self.types == types[type])
+
+    def collect_successors(self, index=None):
+        """
+        Collects integer identifiers of targets of a node's out-links.
+
+        arguments:
+            index (int): integer identifier of a node
+
+        returns:
+            (numpy.ndarray<int32>): integer identifiers of nodes
+
+        """
+
+        start = self.out_pointers[index]
+        end = self.out_pointers[index + 1]
+        return self.out_neighbors[start:end]
+
+    def collect_predecessors(self, index=None):
+        """
+        Collects integer identifiers of sources of a node's in-links.
+
+        arguments:
+            index (int): integer identifier of a node
+
+        returns:
+            (numpy.ndarray<int32>): integer identifiers of nodes
+
+        """
+
+        start = self.in_pointers[index]
+        end = self.in_pointers[index + 1]
+        return self.in_neighbors[start:end]
+
+
+def define_compressed_adjacency(sources=None, targets=None, count=None):
+    """
+    Defines adjacency in compressed sparse row format.
+
+    Links from each source maintain their original order.
+
+    arguments:
+        sources (numpy.ndarray<int32>): source of each link
+        targets (numpy.ndarray<int32>): target of each link
+        count (int): count of nodes
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray>): start of each node's links, neighbor of each
+            link, and original position of each link
+
+    """
+
+    order = numpy.argsort(sources, kind="stable")
+    neighbors = targets[order]
+    pointers = numpy.zeros((count + 1), dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(sources, minlength=count), out=pointers[1:])
+    return {
+        "pointers": pointers,
+        "neighbors": neighbors,
+        "order": order
+    }
+
+
+def define_compact_network(
+    nodes_reactions=None,
+    nodes_metabolites=None,
+    links=None
+):
+    """
+    Defines a compact representation of a bipartite network.
+
+    arguments:
+        nodes_reactions (dict<dict>): information about reactions' nodes
+        nodes_metabolites (dict<dict>): information about metabolites' nodes
+        links (dict<dict>): information about links between nodes for reactions
+            and metabolites
+
+    raises:
+
+    returns:
+        (object): compact representation of network
+
+    """
+
+    # Define table of identifiers and attributes of nodes.
+    identifiers = []
+    nodes_types = []
+    replications = []
+    for node in nodes_reactions.values():
+        identifiers.append(node["identifier"])
+        nodes_types.append(types["reaction"])
+        replications.append(False)
+    for node in nodes_metabolites.values():
+        identifiers.append(node["identifier"])
+        nodes_types.append(types["metabolite"])
+        replications.append(node["replication"])
+    indices = {}
+    for index, identifier in enumerate(identifiers):
+        indices[identifier] = index
+    count = len(identifiers)
+    # Define integer identifiers and attributes of links.
+    sources = numpy.empty(len(links), dtype=numpy.int32)
+    targets = numpy.empty(len(links), dtype=numpy.int32)
+    links_roles = numpy.empty(len(links), dtype=numpy.int8)
+    links_replications = numpy.empty(len(links), dtype=bool)
+    for position, link in enumerate(links.values()):
+        sources[position] = indices[link["source"]]
+        targets[position] = indices[link["target"]]
+        links_roles[position] = roles[link["role"]]
+        links_replications[position] = link["replication"]
+    # Define adjacency of out-links and in-links.
+    adjacency_out = define_compressed_adjacency(
+        sources=sources, targets=targets, count=count
+    )
+    adjacency_in = define_compressed_adjacency(
+        sources=targets, targets=sources, count=count
+    )
+    # Refer in-links to positions of out-links.
+    positions = numpy.empty(len(links), dtype=numpy.int64)
+    positions[adjacency_out["order"]] = numpy.arange(len(links))
+    in_links = positions[adjacency_in["order"]]
+    # Compile and return information.
+    return CompactBipartiteNetwork(
+        identifiers=numpy.array(identifiers, dtype=str),
+        types=numpy.array(nodes_types, dtype=numpy.int8),
+        replications=numpy.array(replications, dtype=bool),
+        out_pointers=adjacency_out["pointers"],
+        out_neighbors=adjacency_out["neighbors"],
+        in_pointers=adjacency_in["pointers"],
+        in_neighbors=adjacency_in["neighbors"],
+        in_links=in_links,
+        links_roles=links_roles[adjacency_out["order"]],
+        links_replications=links_replications[adjacency_out["order"]]
+    )
+
+
+def read_compact_network(path=None):
+    """
+    Reads a compact representation of a network from file.
+
+    arguments:
+        path (str): directory of network's files
+
+    raises:
+
+    returns:
+        (object): compact representation of network
+
+    """
+
+    path_compact = os.path.join(path, "network_compact.pickle")
+    with open(path_compact, "rb") as file_source:
+        network = pickle.load(file_source)
+    return network
+
+
+def write_compact_network(path=None, network=None):
+    """
+    Writes a compact representation of a network to file.
+
+    arguments:
+        path (str): directory for network's files
+        network (object): compact representation of network
+
+    raises:
+
+    returns:
+
+    """
+
+    path_compact = os.path.join(path, "network_compact.pickle")
+    with open(path_compact, "wb") as file_product:
+        pickle.dump(network, file_product)
+
+
+def read_network_store(path=None, mapping=None):
+    """
+    Reads a compact representation of a network from a store of arrays.
+
+    Arrays in memory map share pages of memory between processes that read the
+    same store, and read from file only the pages that procedures access.
+
+    arguments:
+        path (str): directory of network's files
+        mapping (bool): whether to map arrays in memory rather than to read
+            them completely
+
+    raises:
+
+    returns:
+        (object): compact representation of network
+
+    """
+
+    path_store = os.path.join(path, "store")
+    if mapping:
+        mode = "r"
+    else:
+        mode = None
+    values = {}
+    for name in arrays:
+        path_array = os.path.join(path_store, (name + ".npy"))
+        values[name] = numpy.load(path_array, mmap_mode=mode)
+    return CompactBipartiteNetwork(**values)
+
+
+def write_network_store(path=None, network=None):
+    """
+    Writes a compact representation of a network to a store of arrays.
+
+    The store is a directory with a file in NumPy's format for each array.
+    The table of identifiers of nodes has fixed width, so that it is also
+    suitable for memory map.
+
+    arguments:
+        path (str): directory for network's files
+        network (object): compact representation of network
+
+    raises:
+
+    returns:
+
+    """
+
+    path_store = os.path.join(path, "store")
+    utility.confirm_path_directory(path_store)
+    for name in arrays:
+        path_array = os.path.join(path_store, (name + ".npy"))
+        numpy.save(path_array, getattr(network, name), allow_pickle=False)
@@ -0,0 +1,439 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to analyze multiple networks, such as the
+# variants of a network, concurrently in parallel processes.
+# Each network's analysis runs serially within a separate worker process, and
+# an optional limit on each worker's memory stops an analysis that would
+# otherwise exhaust memory that the other analyses share.
+# The limit applies to each worker's virtual address space rather than to
+# its resident memory. Address space includes shared libraries, stacks of
+# threads, and reservations of memory that the analysis never uses, so it is
+# several hundred mebibytes greater than resident memory even before the
+# analysis begins. A useful limit is well above the peak resident memory
+# that analysis of the same network reports without a limit.
+# Each worker belongs to its own pool of a single process, so that failure or
+# termination of the worker affects the report of its own network alone.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import time
+import resource
+import traceback
+import concurrent.futures
+import concurrent.futures.process
+
+# Relevant
+
+# Custom
+import metabonet.utility as utility
+import metabonet.variants as variants
+import metabonet.analysis as analysis
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+def define_networks(directory=None, paths=None):
+    """
+    Defines names and directories of networks to analyze.
+
+    Without explicit directories, networks are the variants of a network that
+    exist in the directory for source and product files.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        paths (list<str>): paths to directories of networks' files, or None
+            for all variants of a network
+
+    raises:
+
+    returns:
+        (list<dict>): names and directories of networks
+
+    """
+
+    records = []
+    if paths is None:
+        for variant in variants.define_variants(variants="all"):
+            path = os.path.join(directory, variant["name"])
+            if os.path.exists(os.path.join(path, "links.pickle")):
+                records.append({"name": variant["name"], "path": path})
+    else:
+        for path in paths:
+            record = {
+                "name": os.path.basename(os.path.normpath(path)),
+                "path": path
+            }
+            records.append(record)
+    return records
+
+
+def measure_address(field=None):
+    """
+    Measures virtual address space of the current process.
+
+    arguments:
+        field (str): field in the process's status, "VmSize" for current or
+            "VmPeak" for peak address space
+
+    raises:
+
+    returns:
+        (float): address space in mebibytes, or not a number if unavailable
+
+    """
+
+    path = os.path.join("/proc", "self", "status")
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            for line in file:
+                if line.startswith(field + ":"):
+                    return float(line.split()[1]) / 1024
+    return float("nan")
+
+
+def initialize_worker(memory=None):
+    """
+    Initializes limit on memory within a worker process.
+
+    The limit applies to the worker's virtual address space, which is
+    greater than its resident memory.
+
+    arguments:
+        memory (int): maximal address space in mebibytes for the worker
+            process, or None for no limit
+
+    raises:
+
+    returns:
+
+    """
+
+    if memory is not None:
+        # Warn of a limit below the address space that the worker already
+        # occupies before analysis.
+        address = measure_address(field="VmSize")
+        if address > memory:
+            print(
+                "... limit of " + str(memory) + " MiB is below the " +
+                "worker's address space of " + str(round(address, 1)) +
+                " MiB before analysis ..."
+            )
+        # Limit the worker's address space, preserving the hard limit.
+        hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+        soft = memory * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def analyze_network_worker(parameters=None):
+    """
+    Analyzes a single network within a worker process.
+
+    Analysis runs serially within the worker, as worker processes cannot
+    create their own pools of processes. Any error in analysis of the network
+    determines the status of its report rather than interrupting analyses of
+    other networks.
+
+    arguments:
+        parameters (dict): name and directory of network and parameters for
+            analysis
+
+    raises:
+
+    returns:
+        (dict): report of name, status, wall time, peak memory, and peak
+            address space of analysis
+
+    """
+
+    # Measure time of analysis.
+    start = time.perf_counter()
+    message = ""
+    try:
+        analysis.execute_procedure(
+            directory=parameters["directory"],
+            processes=None,
+            approximate=parameters["approximate"],
+            samples=parameters["samples"],
+            error=parameters["error"],
+            references=parameters["references"],
+            tolerance=parameters["tolerance"],
+            caching=parameters["caching"],
+            path_network=parameters["path"]
+        )
+        status = "complete"
+    except MemoryError:
+        # Report exhaustion of memory without interruption of other analyses.
+        status = "memory"
+    except Exception as exception:
+        # Report any other error, which might also derive from the limit on
+        # memory, without interruption of other analyses.
+        print("... analysis of network " + parameters["name"] + " failed ...")
+        traceback.print_exc()
+        status = "failure"
+        message = " ".join(
+            (type(exception).__name__ + ": " + str(exception)).split()
+        )
+    duration = time.perf_counter() - start
+    # Measure peak resident memory of the worker in mebibytes.
+    memory_peak = (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    )
+    # Compile and return information.
+    return {
+        "name": parameters["name"],
+        "status": status,
+        "time": duration,
+        "memory_peak": memory_peak,
+        "address_peak": measure_address(field="VmPeak"),
+        "message": message
+    }
+
+
+def analyze_networks(parameters=None, processes=None, memory=None):
+    """
+    Analyzes networks concurrently in worker processes.
+
+    Each network's analysis runs in its own pool of a single worker process,
+    and at most a count of these pools run at once. If a worker terminates
+    without a report, as when the system stops it for exhaustion of memory,
+    its pool breaks and the report of its network alone shows termination.
+
+    arguments:
+        parameters (list<dict>): names and directories of networks and
+            parameters for analysis
+        processes (int): count of networks to analyze at once
+        memory (int): maximal address space in mebibytes for each worker
+            process, or None for no limit
+
+    raises:
+
+    returns:
+        (list<dict>): reports of networks in the same order as parameters
+
+    """
+
+    reports = [None] * len(parameters)
+    pending = list(range(len(parameters)))
+    running = {}
+    while (len(pending) > 0) or (len(running) > 0):
+        # Start analyses up to the count of processes.
+        while (len(pending) > 0) and (len(running) < processes):
+            index = pending.pop(0)
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                initializer=initialize_worker,
+                initargs=(memory,)
+            )
+            future = executor.submit(
+                analyze_network_worker, parameters[index]
+            )
+            running[future] = {
+                "index": index,
+                "executor": executor,
+                "start": time.perf_counter()
+            }
+        # Collect reports from analyses that finish.
+        done, _ = concurrent.futures.wait(
+            running, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            entry = running.pop(future)
+            name = parameters[entry["index"]]["name"]
+            try:
+                report = future.result()
+            except concurrent.futures.process.BrokenProcessPool as exception:
+                # Report termination of the worker without a report.
+                print("... worker for network " + name + " terminated ...")
+                report = {
+                    "name": name,
+                    "status": "terminated",
+                    "time": time.perf_counter() - entry["start"],
+                    "memory_peak": float("nan"),
+                    "address_peak": float("nan"),
+                    "message": " ".join(str(exception).split())
+                }
+            entry["executor"].shutdown()
+            reports[entry["index"]] = report
+    return reports
+
+
+def write_product(directory=None, information=None):
+    """
+    Writes product information to file
+
+    arguments:
+        directory (str): directory for product files
+        information (object): information to write to file
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    path = os.path.join(directory, "analysis")
+    utility.confirm_path_directory(path)
+    path_concurrence = os.path.join(path, "concurrence.tsv")
+    # Write information to file.
+    utility.write_file_table(
+        information=information["reports"],
+        path_file=path_concurrence,
+        names=information["reports"][0].keys(),
+        delimiter="\t"
+    )
+
+
+###############################################################################
+# Procedure
+
+
+def execute_procedure(
+    directory=None,
+    paths=None,
+    processes=None,
+    memory=None,
+    approximate=None,
+    samples=None,
+    error=None,
+    references=None,
+    tolerance=None,
+    caching=None
+):
+    """
+    Function to execute module's main behavior.
+
+    The purpose of this procedure is to analyze multiple networks
+    concurrently.
+    Analysis of each network reads the model and customization from the
+    directory for source and product files and writes products within the
+    network's own directory.
+
+    /root/compartments-true_hubs-true/analysis/
+    /root/analysis/concurrence.tsv
+
+    arguments:
+        directory (str): path to directory for source and product files
+        paths (list<str>): paths to directories of networks' files, or None
+            for all variants of a network
+        processes (int): count of parallel worker processes
+        memory (int): maximal address space in mebibytes for each worker
+            process, or None for no limit, which must be well above the
+            resident memory of analysis
+        approximate (bool): whether to estimate betweenness centrality from
+            samples of source nodes
+        samples (int): count of source nodes to sample for approximate
+            betweenness centrality, or None to determine count adaptively
+        error (float): maximal relative error of approximate betweenness
+            centrality for adaptive count of samples, or None for 0.05
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        caching (bool): whether to read and write expensive metrics in a cache
+            on disk with keys from the content of the network
+
+    raises:
+
+    returns:
+
+    """
+
+    # Define parameters for networks.
+    parameters = []
+    for network in define_networks(directory=directory, paths=paths):
+        record = {
+            "name": network["name"],
+            "path": network["path"],
+            "directory": directory,
+            "approximate": approximate,
+            "samples": samples,
+            "error": error,
+            "references": references,
+            "tolerance": tolerance,
+            "caching": caching
+        }
+        parameters.append(record)
+    if len(parameters) == 0:
+        print("... no networks to analyze ...")
+        return
+    # Analyze networks.
+    # Analyses always run in worker processes so that the limit on memory
+    # and the measurement of peak memory apply to each analysis alone.
+    if processes is None:
+        processes = 1
+    start = time.perf_counter()
+    reports = analyze_networks(
+        parameters=parameters,
+        processes=max(1, processes),
+        memory=memory
+    )
+    duration = time.perf_counter() - start
+    # Report summary.
+    print("--------------------------------------------------")
+    for report in reports:
+        print(
+            "... " + report["name"] + ": " + report["status"] + " in " +
+            str(round(report["time"], 3)) + " seconds with peak memory " +
+            str(round(report["memory_peak"], 1)) + " MiB ..."
+        )
+        if len(report["message"]) > 0:
+            print("... " + report["name"] + ": " + report["message"] + " ...")
+    print(
+        "... total wall time " + str(round(duration, 3)) + " seconds for " +
+        str(len(reports)) + " networks ..."
+    )
+    # Compile information.
+    information = {
+        "reports": reports
+    }
+    #Write product information to file.
+    write_product(directory=directory, information=information)
+
+
+if (__name__ == "__main__"):
+    execute_procedure()
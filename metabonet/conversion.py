@@ -43,6 +43,7 @@ import os
 import pickle
 import copy
 import json
+import gzip
 
 # Relevant
 
@@ -246,20 +247,41 @@ def convert_nodes_cytoscape(
 
     """
 
-    nodes_cytoscape = []
+    return list(iterate_nodes_cytoscape(
+        nodes_reactions=nodes_reactions,
+        nodes_metabolites=nodes_metabolites
+    ))
+
+
+def iterate_nodes_cytoscape(
+    nodes_reactions=None,
+    nodes_metabolites=None
+):
+    """
+    Converts information about network's nodes to format for CytoScape one
+    node at a time.
+
+    arguments:
+        nodes_reactions (dict<dict>): information about reactions' nodes
+        nodes_metabolites (dict<dict>): information about metabolites' nodes
+
+    raises:
+
+    returns:
+        (generator<dict>): information about network's nodes
+
+    """
+
     for node_reaction in nodes_reactions.values():
         node_reaction["id"] = node_reaction["identifier"]
-        node_cytoscape = {
+        yield {
             "data": node_reaction
         }
-        nodes_cytoscape.append(node_cytoscape)
     for node_metabolite in nodes_metabolites.values():
         node_metabolite["id"] = node_metabolite["identifier"]
-        node_cytoscape = {
+        yield {
             "data": node_metabolite
         }
-        nodes_cytoscape.append(node_cytoscape)
-    return nodes_cytoscape
 
 
 def convert_links_cytoscape(links=None):
@@ -277,23 +299,181 @@ def convert_links_cytoscape(links=None):
 
     """
 
-    links_cytoscape = []
+    return list(iterate_links_cytoscape(links=links))
+
+
+def iterate_links_cytoscape(links=None):
+    """
+    Converts information about network's links to format for CytoScape one
+    link at a time.
+
+    arguments:
+        links (dict<dict>): information about links between nodes for reactions
+            and metabolites
+
+    raises:
+
+    returns:
+        (generator<dict>): information about network's links
+
+    """
+
     for link in links.values():
         link["id"] = link["identifier"]
-        link_cytoscape = {
+        yield {
             "data": link
         }
-        links_cytoscape.append(link_cytoscape)
-    return links_cytoscape
 
 
-def write_product(directory=None, information=None):
+def open_file_product(path_file=None, mode=None, compression=None):
+    """
+    Opens a file for product information.
+
+    This function removes any previous file in the alternative format, so that
+    readers find only the current file.
+
+    arguments:
+        path_file (str): path to file, without suffix for compression
+        mode (str): mode for file, either "w" for text or "wb" for binary
+        compression (bool): whether to compress file in GZIP format
+
+    raises:
+
+    returns:
+        (object): file
+
+    """
+
+    if compression:
+        utility.remove_file(path_file)
+        if mode == "w":
+            return gzip.open((path_file + ".gz"), "wt", encoding="utf-8")
+        else:
+            return gzip.open((path_file + ".gz"), mode)
+    else:
+        utility.remove_file(path_file + ".gz")
+        return open(path_file, mode)
+
+
+def read_networkx(path=None):
+    """
+    Reads information about network's elements in format for NetworkX from
+    file.
+
+    The file might be in GZIP format.
+
+    arguments:
+        path (str): directory of network's files
+
+    raises:
+
+    returns:
+        (dict): information about network's nodes and links
+
+    """
+
+    path_networkx = os.path.join(path, "network_networkx.pickle")
+    if os.path.exists(path_networkx):
+        with open(path_networkx, "rb") as file_source:
+            information = pickle.load(file_source)
+    else:
+        with gzip.open((path_networkx + ".gz"), "rb") as file_source:
+            information = pickle.load(file_source)
+    return information
+
+
+def write_networkx(path=None, information=None, compression=None):
+    """
+    Writes information about network's elements in format for NetworkX to
+    file.
+
+    Serialization in pickle format writes to file in frames.
+
+    arguments:
+        path (str): directory for network's files
+        information (dict): information about network's nodes and links in
+            format for NetworkX
+        compression (bool): whether to compress file in GZIP format
+
+    raises:
+
+    returns:
+
+    """
+
+    path_networkx = os.path.join(path, "network_networkx.pickle")
+    with open_file_product(
+        path_file=path_networkx, mode="wb", compression=compression
+    ) as file_product:
+        pickle.dump(information, file_product)
+
+
+def write_cytoscape(
+    path=None,
+    nodes_reactions=None,
+    nodes_metabolites=None,
+    links=None,
+    compression=None
+):
+    """
+    Writes information about network's elements in format for CytoScape to
+    file.
+
+    This function converts and writes one node or link at a time, so that
+    memory does not hold the complete serialization.
+    Text is identical to that from serialization of the complete elements.
+
+    arguments:
+        path (str): directory for network's files
+        nodes_reactions (dict<dict>): information about reactions' nodes
+        nodes_metabolites (dict<dict>): information about metabolites' nodes
+        links (dict<dict>): information about links between nodes for reactions
+            and metabolites
+        compression (bool): whether to compress file in GZIP format
+
+    raises:
+
+    returns:
+
+    """
+
+    def write_sequence(file_product=None, records=None):
+        delimiter = ""
+        for record in records:
+            file_product.write(delimiter)
+            file_product.write(json.dumps(record))
+            delimiter = ", "
+    path_cytoscape = os.path.join(path, "network_cytoscape.json")
+    with open_file_product(
+        path_file=path_cytoscape, mode="w", compression=compression
+    ) as file_product:
+        file_product.write("{\"elements\": {\"nodes\": [")
+        write_sequence(
+            file_product=file_product,
+            records=iterate_nodes_cytoscape(
+                nodes_reactions=nodes_reactions,
+                nodes_metabolites=nodes_metabolites
+            )
+        )
+        file_product.write("], \"edges\": [")
+        write_sequence(
+            file_product=file_product,
+            records=iterate_links_cytoscape(links=links)
+        )
+        file_product.write("]}}")
+
+
+def write_product(directory=None, information=None, compression=None):
     """
     Writes product information to file
 
+    Conversion for CytoScape includes novel keys in nodes and links, which
+    shares information with conversion for NetworkX.
+
     arguments:
         directory (str): directory for product files
         information (object): information to write to file
+        compression (bool): whether to compress files in GZIP format
 
     raises:
 
@@ -304,20 +484,26 @@ def write_product(directory=None, information=None):
     # Specify directories and files.
     path = os.path.join(directory, "network")
     utility.confirm_path_directory(path)
-    path_networkx = os.path.join(path, "network_networkx.pickle")
-    path_cytoscape = os.path.join(path, "network_cytoscape.json")
     # Write information to file.
-    with open(path_networkx, "wb") as file_product:
-        pickle.dump(information["networkx"], file_product)
-    with open(path_cytoscape, "w") as file_product:
-        json.dump(information["cytoscape"], file_product)
+    write_cytoscape(
+        path=path,
+        nodes_reactions=information["nodes_reactions"],
+        nodes_metabolites=information["nodes_metabolites"],
+        links=information["links"],
+        compression=compression
+    )
+    write_networkx(
+        path=path,
+        information=information["networkx"],
+        compression=compression
+    )
 
 
 ###############################################################################
 # Procedure
 
 
-def execute_procedure(directory=None):
+def execute_procedure(directory=None, compression=None):
     """
     Function to execute module's main behavior.
 
@@ -327,6 +513,7 @@ def execute_procedure(directory=None):
 
     arguments:
         directory (str): path to directory for source and product files
+        compression (bool): whether to compress files in GZIP format
 
     raises:
 
@@ -342,16 +529,17 @@ def execute_procedure(directory=None):
         nodes_metabolites=source["nodes_metabolites"],
         links=source["links"]
     )
-    # Convert information format for export to CytoScape.
-    cytoscape = convert_cytoscape(
-        nodes_reactions=source["nodes_reactions"],
-        nodes_metabolites=source["nodes_metabolites"],
-        links=source["links"]
-    )
     # Compile information.
+    # Conversion for CytoScape occurs during writing to file.
     information = {
         "networkx": networkx,
-        "cytoscape": cytoscape
+        "nodes_reactions": source["nodes_reactions"],
+        "nodes_metabolites": source["nodes_metabolites"],
+        "links": source["links"]
     }
     #Write product information to file.
-    write_product(directory=directory, information=information)
+    write_product(
+        directory=directory,
+        information=information,
+        compression=compression
+    )
@@ -54,13 +54,18 @@ import metabonet.metabocurator.extraction
 import metabonet.metabocurator.measurement
 import metabonet.metabocurator.reconciliation
 import metabonet.analysis
+import metabonet.benchmark
 import metabonet.candidacy
 import metabonet.clean
+import metabonet.concurrence
 import metabonet.conversion
 import metabonet.measurement
 import metabonet.network
 import metabonet.plot
+import metabonet.service
+import metabonet.sweep
 import metabonet.utility
+import metabonet.variants
 
 #dir()
 #importlib.reload()
@@ -95,6 +100,7 @@ def define_interface_parsers():
     subparsers = parser.add_subparsers(title="procedures")
     parser_model = define_model_subparser(subparsers=subparsers)
     parser_network = define_network_subparser(subparsers=subparsers)
+    parser_query = define_query_subparser(subparsers=subparsers)
     parser_clean = define_clean_subparser(subparsers=subparsers)
     # Parse arguments.
     return parser.parse_args()
@@ -147,6 +153,34 @@ def define_general_epilog():
     return epilog
 
 
+def parse_count(value=None):
+    """
+    Parses a count of at least one from an argument.
+
+    arguments:
+        value (str): value of argument
+
+    raises:
+        (argparse.ArgumentTypeError): value is not an integer of at least one
+
+    returns:
+        (int): count
+
+    """
+
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "invalid count: " + repr(value)
+        )
+    if count < 1:
+        raise argparse.ArgumentTypeError(
+            "count must be at least 1: " + repr(value)
+        )
+    return count
+
+
 def define_model_subparser(subparsers=None):
     """
     Defines subparser for procedures that adapt a model of human metabolism.
@@ -202,6 +236,14 @@ def define_model_subparser(subparsers=None):
         "-v", "--conversion", dest="conversion", action="store_true",
         help="Convert information to formats for export."
     )
+    parser_model.add_argument(
+        "-s", "--shards", dest="shards", type=parse_count, required=False,
+        default=None,
+        help=(
+            "Count of reactions in each shard of conversion for web " +
+            "application."
+        )
+    )
     parser_model.add_argument(
         "-m", "--measurement", dest="measurement", action="store_true",
         help="Curate information about measurements of metabolites."
@@ -328,6 +370,11 @@ def define_model_epilog():
         Convert information about compartments, processes, reactions, and
         metabolites to versatile formats.
 
+        Optionally also write information for web application in separate
+        files for each section, with shards of reactions and an index.
+
+        /root/model/dymetabonet/index.json
+
         --------------------------------------------------
         measurement
 
@@ -389,6 +436,22 @@ def define_network_subparser(subparsers=None):
             "procedure."
         )
     )
+    parser_network.add_argument(
+        "-i", "--incrementation", dest="incrementation",
+        action="store_true", required=False,
+        help=(
+            "Evaluate candidacy only for reactions that changes to filters " +
+            "or simplifications affect since previous evaluation."
+        )
+    )
+    parser_network.add_argument(
+        "-f", "--verification", dest="verification",
+        action="store_true", required=False,
+        help=(
+            "Verify incremental evaluation of candidacy against complete " +
+            "evaluation."
+        )
+    )
     parser_network.add_argument(
         "-n", "--network", dest="network", action="store_true",
         help=(
@@ -405,6 +468,45 @@ def define_network_subparser(subparsers=None):
         "-v", "--conversion", dest="conversion", action="store_true",
         help="Convert information to formats for export."
     )
+    parser_network.add_argument(
+        "-z", "--compression", dest="compression",
+        action="store_true", required=False,
+        help=(
+            "Compress network's elements in formats for NetworkX and " +
+            "CytoScape in GZIP format."
+        )
+    )
+    parser_network.add_argument(
+        "-r", "--variants", dest="variants", type=str, required=False,
+        choices=["all"], default=None,
+        help=(
+            "Evaluate candidacy and define network for multiple variants of " +
+            "compartmentalization and simplification from a single reading " +
+            "of the model."
+        )
+    )
+    parser_network.add_argument(
+        "-k", "--sweep", dest="sweep", type=str, required=False,
+        default=None,
+        help=(
+            "Path to directory of alternative tables of simplification of " +
+            "metabolites for which to define, analyze, and compare networks."
+        )
+    )
+    parser_network.add_argument(
+        "-w", "--processes", dest="processes", type=int, required=False,
+        default=1,
+        help="Count of parallel worker processes for multiple procedures."
+    )
+    parser_network.add_argument(
+        "-b", "--benchmark", dest="benchmark", type=str, required=False,
+        default=None,
+        choices=(["all"] + list(metabonet.benchmark.benchmarks.keys())),
+        help=(
+            "Measure performance of procedures on the model. Specify the " +
+            "name of a benchmark or all benchmarks."
+        )
+    )
     parser_network.add_argument(
         "-m", "--measurement", dest="measurement", action="store_true",
         help="Integrate information about measurements of metabolites."
@@ -413,6 +515,73 @@ def define_network_subparser(subparsers=None):
         "-a", "--analysis", dest="analysis", action="store_true",
         help="Analyze metabolic network."
     )
+    parser_network.add_argument(
+        "-e", "--approximation", dest="approximation",
+        action="store_true", required=False,
+        help=(
+            "Estimate betweenness centrality in analysis from samples of " +
+            "source nodes."
+        )
+    )
+    parser_network.add_argument(
+        "-g", "--samples", dest="samples", type=int, required=False,
+        default=None,
+        help=(
+            "Count of source nodes to sample for approximate betweenness " +
+            "centrality, otherwise adaptive count."
+        )
+    )
+    parser_network.add_argument(
+        "-u", "--error", dest="error", type=float, required=False,
+        default=None,
+        help=(
+            "Add sampled source nodes for approximate betweenness " +
+            "centrality until relative error of estimates is below this " +
+            "value, otherwise 0.05."
+        )
+    )
+    parser_network.add_argument(
+        "-x", "--references", dest="references", type=int, required=False,
+        default=None,
+        help=(
+            "Count of random reference networks for small-world " +
+            "coefficient in analysis, or initial count with tolerance."
+        )
+    )
+    parser_network.add_argument(
+        "-o", "--tolerance", dest="tolerance", type=float, required=False,
+        default=None,
+        help=(
+            "Add random reference networks for small-world coefficient " +
+            "until relative standard errors of their mean properties are " +
+            "below tolerance."
+        )
+    )
+    parser_network.add_argument(
+        "-j", "--cache", dest="cache", action="store_true",
+        required=False,
+        help=(
+            "Read and write expensive metrics of analysis in a cache with " +
+            "keys from the content of the network."
+        )
+    )
+    parser_network.add_argument(
+        "-q", "--networks", dest="networks", type=str, nargs="+",
+        required=False, default=None,
+        help=(
+            "Paths to directories of multiple networks to analyze " +
+            "concurrently in parallel processes."
+        )
+    )
+    parser_network.add_argument(
+        "-l", "--memory", dest="memory", type=int, required=False,
+        default=None,
+        help=(
+            "Maximal virtual address space in mebibytes for each worker " +
+            "process in concurrent analysis of multiple networks, which " +
+            "must be well above resident memory of analysis."
+        )
+    )
     parser_network.add_argument(
         "-t", "--plot", dest="plot", action="store_true",
         help="Generate visual plots from analysis."
@@ -480,6 +649,11 @@ def define_network_epilog():
         Optionally simplify representations of specific reactions and
         metabolites.
 
+        Optionally evaluate candidacy incrementally, only for reactions that
+        changes to filters or simplifications affect since the previous
+        incremental evaluation, and optionally verify against complete
+        evaluation.
+
         --------------------------------------------------
         measurement
 
@@ -493,17 +667,107 @@ def define_network_epilog():
 
         Optionally select only the network's main component.
 
+        --------------------------------------------------
+        variants
+
+        Determine candidacy and define network's nodes and links for all
+        variants of compartmentalization and simplification of hubs from a
+        single reading of the model.
+
+        Write products for each variant to a separate directory.
+
+        /root/compartments-true_hubs-true/
+        /root/compartments-true_hubs-false/
+        /root/compartments-false_hubs-true/
+        /root/compartments-false_hubs-false/
+
+        Optionally convert each variant's elements, and optionally execute
+        variants in parallel processes.
+
+        --------------------------------------------------
+        sweep
+
+        Evaluate candidacy, define network, and analyze network for each
+        alternative table of simplification of metabolites in a directory.
+
+        Compare network-level metrics of all configurations in a single
+        table.
+
+        /root/sweep/comparison.tsv
+
+        Optionally compartmentalize metabolites, select network's main
+        component, and execute configurations in parallel processes.
+        Analysis of each configuration uses the same count of random
+        reference networks and tolerance as analysis of a single network.
+
         --------------------------------------------------
         conversion
 
         Convert information about network's elements (nodes and links) to
         formats for transfer to NetworkX and CytoScape.
 
+        Optionally compress these files in GZIP format.
+
         --------------------------------------------------
         analysis
 
         Analyze metabolic network in NetworkX.
 
+        Optionally estimate betweenness centrality from a fixed or adaptive
+        count of sampled source nodes, and report the count and the relative
+        error of estimates. An adaptive count doubles until the relative
+        error is below a maximum. Estimates of betweenness centrality for
+        nodes and centralization of betweenness for the network are then
+        approximate, and reports of both include the count of samples and
+        the relative error.
+
+        Optionally specify the count of random reference networks for the
+        small-world coefficient, or add reference networks until the
+        standard errors of their mean properties are below a tolerance.
+        Report a confidence interval of 95% for the small-world
+        coefficient.
+
+        Optionally cache expensive metrics under keys from the content of
+        the network, the metric, and its parameters, so that analysis of an
+        unchanged network reads these metrics rather than calculating them
+        again.
+
+        /root/network/cache/
+
+        --------------------------------------------------
+        concurrent analysis
+
+        Analyze multiple networks concurrently in parallel processes, either
+        all variants of a network or networks in specific directories. Each
+        analysis reads the model from the root directory and writes its
+        products to the network's own directory. Report status, wall time,
+        peak resident memory, and peak address space for each network.
+
+        /root/compartments-true_hubs-true/analysis/
+        /root/analysis/concurrence.tsv
+
+        Optionally limit the virtual address space of each worker process,
+        in which case an analysis that exceeds the limit stops without
+        interruption of the others. Address space includes shared libraries,
+        stacks of threads, and unused reservations of memory, so it is
+        several hundred mebibytes greater than resident memory before
+        analysis even begins. Choose a limit well above the peak resident
+        memory that analysis of the same network reports without a limit.
+        Analysis that fails for any reason reports its error, and a worker
+        that the system terminates reports termination, each for its own
+        network alone.
+
+        --------------------------------------------------
+        benchmark
+
+        Measure time and peak memory of procedures on the model.
+
+        /root/benchmark/candidacy.tsv
+        /root/benchmark/conversion.tsv
+        /root/benchmark/reports.tsv
+        /root/benchmark/betweenness.tsv
+        /root/benchmark/assortativity.tsv
+
         --------------------------------------------------
         --------------------------------------------------
         --------------------------------------------------
@@ -511,6 +775,74 @@ def define_network_epilog():
     return epilog
 
 
+def define_query_subparser(subparsers=None):
+    """
+    Defines subparser for procedures that query a network's metabolites.
+
+    arguments:
+        subparsers (object): reference to subparsers' container
+
+    raises:
+
+    returns:
+        (object): reference to parser
+
+    """
+
+    parser_query = subparsers.add_parser(
+        name="query",
+        description=(
+            "Serve and answer queries about reactions, compartments, and " +
+            "processes in the neighborhoods of metabolites in a network."
+        ),
+        help="Help for query routine."
+    )
+    parser_query.add_argument(
+        "-d", "--directory", dest="directory", type=str, required=True,
+        help="Path to root directory for source and product files."
+    )
+    parser_query.add_argument(
+        "-n", "--network", dest="network", type=str, required=False,
+        default=None,
+        help=(
+            "Path to directory of network's files, otherwise the network " +
+            "in the root directory."
+        )
+    )
+    parser_query.add_argument(
+        "-k", "--socket", dest="socket", type=str, required=False,
+        default=None,
+        help=(
+            "Path to Unix socket of query service, otherwise a socket in " +
+            "the directory of network's files."
+        )
+    )
+    parser_query.add_argument(
+        "-s", "--service", dest="service", action="store_true",
+        help=(
+            "Read network and model once and serve queries until " +
+            "interruption."
+        )
+    )
+    parser_query.add_argument(
+        "-m", "--metabolites", dest="metabolites", type=str, nargs="+",
+        required=False, default=None,
+        help=(
+            "Identifiers or names of metabolites or identifiers of their " +
+            "nodes to query from a running service."
+        )
+    )
+    parser_query.add_argument(
+        "-q", "--query", dest="query", type=str, required=False,
+        choices=list(metabonet.service.queries.keys()), default="all",
+        help="Kind of information to query about metabolites."
+    )
+    # Define behavior.
+    parser_query.set_defaults(func=evaluate_query_parameters)
+    # Return parser.
+    return parser_query
+
+
 def define_clean_subparser(subparsers=None):
     """
     Defines subparser for procedures that remove files and directories.
@@ -598,7 +930,8 @@ def evaluate_model_parameters(arguments):
         print("... executing conversion procedure ...")
         # Execute procedure.
         metabonet.metabocurator.conversion.execute_procedure(
-            directory=arguments.directory
+            directory=arguments.directory,
+            shards=arguments.shards
         )
     if arguments.measurement:
         # Report status.
@@ -625,16 +958,45 @@ def evaluate_network_parameters(arguments):
     print("--------------------------------------------------")
     print("... call to network routine ...")
     # Execute procedure.
-    if arguments.candidacy:
+    if arguments.variants is not None:
+        # Report status.
+        print("... executing variants procedure ...")
+        # Execute procedure.
+        metabonet.variants.execute_procedure(
+            variants=arguments.variants,
+            component=arguments.component,
+            convert=arguments.conversion,
+            compression=arguments.compression,
+            processes=arguments.processes,
+            directory=arguments.directory
+        )
+    if arguments.sweep is not None:
+        # Report status.
+        print("... executing sweep procedure ...")
+        # Execute procedure.
+        metabonet.sweep.execute_procedure(
+            path_configurations=arguments.sweep,
+            compartmentalization=arguments.compartmentalization,
+            component=arguments.component,
+            references=arguments.references,
+            tolerance=arguments.tolerance,
+            processes=arguments.processes,
+            directory=arguments.directory
+        )
+    # Procedures for variants include candidacy, network, and conversion.
+    variation = arguments.variants is not None
+    if arguments.candidacy and not variation:
         # Report status.
         print("... executing candidacy procedure ...")
         # Execute procedure.
         metabonet.candidacy.execute_procedure(
             compartmentalization=arguments.compartmentalization,
             simplification=arguments.simplification,
+            incrementation=arguments.incrementation,
+            verification=arguments.verification,
             directory=arguments.directory
         )
-    if arguments.network:
+    if arguments.network and not variation:
         # Report status.
         print("... executing network procedure ...")
         # Execute procedure.
@@ -642,26 +1004,104 @@ def evaluate_network_parameters(arguments):
             component=arguments.component,
             directory=arguments.directory
         )
-    if arguments.conversion:
+    if arguments.conversion and not variation:
         # Report status.
         print("... executing conversion procedure ...")
         # Execute procedure.
-        metabonet.conversion.execute_procedure(directory=arguments.directory)
+        metabonet.conversion.execute_procedure(
+            directory=arguments.directory,
+            compression=arguments.compression
+        )
     if arguments.measurement:
         # Report status.
         print("... executing measurement procedure ...")
         # Execute procedure.
         metabonet.measurement.execute_procedure(directory=arguments.directory)
-    if arguments.analysis:
+    # Analysis of variants or of multiple networks is concurrent.
+    concurrence = variation or (arguments.networks is not None)
+    if arguments.analysis and concurrence:
+        # Report status.
+        print("... executing concurrent analysis procedure ...")
+        # Execute procedure.
+        metabonet.concurrence.execute_procedure(
+            directory=arguments.directory,
+            paths=arguments.networks,
+            processes=arguments.processes,
+            memory=arguments.memory,
+            approximate=arguments.approximation,
+            samples=arguments.samples,
+            error=arguments.error,
+            references=arguments.references,
+            tolerance=arguments.tolerance,
+            caching=arguments.cache
+        )
+    if arguments.analysis and not concurrence:
         # Report status.
         print("... executing analysis procedure ...")
         # Execute procedure.
-        metabonet.analysis.execute_procedure(directory=arguments.directory)
+        metabonet.analysis.execute_procedure(
+            directory=arguments.directory,
+            processes=arguments.processes,
+            approximate=arguments.approximation,
+            samples=arguments.samples,
+            error=arguments.error,
+            references=arguments.references,
+            tolerance=arguments.tolerance,
+            caching=arguments.cache
+        )
     if arguments.plot:
         # Report status.
         print("... executing plot procedure ...")
         # Execute procedure.
         metabonet.plot.execute_procedure(directory=arguments.directory)
+    if arguments.benchmark is not None:
+        # Report status.
+        print("... executing benchmark procedure ...")
+        # Determine benchmarks.
+        if arguments.benchmark == "all":
+            names = list(metabonet.benchmark.benchmarks.keys())
+        else:
+            names = [arguments.benchmark]
+        # Execute procedure.
+        metabonet.benchmark.execute_procedure(
+            names=names,
+            directory=arguments.directory
+        )
+
+
+def evaluate_query_parameters(arguments):
+    """
+    Evaluates parameters for query procedure.
+
+    arguments:
+        arguments (object): arguments from terminal
+
+    raises:
+
+    returns:
+
+    """
+
+    # Execute procedure.
+    if arguments.service:
+        # Report status.
+        print("--------------------------------------------------")
+        print("... call to query service ...")
+        # Execute procedure.
+        metabonet.service.execute_procedure(
+            directory=arguments.directory,
+            path_network=arguments.network,
+            path_socket=arguments.socket
+        )
+    elif arguments.metabolites is not None:
+        # Execute procedure.
+        metabonet.service.execute_query(
+            directory=arguments.directory,
+            path_network=arguments.network,
+            path_socket=arguments.socket,
+            metabolites=arguments.metabolites,
+            query=arguments.query
+        )
 
 
 def evaluate_clean_parameters(arguments):
@@ -346,63 +346,42 @@ def convert_metabolites_text(metabolites=None):
         metabolites (dict<dict>): information about metabolites
 
     returns:
-        (list<dict>): information about metabolites
+        (dict<list>): information about metabolites in columns
 
     raises:
 
     """
 
-    records = []
-    for metabolite in metabolites.values():
-        measurements = metabolite["measurements"]
-        study_one = measurements["study_one"]
-        study_two = measurements["study_two"]
-        study_three = measurements["study_three"]
-        study_four = measurements["study_four"]
-        study_five = measurements["study_five"]
-        record = {
-            "identifier": metabolite["identifier"],
-            "name": metabolite["name"],
-            "metabolite": metabolite["metabolite"],
-            "compartment": metabolite["compartment"],
-            "reactions_candidacy": ";".join(
-                metabolite["reactions_candidacy"]
-            ),
-            "reactions_candidacy_count": (
-                metabolite["reactions_candidacy_count"]
-            ),
-            "study_one_fold": study_one["fold"],
-            "study_one_fold_log": study_one["fold_log"],
-            "study_one_p_value": study_one["p_value"],
-            "study_one_p_value_log": study_one["p_value_log"],
-            "study_one_significance": study_one["significance"],
-            "study_two_fold": study_two["fold"],
-            "study_two_fold_log": study_two["fold_log"],
-            "study_two_p_value": study_two["p_value"],
-            "study_two_p_value_log": study_two["p_value_log"],
-            "study_two_significance": study_two["significance"],
-            "study_three_fold": study_three["fold"],
-            "study_three_fold_log": study_three["fold_log"],
-            "study_three_p_value": study_three["p_value"],
-            "study_three_p_value_log": study_three["p_value_log"],
-            "study_three_significance": study_three["significance"],
-            "study_four_fold": study_four["fold"],
-            "study_four_fold_log": study_four["fold_log"],
-            "study_four_p_value": study_four["p_value"],
-            "study_four_p_value_log": study_four["p_value_log"],
-            "study_four_significance": study_four["significance"],
-            "study_five_fold": study_five["fold"],
-            "study_five_fold_log": study_five["fold_log"],
-            "study_five_p_value": study_five["p_value"],
-            "study_five_p_value_log": study_five["p_value_log"],
-            "study_five_significance": study_five["significance"],
-        }
-        records.append(record)
-    records.sort(
-        key=lambda record: record["reactions_candidacy_count"],
+    records = list(metabolites.values())
+    columns = {}
+    for key in ["identifier", "name", "metabolite", "compartment"]:
+        columns[key] = utility.collect_value_from_records(
+            key=key, records=records
+        )
+    columns["reactions_candidacy"] = [
+        ";".join(metabolite["reactions_candidacy"]) for metabolite in records
+    ]
+    columns["reactions_candidacy_count"] = utility.collect_value_from_records(
+        key="reactions_candidacy_count", records=records
+    )
+    # Measurements.
+    studies = [
+        "study_one", "study_two", "study_three", "study_four", "study_five"
+    ]
+    keys = ["fold", "fold_log", "p_value", "p_value_log", "significance"]
+    for study in studies:
+        measurements = [
+            metabolite["measurements"][study] for metabolite in records
+        ]
+        for key in keys:
+            columns[study + "_" + key] = utility.collect_value_from_records(
+                key=key, records=measurements
+            )
+    return utility.sort_table_columns(
+        columns=columns,
+        key="reactions_candidacy_count",
         reverse=True
     )
-    return records
 
 
 def convert_reactions_text(reactions=None):
@@ -413,47 +392,40 @@ def convert_reactions_text(reactions=None):
         reactions (dict<dict>): information about reactions
 
     returns:
-        (list<dict>): information about reactions
+        (dict<list>): information about reactions in columns
 
     raises:
 
     """
 
-    records = []
-    for reaction in reactions.values():
-        record = {
-            "identifier": reaction["identifier"],
-            "reaction": reaction["reaction"],
-            "name": reaction["name"],
-            "replicates": ";".join(reaction["replicates"]),
-            "metabolites_candidacy": ";".join(
-                reaction["metabolites_candidacy"]
-            ),
-            "metabolites_candidacy_count": (
-                reaction["metabolites_candidacy_count"]
-            ),
-            "measurement_one_fold": "",
-            "measurement_one_log_fold": "",
-            "measurement_one_p_value": "",
-            "measurement_two_fold": "",
-            "measurement_two_log_fold": "",
-            "measurement_two_p_value": "",
-            "measurement_three_fold": "",
-            "measurement_three_log_fold": "",
-            "measurement_three_p_value": "",
-            "measurement_four_fold": "",
-            "measurement_four_log_fold": "",
-            "measurement_four_p_value": "",
-            "measurement_five_fold": "",
-            "measurement_five_log_fold": "",
-            "measurement_five_p_value": ""
-        }
-        records.append(record)
-    records.sort(
-        key=lambda record: record["metabolites_candidacy_count"],
+    records = list(reactions.values())
+    columns = {}
+    for key in ["identifier", "reaction", "name"]:
+        columns[key] = utility.collect_value_from_records(
+            key=key, records=records
+        )
+    columns["replicates"] = [
+        ";".join(reaction["replicates"]) for reaction in records
+    ]
+    columns["metabolites_candidacy"] = [
+        ";".join(reaction["metabolites_candidacy"]) for reaction in records
+    ]
+    columns["metabolites_candidacy_count"] = (
+        utility.collect_value_from_records(
+            key="metabolites_candidacy_count", records=records
+        )
+    )
+    # Measurements remain empty.
+    measurements = ["one", "two", "three", "four", "five"]
+    for measurement in measurements:
+        for key in ["fold", "log_fold", "p_value"]:
+            name = "measurement_" + measurement + "_" + key
+            columns[name] = [""] * len(records)
+    return utility.sort_table_columns(
+        columns=columns,
+        key="metabolites_candidacy_count",
         reverse=True
     )
-    return records
 
 
 def write_product(directory=None, information=None):
@@ -480,17 +452,15 @@ def write_product(directory=None, information=None):
     # Write information to file.
     with open(path_pickle, "wb") as file_product:
         pickle.dump(information["metabolites_measurement"], file_product)
-    utility.write_file_table(
-        information=information["metabolites_measurement_text"],
+    utility.write_file_table_columns(
+        columns=information["metabolites_measurement_text"],
         path_file=path_metabolites_text,
-        names=information["metabolites_measurement_text"][0].keys(),
         delimiter="\t"
     )
     if False:
-        utility.write_file_table(
-            information=information["reactions_measurement_text"],
+        utility.write_file_table_columns(
+            columns=information["reactions_measurement_text"],
             path_file=path_reactions_text,
-            names=information["reactions_measurement_text"][0].keys(),
             delimiter="\t"
         )
 
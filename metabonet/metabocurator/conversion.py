@@ -143,18 +143,13 @@ def convert_compartments_text(compartments=None):
     raises:
 
     returns:
-        (list<dict>): information about compartments
+        (dict<list>): information about compartments in columns
 
     """
 
-    records = []
-    for compartment in compartments.values():
-        record = {
-            "identifier": compartment["identifier"],
-            "name": compartment["name"]
-        }
-        records.append(record)
-    return records
+    return collect_values_columns(
+        keys=["identifier", "name"], records=list(compartments.values())
+    )
 
 
 def convert_processes_text(processes=None):
@@ -167,18 +162,60 @@ def convert_processes_text(processes=None):
     raises:
 
     returns:
-        (list<dict>): information about processes
+        (dict<list>): information about processes in columns
+
+    """
+
+    return collect_values_columns(
+        keys=["identifier", "name"], records=list(processes.values())
+    )
+
+
+def collect_values_columns(keys=None, records=None):
+    """
+    Collects columns of single values from records.
+
+    arguments:
+        keys (list<str>): keys of values in each record
+        records (list<dict>): sequence of records
+
+    raises:
+
+    returns:
+        (dict<list>): values of each column in order of records
+
+    """
+
+    columns = {}
+    for key in keys:
+        columns[key] = utility.collect_value_from_records(
+            key=key, records=records
+        )
+    return columns
+
+
+def collect_references_columns(keys=None, records=None, delimiter=None):
+    """
+    Collects columns of references from records.
+
+    arguments:
+        keys (list<str>): keys of references in each record
+        records (list<dict>): sequence of records
+        delimiter (str): delimiter between references
+
+    raises:
+
+    returns:
+        (dict<list>): values of each column in order of records
 
     """
 
-    records = []
-    for process in processes.values():
-        record = {
-            "identifier": process["identifier"],
-            "name": process["name"]
-        }
-        records.append(record)
-    return records
+    columns = {}
+    for key in keys:
+        columns["reference_" + key] = [
+            delimiter.join(record["references"][key]) for record in records
+        ]
+    return columns
 
 
 def convert_reactions_text(reactions=None):
@@ -189,67 +226,71 @@ def convert_reactions_text(reactions=None):
         reactions (dict<dict>): information about reactions
 
     returns:
-        (list<dict>): information about reactions
+        (dict<list>): information about reactions in columns
 
     raises:
 
     """
 
-    records = []
-    for reaction in reactions.values():
-        # Participants.
-        compartments = utility.collect_value_from_records(
-            key="compartment", records=reaction["participants"]
-        )
-        compartments_unique = utility.collect_unique_elements(
-            elements_original=compartments
-        )
-        metabolites = utility.collect_value_from_records(
-            key="metabolite", records=reaction["participants"]
-        )
-        metabolites_unique = utility.collect_unique_elements(
-            elements_original=metabolites
-        )
-        # Transports.
-        transport_metabolites = utility.collect_value_from_records(
-            key="metabolite", records=reaction["transports"]
-        )
-        transport_compartments = utility.collect_values_from_records(
-            key="compartments", records=reaction["transports"]
-        )
-        transport_compartments_unique = utility.collect_unique_elements(
-            elements_original=transport_compartments
+    records = list(reactions.values())
+    columns = collect_values_columns(
+        keys=["identifier", "name", "equation"], records=records
+    )
+    # Participants.
+    # Collect unique values in order of first occurrence.
+    columns["metabolites"] = [
+        ";".join(dict.fromkeys(
+            participant["metabolite"]
+            for participant in reaction["participants"]
+        ))
+        for reaction in records
+    ]
+    columns["compartments"] = [
+        ";".join(dict.fromkeys(
+            participant["compartment"]
+            for participant in reaction["participants"]
+        ))
+        for reaction in records
+    ]
+    columns["processes"] = [
+        ";".join(reaction["processes"]) for reaction in records
+    ]
+    columns.update(collect_values_columns(
+        keys=["reversibility", "conversion", "dispersal", "transport"],
+        records=records
+    ))
+    # Transports.
+    columns["transport_metabolites"] = [
+        ";".join(
+            transport["metabolite"] for transport in reaction["transports"]
         )
-        # Compile information.
-        record = {
-            "identifier": reaction["identifier"],
-            "name": reaction["name"],
-            "equation": reaction["equation"],
-            "metabolites": ";".join(metabolites_unique),
-            "compartments": ";".join(compartments_unique),
-            "processes": ";".join(reaction["processes"]),
-            "reversibility": reaction["reversibility"],
-            "conversion": reaction["conversion"],
-            "dispersal": reaction["dispersal"],
-            "transport": reaction["transport"],
-            "transport_metabolites": ";".join(transport_metabolites),
-            "transport_compartments": ";".join(transport_compartments_unique),
-            "replication": reaction["replication"],
-            "replicates": ";".join(reaction["replicates"]),
-            "reference_metanetx": ";".join(reaction["references"]["metanetx"]),
-            "reference_recon2m2": ";".join(reaction["references"]["recon2m2"]),
-            "reference_gene": ";".join(reaction["references"]["gene"]),
-            "reference_enzyme": ";".join(reaction["references"]["enzyme"]),
-            "reference_kegg": ";".join(reaction["references"]["kegg"]),
-            "reference_reactome": ";".join(reaction["references"]["reactome"]),
-            "reference_metacyc": ";".join(reaction["references"]["metacyc"]),
-            "reference_bigg": ";".join(reaction["references"]["bigg"]),
-            "reference_rhea": ";".join(reaction["references"]["rhea"]),
-            "reference_sabiork": ";".join(reaction["references"]["sabiork"]),
-            "reference_seed": ";".join(reaction["references"]["seed"])
-        }
-        records.append(record)
-    return records
+        for reaction in records
+    ]
+    columns["transport_compartments"] = [
+        ";".join(dict.fromkeys(
+            compartment
+            for transport in reaction["transports"]
+            for compartment in transport["compartments"]
+        ))
+        for reaction in records
+    ]
+    # Replication.
+    columns["replication"] = utility.collect_value_from_records(
+        key="replication", records=records
+    )
+    columns["replicates"] = [
+        ";".join(reaction["replicates"]) for reaction in records
+    ]
+    # References.
+    columns.update(collect_references_columns(
+        keys=[
+            "metanetx", "recon2m2", "gene", "enzyme", "kegg", "reactome",
+            "metacyc", "bigg", "rhea", "sabiork", "seed"
+        ],
+        records=records,
+        delimiter=";"
+    ))
+    return columns
 
 
 def convert_reactions_export_text(
@@ -271,82 +312,65 @@ def convert_reactions_export_text(
 
 
     returns:
-        (list<dict>): information about reactions
+        (dict<list>): information about reactions in columns
 
     raises:
 
     """
 
-    records = []
-    for reaction in reactions.values():
-        # Participants.
-        # Write a function to compose identifier (name) human readable...
-        # Compartments
-        compartments_identifiers = utility.collect_value_from_records(
-            key="compartment", records=reaction["participants"]
-        )
-        compartments_identifiers_unique = utility.collect_unique_elements(
-            elements_original=compartments_identifiers
-        )
-        compartments_names = utility.collect_values_from_records_in_reference(
-            key="name",
-            identifiers=compartments_identifiers_unique,
-            reference=compartments,
-        )
-        # Processes
-        processes_names = utility.collect_values_from_records_in_reference(
-            key="name",
-            identifiers=reaction["processes"],
-            reference=processes,
-        )
-        # Metabolites
-        reactants_identifiers = utility.collect_reaction_participants_value(
-            key="metabolite",
-            criteria={"roles": ["reactant"]},
-            participants=reaction["participants"]
-        )
-        reactants_names = utility.collect_values_from_records_in_reference(
-            key="name",
-            identifiers=reactants_identifiers,
-            reference=metabolites,
-        )
-        products_identifiers = utility.collect_reaction_participants_value(
-            key="metabolite",
-            criteria={"roles": ["product"]},
-            participants=reaction["participants"]
-        )
-        products_names = utility.collect_values_from_records_in_reference(
-            key="name",
-            identifiers=products_identifiers,
-            reference=metabolites,
+    # Map identifiers to names once for all reactions.
+    metabolites_names = utility.collect_reference_values(
+        key="name", reference=metabolites
+    )
+    compartments_names = utility.collect_reference_values(
+        key="name", reference=compartments
+    )
+    processes_names = utility.collect_reference_values(
+        key="name", reference=processes
+    )
+    records = list(reactions.values())
+    columns = collect_values_columns(
+        keys=["identifier", "name"], records=records
+    )
+    # Metabolites.
+    for role in ["reactant", "product"]:
+        columns[role + "s"] = [
+            "; ".join(
+                metabolites_names[participant["metabolite"]]
+                for participant in reaction["participants"]
+                if participant["role"] == role
+            )
+            for reaction in records
+        ]
+    # Compartments.
+    columns["compartments"] = [
+        "; ".join(
+            compartments_names[compartment]
+            for compartment in dict.fromkeys(
+                participant["compartment"]
+                for participant in reaction["participants"]
+            )
         )
-        # Compile information.
-        record = {
-            "identifier": reaction["identifier"],
-            "name": reaction["name"],
-            "reactants": "; ".join(reactants_names),
-            "products": "; ".join(products_names),
-            "compartments": "; ".join(compartments_names),
-            "processes": ";".join(processes_names),
-
-            "reversibility": reaction["reversibility"],
-            "reference_metanetx": (
-                "; ".join(reaction["references"]["metanetx"])
-            ),
-            "reference_recon2m2": (
-                "; ".join(reaction["references"]["recon2m2"])
-            ),
-            "reference_gene": "; ".join(reaction["references"]["gene"]),
-            "reference_enzyme": "; ".join(reaction["references"]["enzyme"]),
-            "reference_kegg": "; ".join(reaction["references"]["kegg"]),
-            "reference_reactome": (
-                "; ".join(reaction["references"]["reactome"])
-            ),
-            "reference_metacyc": "; ".join(reaction["references"]["metacyc"]),
-            "reference_bigg": "; ".join(reaction["references"]["bigg"]),
-        }
-        records.append(record)
-    return records
+        for reaction in records
+    ]
+    # Processes.
+    columns["processes"] = [
+        ";".join(processes_names[process] for process in reaction["processes"])
+        for reaction in records
+    ]
+    columns["reversibility"] = utility.collect_value_from_records(
+        key="reversibility", records=records
+    )
+    # References.
+    columns.update(collect_references_columns(
+        keys=[
+            "metanetx", "recon2m2", "gene", "enzyme", "kegg", "reactome",
+            "metacyc", "bigg"
+        ],
+        records=records,
+        delimiter="; "
+    ))
+    return columns
 
 
 def convert_metabolites_text(metabolites=None):
@@ -357,49 +381,174 @@ def convert_metabolites_text(metabolites=None):
         metabolites (dict<dict>): information about metabolites
 
     returns:
-        (list<dict>): information about metabolites
+        (dict<list>): information about metabolites in columns
+
+    raises:
+
+    """
+
+    records = list(metabolites.values())
+    columns = collect_values_columns(
+        keys=["identifier", "name", "formula", "mass", "charge"],
+        records=records
+    )
+    columns.update(collect_references_columns(
+        keys=[
+            "metanetx", "hmdb", "pubchem", "chebi", "bigg", "kegg", "metacyc",
+            "reactome", "lipidmaps", "sabiork", "seed", "slm", "envipath"
+        ],
+        records=records,
+        delimiter=";"
+    ))
+    return columns
+
+
+def write_json_entries(file_product=None, entries=None):
+    """
+    Writes entries of a dictionary to a file in JSON format one entry at a
+    time.
+
+    Text is identical to that from serialization of the complete dictionary.
+
+    arguments:
+        file_product (object): file
+        entries (iterable<tuple<str, object>>): keys and values of entries
+
+    raises:
+
+    returns:
+
+    """
+
+    file_product.write("{")
+    delimiter = ""
+    for key, value in entries:
+        file_product.write(delimiter)
+        file_product.write(json.dumps(key))
+        file_product.write(": ")
+        file_product.write(json.dumps(value))
+        delimiter = ", "
+    file_product.write("}")
+
+
+def write_dymetabonet(path_file=None, information=None):
+    """
+    Writes information about metabolic entities and sets for web applications
+    to a file in JSON format.
+
+    This function writes one entity at a time, so that memory does not hold the
+    complete serialization.
+
+    arguments:
+        path_file (str): path to file
+        information (dict<dict<dict>>): information about metabolic entities
+            and sets
+
+    raises:
+
+    returns:
+
+    """
+
+    with open(path_file, "w") as file_product:
+        file_product.write("{")
+        delimiter = ""
+        for section, entities in information.items():
+            file_product.write(delimiter)
+            file_product.write(json.dumps(section))
+            file_product.write(": ")
+            write_json_entries(
+                file_product=file_product,
+                entries=entities.items()
+            )
+            delimiter = ", "
+        file_product.write("}")
+
+
+def write_dymetabonet_shards(path=None, information=None, shards=None):
+    """
+    Writes information about metabolic entities and sets for web applications
+    to separate files in JSON format, with shards of reactions.
+
+    An index in file "index.json" describes the files for each section, the
+    count of entities in each file, and the shard for each reaction, so that
+    web applications can load sections and reactions as necessary.
+
+    arguments:
+        path (str): directory for files
+        information (dict<dict<dict>>): information about metabolic entities
+            and sets
+        shards (int): count of reactions in each shard, at least 1
 
     raises:
+        (ValueError): count of reactions in each shard is less than 1
+
+    returns:
 
     """
 
-    records = []
-    for metabolite in metabolites.values():
-        record = {
-            "identifier": metabolite["identifier"],
-            "name": metabolite["name"],
-            "formula": metabolite["formula"],
-            "mass": metabolite["mass"],
-            "charge": metabolite["charge"],
-            "reference_metanetx":
-                ";".join(metabolite["references"]["metanetx"]),
-            "reference_hmdb": ";".join(metabolite["references"]["hmdb"]),
-            "reference_pubchem": ";".join(metabolite["references"]["pubchem"]),
-            "reference_chebi": ";".join(metabolite["references"]["chebi"]),
-            "reference_bigg": ";".join(metabolite["references"]["bigg"]),
-            "reference_kegg": ";".join(metabolite["references"]["kegg"]),
-            "reference_metacyc": ";".join(metabolite["references"]["metacyc"]),
-            "reference_reactome":
-                ";".join(metabolite["references"]["reactome"]),
-            "reference_lipidmaps":
-                ";".join(metabolite["references"]["lipidmaps"]),
-            "reference_sabiork": ";".join(metabolite["references"]["sabiork"]),
-            "reference_seed": ";".join(metabolite["references"]["seed"]),
-            "reference_slm": ";".join(metabolite["references"]["slm"]),
-            "reference_envipath":
-                ";".join(metabolite["references"]["envipath"]),
-        }
-        records.append(record)
-    return records
-
-
-def write_product(directory=None, information=None):
+    # Confirm count of reactions in each shard before any change to files.
+    if (shards is None) or (shards < 1):
+        raise ValueError(
+            "count of reactions in each shard must be at least 1"
+        )
+    utility.confirm_path_directory(path)
+    # Remove shards from previous export.
+    for name in os.listdir(path):
+        if name.startswith("reactions_") and name.endswith(".json"):
+            utility.remove_file(os.path.join(path, name))
+    index = {
+        "sections": {},
+        "reactions": {}
+    }
+    # Write sections other than reactions to separate files.
+    for section, entities in information.items():
+        if section != "reactions":
+            name = section + ".json"
+            with open(os.path.join(path, name), "w") as file_product:
+                write_json_entries(
+                    file_product=file_product,
+                    entries=entities.items()
+                )
+            index["sections"][section] = [{
+                "file": name,
+                "count": len(entities)
+            }]
+    # Write reactions to shards.
+    identifiers = list(information["reactions"].keys())
+    index["sections"]["reactions"] = []
+    for start in range(0, len(identifiers), shards):
+        identifiers_shard = identifiers[start:(start + shards)]
+        count = len(index["sections"]["reactions"])
+        name = "reactions_" + str(count) + ".json"
+        with open(os.path.join(path, name), "w") as file_product:
+            write_json_entries(
+                file_product=file_product,
+                entries=(
+                    (identifier, information["reactions"][identifier])
+                    for identifier in identifiers_shard
+                )
+            )
+        for identifier in identifiers_shard:
+            index["reactions"][identifier] = name
+        index["sections"]["reactions"].append({
+            "file": name,
+            "count": len(identifiers_shard)
+        })
+    # Write index.
+    with open(os.path.join(path, "index.json"), "w") as file_product:
+        json.dump(index, file_product)
+
+
+def write_product(directory=None, information=None, shards=None):
     """
     Writes product information to file
 
     arguments:
         directory (str): directory for product files
         information (object): information to write to file
+        shards (int): count of reactions in each shard of information for web
+            applications, or None for no shards
 
     raises:
 
@@ -420,8 +569,16 @@ def write_product(directory=None, information=None):
     path_reactions_text = os.path.join(path, "reactions.tsv")
     path_metabolites_text = os.path.join(path, "metabolites.tsv")
     # Write information to file.
-    with open(path_dymetabonet, "w") as file_product:
-        json.dump(information["dymetabonet"], file_product)
+    write_dymetabonet(
+        path_file=path_dymetabonet,
+        information=information["dymetabonet"]
+    )
+    if shards is not None:
+        write_dymetabonet_shards(
+            path=os.path.join(path, "dymetabonet"),
+            information=information["dymetabonet"],
+            shards=shards
+        )
     with open(path_compartments, "wb") as file_product:
         pickle.dump(information["compartments"], file_product)
     with open(path_processes, "wb") as file_product:
@@ -430,28 +587,24 @@ def write_product(directory=None, information=None):
         pickle.dump(information["reactions"], file_product)
     with open(path_metabolites, "wb") as file_product:
         pickle.dump(information["metabolites"], file_product)
-    utility.write_file_table(
-        information=information["compartments_text"],
+    utility.write_file_table_columns(
+        columns=information["compartments_text"],
         path_file=path_compartments_text,
-        names=information["compartments_text"][0].keys(),
         delimiter="\t"
     )
-    utility.write_file_table(
-        information=information["processes_text"],
+    utility.write_file_table_columns(
+        columns=information["processes_text"],
         path_file=path_processes_text,
-        names=information["processes_text"][0].keys(),
         delimiter="\t"
     )
-    utility.write_file_table(
-        information=information["reactions_text"],
+    utility.write_file_table_columns(
+        columns=information["reactions_text"],
         path_file=path_reactions_text,
-        names=information["reactions_text"][0].keys(),
         delimiter="\t"
     )
-    utility.write_file_table(
-        information=information["metabolites_text"],
+    utility.write_file_table_columns(
+        columns=information["metabolites_text"],
         path_file=path_metabolites_text,
-        names=information["metabolites_text"][0].keys(),
         delimiter="\t"
     )
 
@@ -460,7 +613,7 @@ def write_product(directory=None, information=None):
 # Procedure
 
 
-def execute_procedure(directory=None):
+def execute_procedure(directory=None, shards=None):
     """
     Function to execute module's main behavior.
 
@@ -469,6 +622,8 @@ def execute_procedure(directory=None):
 
     arguments:
         directory (str): path to directory for source and product files
+        shards (int): count of reactions in each shard of information for web
+            applications, or None for no shards
 
     raises:
 
@@ -511,4 +666,4 @@ def execute_procedure(directory=None):
         "metabolites_text": metabolites_text,
     }
     #Write product information to file.
-    write_product(directory=directory, information=information)
+    write_product(directory=directory, information=information, shards=shards)
@@ -639,16 +639,14 @@ def write_product(directory=None, information=None):
         pickle.dump(information["reactions"], file_product)
     with open(path_metabolites, "wb") as file_product:
         pickle.dump(information["metabolites"], file_product)
-    utility.write_file_table(
-        information=information["metabolites_report"],
+    utility.write_file_table_columns(
+        columns=information["metabolites_report"],
         path_file=path_metabolites_report,
-        names=information["metabolites_report"][0].keys(),
         delimiter="\t"
     )
-    utility.write_file_table(
-        information=information["reactions_report"],
+    utility.write_file_table_columns(
+        columns=information["reactions_report"],
         path_file=path_reactions_report,
-        names=information["reactions_report"][0].keys(),
         delimiter="\t"
     )
 
@@ -41,15 +41,12 @@ License:
 # Standard
 import os
 import pickle
-import copy
 
 # Relevant
-import networkx as ntx
 
 # Custom
 import metabonet.utility as utility
-import metabonet.conversion as conversion
-import metabonet.analysis as analysis
+import metabonet.compact as compact
 
 #dir()
 #importlib.reload()
@@ -535,6 +532,9 @@ def select_network_component_elements(
     """
     Determines whether to select the main component of a network.
 
+    The main component is the largest weakly connected component, from
+    disjoint sets of nodes that links connect.
+
     arguments:
         component (bool): whether to select network's main component
         nodes_reactions (dict<dict>): information about reactions' nodes
@@ -550,45 +550,34 @@ def select_network_component_elements(
     """
 
     if component:
-        # Convert information format for export to NetworkX.
-        networkx = conversion.convert_networkx(
-            nodes_reactions=nodes_reactions,
-            nodes_metabolites=nodes_metabolites,
-            links=links
-        )
-        # Instantiate network in NetworkX.
-        network = analysis.instantiate_networkx(
-            nodes=networkx["nodes"],
-            links=networkx["links"]
-        )
-        # Select network's main component.
-        components = ntx.algorithms.components.connected_components(
-            network.to_undirected()
-        )
-        components_sort = sorted(components, key=len, reverse=True)
-        component_main = components_sort[0]
-        # Induce subnetwork for component.
-        subnetwork = ntx.DiGraph.subgraph(network, list(component_main))
-        # Extract identifiers of nodes and links from subnetwork.
+        # Determine network's components from links.
+        # Nodes for reactions precede nodes for metabolites.
         nodes_identifiers = []
-        for node, data in subnetwork.nodes.items():
-            nodes_identifiers.append(data["identifier"])
-        links_identifiers = []
-        for link, data in subnetwork.edges.items():
-            links_identifiers.append(data["identifier"])
-        # Filter nodes and links by identifiers.
-        nodes_reactions_component = utility.filter_entries_identifiers(
-            identifiers=nodes_identifiers,
-            entries_original=nodes_reactions
-        )
-        nodes_metabolites_component = utility.filter_entries_identifiers(
-            identifiers=nodes_identifiers,
-            entries_original=nodes_metabolites
-        )
-        links_component = utility.filter_entries_identifiers(
-            identifiers=links_identifiers,
-            entries_original=links
+        for node in nodes_reactions.values():
+            nodes_identifiers.append(node["identifier"])
+        for node in nodes_metabolites.values():
+            nodes_identifiers.append(node["identifier"])
+        pairs = ((link["source"], link["target"]) for link in links.values())
+        components = utility.collect_disjoint_sets(
+            elements=nodes_identifiers,
+            pairs=pairs
         )
+        # Select network's main component.
+        # The first of multiple largest components has priority.
+        component_main = max(components, key=len)
+        # Filter nodes and links by component.
+        nodes_reactions_component = {}
+        for node in nodes_reactions.values():
+            if node["identifier"] in component_main:
+                nodes_reactions_component[node["identifier"]] = node
+        nodes_metabolites_component = {}
+        for node in nodes_metabolites.values():
+            if node["identifier"] in component_main:
+                nodes_metabolites_component[node["identifier"]] = node
+        links_component = {}
+        for link in links.values():
+            if link["source"] in component_main:
+                links_component[link["identifier"]] = link
         # Compile and return information.
         return {
             "nodes_reactions": nodes_reactions_component,
@@ -604,6 +593,71 @@ def select_network_component_elements(
         }
 
 
+def define_network_elements(
+    component=None,
+    reactions_candidacy=None,
+    metabolites_candidacy=None,
+    reactions=None,
+    metabolites=None,
+    compartments=None,
+    processes=None
+):
+    """
+    Defines information about network's nodes and links.
+
+    arguments:
+        component (bool): whether to select network's main component
+        reactions_candidacy (dict<dict>): information about candidate reactions
+        metabolites_candidacy (dict<dict>): information about candidate
+            metabolites
+        reactions (dict<dict>): information about reactions
+        metabolites (dict<dict>): information about metabolites
+        compartments (dict<dict>): information about compartments
+        processes (dict<dict>): information about processes
+
+    raises:
+
+    returns:
+        (dict<dict<dict>>): information about network's nodes and links
+
+    """
+
+    # Define network's nodes for reactions.
+    nodes_reactions = collect_reactions_nodes(
+        reactions_candidacy=reactions_candidacy,
+        reactions=reactions,
+        metabolites=metabolites,
+        compartments=compartments,
+        processes=processes
+    )
+    # Define network's nodes for metabolites.
+    nodes_metabolites = collect_metabolites_nodes(
+        metabolites_candidacy=metabolites_candidacy,
+        reactions=reactions,
+        metabolites=metabolites,
+        compartments=compartments,
+        processes=processes
+    )
+    # Define network's links.
+    links = collect_links(
+        reactions_candidacy=reactions_candidacy,
+        metabolites_candidacy=metabolites_candidacy
+    )
+    # Determine whether to select network's main component.
+    component_elements = select_network_component_elements(
+        component=component,
+        nodes_reactions=nodes_reactions,
+        nodes_metabolites=nodes_metabolites,
+        links=links,
+    )
+    # Compile and return information.
+    return {
+        "nodes_reactions": component_elements["nodes_reactions"],
+        "nodes_metabolites": component_elements["nodes_metabolites"],
+        "links": component_elements["links"]
+    }
+
+
 def write_product(directory=None, information=None):
     """
     Writes product information to file
@@ -631,6 +685,12 @@ def write_product(directory=None, information=None):
         pickle.dump(information["nodes_metabolites"], file_product)
     with open(path_links, "wb") as file_product:
         pickle.dump(information["links"], file_product)
+    compact.write_compact_network(
+        path=path, network=information["network_compact"]
+    )
+    compact.write_network_store(
+        path=path, network=information["network_compact"]
+    )
 
 
 ###############################################################################
@@ -658,39 +718,21 @@ def execute_procedure(
 
     # Read source information from file.
     source = read_source(directory=directory)
-    # Define network's nodes for reactions.
-    nodes_reactions = collect_reactions_nodes(
+    # Define network's nodes and links.
+    information = define_network_elements(
+        component=component,
         reactions_candidacy=source["reactions_candidacy"],
-        reactions=source["reactions"],
-        metabolites=source["metabolites"],
-        compartments=source["compartments"],
-        processes=source["processes"]
-    )
-    # Define network's nodes for metabolites.
-    nodes_metabolites = collect_metabolites_nodes(
         metabolites_candidacy=source["metabolites_candidacy"],
         reactions=source["reactions"],
         metabolites=source["metabolites"],
         compartments=source["compartments"],
         processes=source["processes"]
     )
-    # Define network's links.
-    links = collect_links(
-        reactions_candidacy=source["reactions_candidacy"],
-        metabolites_candidacy=source["metabolites_candidacy"]
+    # Define compact representation of network.
+    information["network_compact"] = compact.define_compact_network(
+        nodes_reactions=information["nodes_reactions"],
+        nodes_metabolites=information["nodes_metabolites"],
+        links=information["links"]
     )
-    # Determine whether to select network's main component.
-    component_elements = select_network_component_elements(
-        component=component,
-        nodes_reactions=nodes_reactions,
-        nodes_metabolites=nodes_metabolites,
-        links=links,
-    )
-    # Compile information.
-    information = {
-        "nodes_reactions": component_elements["nodes_reactions"],
-        "nodes_metabolites": component_elements["nodes_metabolites"],
-        "links": component_elements["links"]
-    }
     #Write product information to file.
     write_product(directory=directory, information=information)
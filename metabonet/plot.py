@@ -82,16 +82,16 @@ def read_source(directory=None):
     path_false_false = os.path.join(directory, "compartments-false_hubs-false")
     # Nodes.
     path_nodes_one = os.path.join(
-        path_true_true, "analysis", "nodes_metabolites.pickle"
+        path_true_true, "analysis", "nodes_metabolites.npz"
     )
     path_nodes_two = os.path.join(
-        path_true_false, "analysis", "nodes_metabolites.pickle"
+        path_true_false, "analysis", "nodes_metabolites.npz"
     )
     path_nodes_three = os.path.join(
-        path_false_true, "analysis", "nodes_metabolites.pickle"
+        path_false_true, "analysis", "nodes_metabolites.npz"
     )
     path_nodes_four = os.path.join(
-        path_false_false, "analysis", "nodes_metabolites.pickle"
+        path_false_false, "analysis", "nodes_metabolites.npz"
     )
     # Measurements.
     path_measurement = os.path.join(directory, "measurement")
@@ -108,14 +108,10 @@ def read_source(directory=None):
     )
     # Read information from file.
     # Nodes.
-    with open(path_nodes_one, "rb") as file_source:
-        nodes_one = pickle.load(file_source)
-    with open(path_nodes_two, "rb") as file_source:
-        nodes_two = pickle.load(file_source)
-    with open(path_nodes_three, "rb") as file_source:
-        nodes_three = pickle.load(file_source)
-    with open(path_nodes_four, "rb") as file_source:
-        nodes_four = pickle.load(file_source)
+    nodes_one = utility.read_file_table_array(path_file=path_nodes_one)
+    nodes_two = utility.read_file_table_array(path_file=path_nodes_two)
+    nodes_three = utility.read_file_table_array(path_file=path_nodes_three)
+    nodes_four = utility.read_file_table_array(path_file=path_nodes_four)
     # Measurements.
     with open(path_measurements_one, "rb") as file_source:
         measurements_one = pickle.load(file_source)
@@ -286,10 +282,10 @@ def plot_degrees(
     nodes.
 
     arguments:
-        nodes_one (dict<dict>): information about nodes
-        nodes_two (dict<dict>): information about nodes
-        nodes_three (dict<dict>): information about nodes
-        nodes_four (dict<dict>): information about nodes
+        nodes_one (object): structured array of information about nodes
+        nodes_two (object): structured array of information about nodes
+        nodes_three (object): structured array of information about nodes
+        nodes_four (object): structured array of information about nodes
         fonts (dict<object>): references to definitions of font properties
         colors (dict<tuple>): references to definitions of color properties
 
@@ -330,8 +326,10 @@ def plot_degree_distributions(
     nodes.
 
     arguments:
-        nodes_hubs_yes (dict<dict>): information about metabolites' nodes
-        nodes_hubs_no (dict<dict>): information about metabolites' nodes
+        nodes_hubs_yes (object): structured array of information about
+            metabolites' nodes
+        nodes_hubs_no (object): structured array of information about
+            metabolites' nodes
         fonts (dict<object>): references to definitions of font properties
         colors (dict<tuple>): references to definitions of color properties
 
@@ -342,14 +340,8 @@ def plot_degree_distributions(
 
     """
 
-    series_one = utility.collect_value_from_records(
-        key="degree",
-        records=nodes_hubs_yes.values()
-    )
-    series_two = utility.collect_value_from_records(
-        key="degree",
-        records=nodes_hubs_no.values()
-    )
+    series_one = nodes_hubs_yes["degree"].tolist()
+    series_two = nodes_hubs_no["degree"].tolist()
     chart_degrees = plot_two_distributions_histograms(
         series_one=series_one,
         series_two=series_two,
@@ -473,10 +465,10 @@ def plot_ranks(
 
     arguments:
         count (int): count of nodes to include in summary
-        nodes_one (dict<dict>): information about nodes
-        nodes_two (dict<dict>): information about nodes
-        nodes_three (dict<dict>): information about nodes
-        nodes_four (dict<dict>): information about nodes
+        nodes_one (object): structured array of information about nodes
+        nodes_two (object): structured array of information about nodes
+        nodes_three (object): structured array of information about nodes
+        nodes_four (object): structured array of information about nodes
         fonts (dict<object>): references to definitions of font properties
         colors (dict<tuple>): references to definitions of color properties
 
@@ -537,7 +529,7 @@ def plot_nodes_ranks(
     arguments:
         color (int): specific color to use
         count (int): count of nodes to include in summary
-        nodes (dict<dict>): information about nodes
+        nodes (object): structured array of information about nodes
         fonts (dict<object>): references to definitions of font properties
         colors (dict<tuple>): references to definitions of color properties
 
@@ -571,7 +563,7 @@ def prepare_ranks_summary(
 
     arguments:
         count (int): count of metabolites' nodes to include in summary
-        nodes (dict<dict>): information about nodes
+        nodes (object): structured array of information about nodes
 
     raises:
 
@@ -580,34 +572,22 @@ def prepare_ranks_summary(
 
     """
 
+    # Filter nodes by total rank.
+    selection = nodes[nodes["rank"] < (count + 1)]
+    # Sort nodes by total rank.
+    selection = selection[numpy.argsort(selection["rank"], kind="stable")]
     # Extract relevant information.
-    summary_raw = []
-    for node in nodes.values():
-        identifier = node["identifier"]
-        name = node["name"]
-        rank_total = node["rank"]
-        rank_degree = node["rank_centrality_degree"]
-        rank_betweenness = node["rank_centrality_betweenness"]
+    summary = []
+    for node in selection:
         record = {
-            "identifier": identifier,
-            "name": name,
-            "rank_total": rank_total,
-            "rank_degree": rank_degree,
-            "rank_betweenness": rank_betweenness
+            "identifier": str(node["identifier"]),
+            "name": str(node["name"]),
+            "rank_total": int(node["rank"]),
+            "rank_degree": int(node["rank_centrality_degree"]),
+            "rank_betweenness": int(node["rank_centrality_betweenness"])
         }
-        summary_raw.append(record)
-    # Sort summary by total rank.
-    summary_sort = sorted(
-        summary_raw,
-        key=lambda record: record["rank_total"],
-        reverse=False
-    )
-    # Filter summary by total rank.
-    summary_filter = list(filter(
-        lambda record: record["rank_total"] < (count + 1),
-        summary_sort
-    ))
-    return summary_filter
+        summary.append(record)
+    return summary
 
 
 def plot_three_ranks_parallel_coordinates(
@@ -737,10 +717,10 @@ def plot_names(
 
     arguments:
         count (int): count of names to include
-        nodes_one (dict<dict>): information about nodes
-        nodes_two (dict<dict>): information about nodes
-        nodes_three (dict<dict>): information about nodes
-        nodes_four (dict<dict>): information about nodes
+        nodes_one (object): structured array of information about nodes
+        nodes_two (object): structured array of information about nodes
+        nodes_three (object): structured array of information about nodes
+        nodes_four (object): structured array of information about nodes
 
     raises:
 
@@ -783,7 +763,7 @@ def plot_names_clouds(
 
     arguments:
         count (int): count of names to include
-        nodes (dict<dict>): information about nodes
+        nodes (object): structured array of information about nodes
 
     raises:
 
@@ -794,13 +774,12 @@ def plot_names_clouds(
 
     # Determine frequencies of names.
     names_frequencies = {}
-    for record in nodes.values():
-        name = record["name"]
+    for name, degree in zip(nodes["name"].tolist(), nodes["degree"].tolist()):
         # TODO: I can't just use "rank" here because highest rank is 1...
         # TODO: I need a representation of rank that is true to the
         # TODO: distribution of degree and betweenness centrality...
         # TODO: Or I can just use degree for now.
-        frequency = record["degree"]
+        frequency = degree
         names_frequencies[name] = frequency
     # Create word cloud.
     chart_names = wordcloud.WordCloud(
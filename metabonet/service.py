@@ -0,0 +1,565 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to answer queries about the neighborhoods
+# of metabolites in a network from a persistent local service.
+# The service reads the network and model once and keeps indices of
+# metabolites' neighbors, reactions' compartments, and reactions' processes
+# in memory.
+# The service listens on a Unix socket and exchanges requests and responses
+# as single lines of JSON.
+
+# Request
+# {"query": "all", "metabolites": ["NADP", "M7_C1"]}
+# Response
+# {"status": "success", "results": [{"metabolite": "NADP", ...}, ...]}
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import json
+import socket
+import signal
+import asyncio
+
+# Relevant
+
+# Custom
+import metabonet.analysis as analysis
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Kinds of queries and the information that each includes.
+queries = {
+    "reactions": ["reactions"],
+    "compartments": ["compartments"],
+    "processes": ["processes"],
+    "all": ["reactions", "compartments", "processes"]
+}
+
+
+def define_socket_path(directory=None, path_network=None):
+    """
+    Defines path to the socket of the service.
+
+    Paths to Unix sockets have a maximal length of about 100 characters.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        path_network (str): directory of network's files, or None for the
+            network in the directory for source and product files
+
+    raises:
+
+    returns:
+        (str): path to socket
+
+    """
+
+    if path_network is None:
+        path_network = os.path.join(directory, "network")
+    return os.path.join(path_network, "query.socket")
+
+
+def define_query_index(source=None):
+    """
+    Defines indices for queries about neighborhoods of metabolites.
+
+    Links between nodes for metabolites and reactions determine neighbors and
+    metabolites' roles in these reactions, regardless of direction.
+
+    arguments:
+        source (dict): source information about model and network
+
+    raises:
+
+    returns:
+        (dict<dict>): indices for queries
+
+    """
+
+    # Index names of compartments and processes.
+    compartments = {
+        identifier: record["name"]
+        for identifier, record in source["compartments"].items()
+    }
+    processes = {
+        identifier: record["name"]
+        for identifier, record in source["processes"].items()
+    }
+    # Index nodes for metabolites by their own identifiers, by metabolites'
+    # identifiers, and by metabolites' names.
+    nodes = {}
+    entities = {}
+    names = {}
+    for identifier, record in source["nodes_metabolites"].items():
+        nodes[identifier] = {
+            "identifier": identifier,
+            "entity": record["entity"],
+            "name": record["name"]
+        }
+        entities.setdefault(record["entity"], []).append(identifier)
+    for entity in entities:
+        if entity in source["metabolites"]:
+            name = source["metabolites"][entity]["name"].lower()
+            names.setdefault(name, []).append(entity)
+    # Index details of reactions' nodes.
+    reactions = {}
+    for identifier, record in source["nodes_reactions"].items():
+        reaction = source["reactions"][record["entity"]]
+        compartments_reaction = dict.fromkeys(
+            participant["compartment"]
+            for participant in reaction["participants"]
+        )
+        reactions[identifier] = {
+            "identifier": identifier,
+            "name": record["name"],
+            "compartments": [
+                compartment for compartment in compartments_reaction
+                if compartment is not None
+            ],
+            "processes": list(reaction["processes"])
+        }
+    # Index neighbors of metabolites' nodes with roles in reactions.
+    neighbors = {identifier: {} for identifier in nodes}
+    for link in source["links"]:
+        source_link, target_link, attributes = link
+        if source_link in nodes:
+            metabolite, reaction = source_link, target_link
+        else:
+            metabolite, reaction = target_link, source_link
+        roles = neighbors[metabolite].setdefault(reaction, [])
+        if attributes["role"] not in roles:
+            roles.append(attributes["role"])
+    # Compile information.
+    return {
+        "nodes": nodes,
+        "entities": entities,
+        "names": names,
+        "neighbors": neighbors,
+        "reactions": reactions,
+        "compartments": compartments,
+        "processes": processes
+    }
+
+
+def determine_metabolite_nodes(metabolite=None, index=None):
+    """
+    Determines nodes that represent a metabolite.
+
+    A metabolite is the identifier of a node, the identifier of a metabolite,
+    or the name of a metabolite regardless of case.
+
+    arguments:
+        metabolite (str): identifier or name of a metabolite or its node
+        index (dict<dict>): indices for queries
+
+    raises:
+
+    returns:
+        (list<str>): identifiers of metabolite's nodes
+
+    """
+
+    if metabolite in index["nodes"]:
+        return [metabolite]
+    elif metabolite in index["entities"]:
+        return list(index["entities"][metabolite])
+    else:
+        nodes = []
+        for entity in index["names"].get(metabolite.lower(), []):
+            nodes.extend(index["entities"][entity])
+        return nodes
+
+
+def query_metabolite(metabolite=None, query=None, index=None):
+    """
+    Queries the neighborhood of a metabolite.
+
+    arguments:
+        metabolite (str): identifier or name of a metabolite or its node
+        query (str): kind of query, "reactions", "compartments", "processes",
+            or "all"
+        index (dict<dict>): indices for queries
+
+    raises:
+
+    returns:
+        (dict): information about metabolite's neighborhood
+
+    """
+
+    nodes = determine_metabolite_nodes(metabolite=metabolite, index=index)
+    # Collect neighbors of all nodes with their roles.
+    reactions = {}
+    for node in nodes:
+        for reaction, roles in index["neighbors"][node].items():
+            roles_reaction = reactions.setdefault(reaction, [])
+            roles_reaction.extend(
+                role for role in roles if role not in roles_reaction
+            )
+    # Collect compartments and processes of neighbors.
+    compartments = {}
+    processes = {}
+    for reaction in reactions:
+        for compartment in index["reactions"][reaction]["compartments"]:
+            compartments[compartment] = index["compartments"].get(compartment)
+        for process in index["reactions"][reaction]["processes"]:
+            processes[process] = index["processes"].get(process)
+    # Compile information.
+    information = {
+        "metabolite": metabolite,
+        "nodes": nodes
+    }
+    if "reactions" in queries[query]:
+        information["reactions"] = [
+            {
+                "identifier": reaction,
+                "name": index["reactions"][reaction]["name"],
+                "roles": roles
+            }
+            for reaction, roles in reactions.items()
+        ]
+    if "compartments" in queries[query]:
+        information["compartments"] = [
+            {"identifier": identifier, "name": name}
+            for identifier, name in compartments.items()
+        ]
+    if "processes" in queries[query]:
+        information["processes"] = [
+            {"identifier": identifier, "name": name}
+            for identifier, name in processes.items()
+        ]
+    return information
+
+
+def respond_request(request=None, index=None):
+    """
+    Responds to a request for queries about metabolites.
+
+    arguments:
+        request (dict): request with kind of query and list of metabolites
+        index (dict<dict>): indices for queries
+
+    raises:
+
+    returns:
+        (dict): response with status and results of queries or message
+
+    """
+
+    # Verify request.
+    if not isinstance(request, dict):
+        return {"status": "error", "message": "request is not an object"}
+    query = request.get("query", "all")
+    metabolites = request.get("metabolites")
+    if query not in queries:
+        return {"status": "error", "message": "unknown query: " + str(query)}
+    if (
+        (not isinstance(metabolites, list)) or
+        (not all(isinstance(metabolite, str) for metabolite in metabolites))
+    ):
+        return {
+            "status": "error",
+            "message": "metabolites are not a list of text"
+        }
+    # Query metabolites.
+    results = [
+        query_metabolite(metabolite=metabolite, query=query, index=index)
+        for metabolite in metabolites
+    ]
+    return {"status": "success", "results": results}
+
+
+async def serve_connection(reader=None, writer=None, index=None):
+    """
+    Serves requests from a single connection to the service.
+
+    Each line from the client is a request, and each line to the client is a
+    response.
+
+    arguments:
+        reader (object): stream from client
+        writer (object): stream to client
+        index (dict<dict>): indices for queries
+
+    raises:
+
+    returns:
+
+    """
+
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"status": "error", "message": "invalid JSON"}
+            else:
+                response = respond_request(request=request, index=index)
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_queries(path=None, index=None):
+    """
+    Serves queries on a Unix socket until interruption or termination.
+
+    arguments:
+        path (str): path to socket
+        index (dict<dict>): indices for queries
+
+    raises:
+
+    returns:
+
+    """
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_stop in [signal.SIGINT, signal.SIGTERM]:
+        loop.add_signal_handler(signal_stop, stop.set)
+    server = await asyncio.start_unix_server(
+        lambda reader, writer: serve_connection(
+            reader=reader, writer=writer, index=index
+        ),
+        path=path
+    )
+    print("... query service listening on " + path + " ...")
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        print("... query service stopped ...")
+
+
+def confirm_socket_available(path=None):
+    """
+    Confirms that no other service listens on a socket.
+
+    Removes the file of a socket that remains from a service that stopped
+    abruptly.
+
+    arguments:
+        path (str): path to socket
+
+    raises:
+        (ValueError): another service listens on the socket
+
+    returns:
+
+    """
+
+    if not os.path.exists(path):
+        return
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.remove(path)
+    else:
+        raise ValueError("query service already listens on " + path)
+    finally:
+        connection.close()
+
+
+def query_service(path=None, metabolites=None, query=None):
+    """
+    Queries a running service about the neighborhoods of metabolites.
+
+    arguments:
+        path (str): path to socket
+        metabolites (list<str>): identifiers or names of metabolites or their
+            nodes
+        query (str): kind of query, "reactions", "compartments", "processes",
+            or "all", or None for "all"
+
+    raises:
+        (ValueError): service reports an error
+
+    returns:
+        (list<dict>): information about metabolites' neighborhoods
+
+    """
+
+    if query is None:
+        query = "all"
+    request = {"query": query, "metabolites": list(metabolites)}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as stream:
+            response = json.loads(stream.readline())
+    if response["status"] != "success":
+        raise ValueError("query service error: " + response["message"])
+    return response["results"]
+
+
+def report_results(results=None):
+    """
+    Prints information about metabolites' neighborhoods.
+
+    arguments:
+        results (list<dict>): information about metabolites' neighborhoods
+
+    raises:
+
+    returns:
+
+    """
+
+    for result in results:
+        print("--------------------------------------------------")
+        print(
+            result["metabolite"] + ": " + str(len(result["nodes"])) +
+            " nodes " + ";".join(result["nodes"])
+        )
+        if "reactions" in result:
+            print("reactions: " + str(len(result["reactions"])))
+            for reaction in result["reactions"]:
+                print(
+                    "    " + reaction["identifier"] + "\t" +
+                    str(reaction["name"]) + "\t" + ";".join(reaction["roles"])
+                )
+        for key in ["compartments", "processes"]:
+            if key in result:
+                print(key + ": " + str(len(result[key])))
+                for record in result[key]:
+                    print(
+                        "    " + record["identifier"] + "\t" +
+                        str(record["name"])
+                    )
+
+
+###############################################################################
+# Procedure
+
+
+def execute_procedure(directory=None, path_network=None, path_socket=None):
+    """
+    Function to execute module's main behavior.
+
+    The purpose of this procedure is to serve queries about neighborhoods of
+    metabolites until interruption or termination.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        path_network (str): directory of network's files, or None for the
+            network in the directory for source and product files
+        path_socket (str): path to socket, or None for a socket in the
+            directory of network's files
+
+    raises:
+
+    returns:
+
+    """
+
+    if path_socket is None:
+        path_socket = define_socket_path(
+            directory=directory, path_network=path_network
+        )
+    confirm_socket_available(path=path_socket)
+    # Read source information from file.
+    source = analysis.read_source(
+        directory=directory, path_network=path_network, complete=True
+    )
+    # Define indices for queries.
+    index = define_query_index(source=source)
+    print(
+        "... indexed " + str(len(index["nodes"])) + " metabolites' nodes " +
+        "and " + str(len(index["reactions"])) + " reactions' nodes ..."
+    )
+    # Serve queries.
+    asyncio.run(serve_queries(path=path_socket, index=index))
+
+
+def execute_query(
+    directory=None,
+    path_network=None,
+    path_socket=None,
+    metabolites=None,
+    query=None
+):
+    """
+    Function to query a running service and report results.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        path_network (str): directory of network's files, or None for the
+            network in the directory for source and product files
+        path_socket (str): path to socket, or None for a socket in the
+            directory of network's files
+        metabolites (list<str>): identifiers or names of metabolites or their
+            nodes
+        query (str): kind of query, "reactions", "compartments", "processes",
+            or "all", or None for "all"
+
+    raises:
+
+    returns:
+
+    """
+
+    if path_socket is None:
+        path_socket = define_socket_path(
+            directory=directory, path_network=path_network
+        )
+    results = query_service(
+        path=path_socket, metabolites=metabolites, query=query
+    )
+    report_results(results=results)
+
+
+if (__name__ == "__main__"):
+    execute_procedure()
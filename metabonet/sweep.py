@@ -0,0 +1,344 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to compare networks from alternative
+# definitions of simplification of hub metabolites.
+# Each configuration follows the same steps as the procedures for candidacy,
+# network, and analysis, but it calls their functions in memory rather than
+# the procedures themselves, so that configurations write no intermediate
+# products and share a single reading of the model in each worker process.
+# Simplification is always relevant, since each configuration is a table of
+# simplification. Analysis within each configuration is serial, as worker
+# processes cannot create their own pools of processes.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import multiprocessing
+
+# Relevant
+
+# Custom
+import metabonet.utility as utility
+import metabonet.candidacy as candidacy
+import metabonet.network as network
+import metabonet.conversion as conversion
+import metabonet.analysis as analysis
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Source information that each worker process reads once.
+reference_sweep = {}
+
+
+def read_source_configurations(path=None):
+    """
+    Reads and organizes information about alternative configurations of
+    simplification from file.
+
+    Each file with suffix ".tsv" in the directory is a table of simplification
+    of metabolites with the same format as "simplification_metabolites.tsv".
+
+    arguments:
+        path (str): path to directory of alternative tables of simplification
+            of metabolites
+
+    raises:
+
+    returns:
+        (list<dict>): information about configurations
+
+    """
+
+    configurations = []
+    for name_file in sorted(os.listdir(path)):
+        if name_file.endswith(".tsv"):
+            record = {
+                "name": name_file[:-len(".tsv")],
+                "path": os.path.join(path, name_file)
+            }
+            configurations.append(record)
+    return configurations
+
+
+def initialize_worker(directory=None):
+    """
+    Reads source information about the model within a worker process.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+
+    """
+
+    reference_sweep["source"] = candidacy.read_source(directory=directory)
+
+
+def execute_configuration(
+    configuration=None,
+    compartmentalization=None,
+    component=None,
+    references=None,
+    tolerance=None
+):
+    """
+    Defines and analyzes a network for a configuration of simplification.
+
+    arguments:
+        configuration (dict): information about a configuration
+        compartmentalization (bool): whether compartmentalization is relevant
+        component (bool): whether to select network's main component
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+
+    raises:
+
+    returns:
+        (list<dict>): information about network relevant to each bipartite
+            set of nodes
+
+    """
+
+    source = reference_sweep["source"]
+    simplification_metabolites = utility.read_file_table(
+        path_file=configuration["path"],
+        names=None,
+        delimiter="\t"
+    )
+    # Prepare reference information for evaluation of candidacy.
+    reference = candidacy.prepare_candidacy_reference(
+        reactions=source["reactions"],
+        filtration_compartments=source["filtration_compartments"],
+        filtration_processes=source["filtration_processes"],
+        simplification_reactions=source["simplification_reactions"],
+        simplification_metabolites=simplification_metabolites
+    )
+    # Evaluate candidacy of reactions and metabolites.
+    information_candidacy = candidacy.collect_candidacy(
+        source=source,
+        reference=reference,
+        compartmentalization=compartmentalization,
+        simplification=True
+    )
+    # Define network's nodes and links.
+    information_network = network.define_network_elements(
+        component=component,
+        reactions_candidacy=information_candidacy["reactions"],
+        metabolites_candidacy=information_candidacy["metabolites"],
+        reactions=source["reactions"],
+        metabolites=source["metabolites"],
+        compartments=source["compartments"],
+        processes=source["processes"]
+    )
+    # Analyze network.
+    networkx = conversion.convert_networkx(
+        nodes_reactions=information_network["nodes_reactions"],
+        nodes_metabolites=information_network["nodes_metabolites"],
+        links=information_network["links"]
+    )
+    network_instance = analysis.instantiate_networkx(
+        nodes=networkx["nodes"],
+        links=networkx["links"]
+    )
+    report = analysis.analyze_bipartite_network(
+        network=network_instance,
+        nodes_reactions=networkx["nodes_reactions_identifiers"],
+        nodes_metabolites=networkx["nodes_metabolites_identifiers"],
+        references=references,
+        tolerance=tolerance
+    )
+    # Compile and return information.
+    records = []
+    for set_nodes in ["reactions", "metabolites"]:
+        record = {
+            "configuration": configuration["name"],
+            "set": set_nodes
+        }
+        record.update(report[set_nodes])
+        records.append(record)
+    print("... completed configuration: " + configuration["name"] + " ...")
+    return records
+
+
+def execute_configuration_worker(parameters=None):
+    """
+    Defines and analyzes a network for a configuration within a worker
+    process.
+
+    arguments:
+        parameters (dict): parameters for configuration
+
+    raises:
+
+    returns:
+        (list<dict>): information about network relevant to each bipartite
+            set of nodes
+
+    """
+
+    return execute_configuration(
+        configuration=parameters["configuration"],
+        compartmentalization=parameters["compartmentalization"],
+        component=parameters["component"],
+        references=parameters["references"],
+        tolerance=parameters["tolerance"]
+    )
+
+
+def write_product(directory=None, information=None):
+    """
+    Writes product information to file
+
+    arguments:
+        directory (str): directory for product files
+        information (object): information to write to file
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    path = os.path.join(directory, "sweep")
+    utility.confirm_path_directory(path)
+    path_comparison = os.path.join(path, "comparison.tsv")
+    # Write information to file.
+    utility.write_file_table(
+        information=information["comparison"],
+        path_file=path_comparison,
+        names=information["comparison"][0].keys(),
+        delimiter="\t"
+    )
+
+
+###############################################################################
+# Procedure
+
+
+def execute_procedure(
+    path_configurations=None,
+    compartmentalization=None,
+    component=None,
+    references=None,
+    tolerance=None,
+    processes=None,
+    directory=None
+):
+    """
+    Function to execute module's main behavior.
+
+    The purpose of this procedure is to evaluate candidacy, to define network,
+    and to analyze network for each of multiple alternative configurations of
+    simplification of metabolites, and to compare metrics of these networks.
+
+    Each worker process reads the model only once for all configurations that
+    it executes.
+
+    arguments:
+        path_configurations (str): path to directory of alternative tables of
+            simplification of metabolites
+        compartmentalization (bool): whether compartmentalization is relevant
+        component (bool): whether to select network's main component
+        references (int): count of random reference networks for small-world
+            coefficient, or initial count if tolerance is not None
+        tolerance (float): maximal relative standard error of reference
+            networks' mean properties, or None for a fixed count
+        processes (int): count of parallel worker processes
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+
+    """
+
+    # Read source information from file.
+    configurations = read_source_configurations(path=path_configurations)
+    # Define parameters for configurations.
+    parameters = []
+    for configuration in configurations:
+        record = {
+            "configuration": configuration,
+            "compartmentalization": compartmentalization,
+            "component": component,
+            "references": references,
+            "tolerance": tolerance
+        }
+        parameters.append(record)
+    if len(parameters) == 0:
+        print("... no configurations to evaluate ...")
+        return
+    # Define and analyze networks.
+    if (processes is not None) and (processes > 1):
+        with multiprocessing.Pool(
+            processes=min(processes, len(parameters)),
+            initializer=initialize_worker,
+            initargs=(directory,)
+        ) as pool:
+            reports = pool.map(execute_configuration_worker, parameters)
+    else:
+        initialize_worker(directory=directory)
+        reports = []
+        for record in parameters:
+            reports.append(execute_configuration_worker(parameters=record))
+    # Compile information.
+    comparison = []
+    for records in reports:
+        comparison.extend(records)
+    information = {
+        "comparison": comparison
+    }
+    #Write product information to file.
+    write_product(directory=directory, information=information)
+
+
+if (__name__ == "__main__"):
+    execute_procedure()
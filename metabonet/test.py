@@ -35,14 +35,42 @@ License:
 ###############################################################################
 # Notes
 
+# The purpose of this module is to test metrics of networks from matrices of
+# adjacency against the same metrics from NetworkX on small random networks,
+# and to test incremental evaluation of candidacy against complete evaluation
+# on a small random model.
+# Tests are functions with names that begin with "test_", so that both the
+# procedure of this module and pytest can execute them.
+
 ###############################################################################
 # Installation and importation
 
 # Standard
+import os
+import math
+import random
+import pickle
+import tempfile
+import shutil
+import copy
+import gzip
+import json
 
 # Relevant
+import numpy
+import networkx as ntx
 
 # Custom
+import metabonet.utility as utility
+import metabonet.topology as topology
+import metabonet.analysis as analysis
+import metabonet.candidacy as candidacy
+import metabonet.sweep as sweep
+import metabonet.network as network
+import metabonet.conversion as conversion
+import metabonet.metabocurator.conversion as metabocurator_conversion
+import metabonet.cache as cache
+import metabonet.service as service
 
 #dir()
 #importlib.reload()
@@ -50,6 +78,1458 @@ License:
 ###############################################################################
 # Functionality
 
+
+def define_random_network(seed=None, bipartite=None):
+    """
+    Defines a small random directional network.
+
+    Bipartite networks have links only between nodes in different sets, in
+    either direction. Other networks have links between any nodes, including
+    links from nodes to themselves.
+
+    arguments:
+        seed (int): seed for random generator
+        bipartite (bool): whether network is bipartite
+
+    raises:
+
+    returns:
+        (dict): instance of network in NetworkX, identifiers of nodes in
+            each bipartite set, and matrix of adjacency
+
+    """
+
+    generator = random.Random(seed)
+    nodes_top = [
+        "top_" + str(index) for index in range(generator.randint(2, 30))
+    ]
+    nodes_bottom = [
+        "bottom_" + str(index) for index in range(generator.randint(2, 30))
+    ]
+    network = ntx.DiGraph()
+    network.add_nodes_from(nodes_top + nodes_bottom)
+    for index in range(generator.randint(0, 120)):
+        if bipartite:
+            top = generator.choice(nodes_top)
+            bottom = generator.choice(nodes_bottom)
+            if generator.random() < 0.5:
+                network.add_edge(top, bottom)
+            else:
+                network.add_edge(bottom, top)
+        else:
+            network.add_edge(
+                generator.choice(nodes_top + nodes_bottom),
+                generator.choice(nodes_top + nodes_bottom)
+            )
+    return {
+        "network": network,
+        "nodes_top": nodes_top,
+        "nodes_bottom": nodes_bottom,
+        "adjacency": topology.define_network_adjacency(network=network)
+    }
+
+
+def confirm_values_close(values=None, references=None):
+    """
+    Confirms that values for nodes match references within rounding.
+
+    arguments:
+        values (dict<float>): values for nodes
+        references (dict<float>): reference values for nodes
+
+    raises:
+
+    returns:
+
+    """
+
+    for node in references.keys():
+        assert math.isclose(
+            values[node], references[node], rel_tol=1E-9, abs_tol=1E-12
+        ), (node, values[node], references[node])
+
+
+def test_closeness_centrality():
+    """
+    Tests bipartite closeness centralities against NetworkX.
+
+    As in the original bipartite closeness centrality of MetaboNet,
+    normalization to the order of each node's component applies only to nodes
+    in the focal bipartite set, whereas NetworkX applies it to nodes in both
+    sets.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=True)
+        for nodes in (network["nodes_top"], network["nodes_bottom"]):
+            adjacency = topology.define_network_adjacency(
+                network=network["network"]
+            )
+            values = topology.calculate_bipartite_closeness_centrality(
+                adjacency=adjacency, nodes=nodes, normalized=True
+            )
+            references = ntx.algorithms.bipartite.closeness_centrality(
+                network["network"], nodes, normalized=True
+            )
+            references_other = ntx.algorithms.bipartite.closeness_centrality(
+                network["network"], nodes, normalized=False
+            )
+            members = set(nodes)
+            for node in references_other.keys():
+                if node not in members:
+                    references[node] = references_other[node]
+            confirm_values_close(values=values, references=references)
+
+
+def test_betweenness_centrality():
+    """
+    Tests exact betweenness centralities against NetworkX.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=(seed % 2 == 0))
+        # Non-normal betweenness of any network.
+        values = topology.determine_betweenness(
+            adjacency=network["adjacency"]
+        ).tolist()
+        references = ntx.algorithms.centrality.betweenness_centrality(
+            network["network"], normalized=False
+        )
+        confirm_values_close(
+            values=dict(zip(network["adjacency"]["identifiers"], values)),
+            references=references
+        )
+        # Betweenness with parallel worker processes.
+        adjacency = topology.define_network_adjacency(
+            network=network["network"]
+        )
+        values = topology.determine_betweenness(
+            adjacency=adjacency, processes=2
+        ).tolist()
+        confirm_values_close(
+            values=dict(zip(adjacency["identifiers"], values)),
+            references=references
+        )
+        # Bipartite betweenness.
+        if seed % 2 == 0:
+            for nodes in (network["nodes_top"], network["nodes_bottom"]):
+                values = topology.calculate_bipartite_betweenness_centrality(
+                    adjacency=network["adjacency"], nodes=nodes
+                )
+                references = ntx.algorithms.bipartite.betweenness_centrality(
+                    network["network"], nodes
+                )
+                confirm_values_close(values=values, references=references)
+
+
+def test_betweenness_estimation():
+    """
+    Tests approximate betweenness centralities against exact values.
+
+    The true relative error of estimates must be within twice the relative
+    error that estimation reports, and an adaptive count of samples must stop
+    before all nodes once the reported error is within tolerance.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(2):
+        network = ntx.gnm_random_graph(
+            600, 4800, seed=seed, directed=True
+        )
+        adjacency = topology.define_network_adjacency(network=network)
+        references = numpy.array(list(
+            ntx.algorithms.centrality.betweenness_centrality(
+                network, normalized=False
+            ).values()
+        ))
+        for samples, tolerance in ((50, None), (150, None), (None, 0.25)):
+            estimation = topology.estimate_betweenness(
+                adjacency=adjacency, samples=samples, tolerance=tolerance
+            )
+            error = (
+                numpy.linalg.norm(estimation["betweenness"] - references) /
+                numpy.linalg.norm(references)
+            )
+            assert error <= (2.0 * estimation["error"]), (
+                seed, samples, tolerance, error, estimation["error"]
+            )
+            if tolerance is not None:
+                assert estimation["error"] <= tolerance
+                assert estimation["samples"] < len(adjacency["identifiers"])
+        # Estimation from all nodes as sources is exact.
+        estimation = topology.estimate_betweenness(
+            adjacency=adjacency, samples=len(adjacency["identifiers"])
+        )
+        assert numpy.allclose(estimation["betweenness"], references)
+        assert estimation["error"] == 0.0
+
+
+def test_mean_path_length():
+    """
+    Tests mean lengths of paths within bipartite sets against NetworkX.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=True)
+        for nodes in (network["nodes_top"], network["nodes_bottom"]):
+            value = analysis.calculate_mean_path_length_bipartite_network(
+                network=network["network"],
+                nodes_cis=nodes,
+                processes=(1 + (seed % 2))
+            )
+            members = set(nodes)
+            total = 0
+            for node in nodes:
+                lengths = ntx.single_source_shortest_path_length(
+                    network["network"], node
+                )
+                total += sum(
+                    length for target, length in lengths.items()
+                    if target in members
+                )
+            reference = total / (len(nodes) * (len(nodes) - 1))
+            assert math.isclose(value, reference), (seed, value, reference)
+
+
+def test_eccentricity_reachability():
+    """
+    Tests eccentricities and reachabilities of nodes against NetworkX.
+
+    Eccentricity is the maximal distance from a node to any node that it can
+    reach, which matches NetworkX's eccentricity in strongly connected
+    networks.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=(seed % 2 == 0))
+        nodes = network["nodes_top"] + network["nodes_bottom"]
+        distances = analysis.determine_network_nodes_distances(
+            adjacency=network["adjacency"], nodes=nodes
+        )
+        for index, node in enumerate(nodes):
+            lengths = ntx.single_source_shortest_path_length(
+                network["network"], node
+            )
+            assert distances["eccentricity"][index] == max(lengths.values())
+            assert distances["reachability"][index] == (len(lengths) - 1)
+    # Compare to eccentricity in a strongly connected network.
+    network = ntx.DiGraph(ntx.cycle_graph(12, create_using=ntx.DiGraph))
+    network.add_edges_from([(0, 6), (3, 9)])
+    adjacency = topology.define_network_adjacency(network=network)
+    nodes = list(network.nodes())
+    distances = analysis.determine_network_nodes_distances(
+        adjacency=adjacency, nodes=nodes
+    )
+    references = ntx.algorithms.distance_measures.eccentricity(network)
+    for index, node in enumerate(nodes):
+        assert distances["eccentricity"][index] == references[node]
+
+
+def test_clustering():
+    """
+    Tests bipartite cluster coefficients against NetworkX.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=True)
+        for nodes in (network["nodes_top"], network["nodes_bottom"]):
+            values = topology.calculate_bipartite_clustering(
+                adjacency=network["adjacency"], nodes=nodes, batch=7
+            )
+            references = ntx.algorithms.bipartite.clustering(
+                network["network"], nodes, mode="dot"
+            )
+            confirm_values_close(values=values, references=references)
+            value = topology.calculate_bipartite_average_clustering(
+                adjacency=network["adjacency"], nodes=nodes
+            )
+            reference = ntx.algorithms.bipartite.average_clustering(
+                network["network"], nodes, mode="dot"
+            )
+            assert math.isclose(value, reference), (seed, value, reference)
+
+
+def test_projection_assortativity():
+    """
+    Tests degree assortativity of projections against NetworkX.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(20):
+        network = define_random_network(seed=seed, bipartite=True)
+        for nodes in (network["nodes_top"], network["nodes_bottom"]):
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                value = topology.calculate_projection_degree_assortativity(
+                    adjacency=network["adjacency"], nodes=nodes
+                )
+            projection = ntx.algorithms.bipartite.projection.projected_graph(
+                network["network"], nodes, multigraph=True
+            )
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                reference = (
+                    ntx.algorithms.assortativity
+                    .degree_assortativity_coefficient(
+                        projection, x="out", y="in"
+                    )
+                )
+            if math.isnan(reference):
+                assert math.isnan(value), (seed, value)
+            else:
+                assert math.isclose(value, reference), (seed, value, reference)
+
+
+def test_connectivity():
+    """
+    Tests connectivity, components, and bipartition against NetworkX.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(40):
+        network = define_random_network(seed=seed, bipartite=(seed % 2 == 0))
+        undirected = network["network"].to_undirected()
+        connectivity = analysis.determine_network_connectivity(
+            network=network["network"],
+            adjacency=network["adjacency"],
+            nodes=network["nodes_top"]
+        )
+        components = ntx.algorithms.components.connected_components(
+            undirected
+        )
+        references = {
+            "connection": ntx.algorithms.components.is_connected(undirected),
+            "connection_strong": (
+                ntx.algorithms.components.is_strongly_connected(
+                    network["network"]
+                )
+            ),
+            "connection_weak": (
+                ntx.algorithms.components.is_weakly_connected(
+                    network["network"]
+                )
+            ),
+            "components_count": (
+                ntx.algorithms.components.number_connected_components(
+                    undirected
+                )
+            ),
+            "components_orders": sorted(
+                [len(component) for component in components], reverse=True
+            ),
+            "bipartite": ntx.algorithms.bipartite.is_bipartite(undirected),
+        }
+        assert connectivity == references, (seed, connectivity, references)
+        count = topology.count_strong_components(
+            adjacency=network["adjacency"]
+        )
+        assert count == (
+            ntx.algorithms.components.number_strongly_connected_components(
+                network["network"]
+            )
+        )
+
+
+def define_random_model(directory=None, seed=None):
+    """
+    Defines a small random metabolic model and its customization.
+
+    Reactions include conversions with frequent participation of a few
+    metabolites of high degree, transports between compartments, and
+    replicates with the same metabolites in other compartments.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        seed (int): seed for random generator
+
+    raises:
+
+    returns:
+
+    """
+
+    generator = random.Random(seed)
+    compartments = {}
+    for index in range(5):
+        identifier = "compartment_" + str(index)
+        compartments[identifier] = {"identifier": identifier, "name": ""}
+    processes = {}
+    for index in range(12):
+        identifier = "process_" + str(index)
+        processes[identifier] = {"identifier": identifier, "name": ""}
+    metabolites = {}
+    for index in range(120):
+        identifier = "metabolite_" + str(index)
+        metabolites[identifier] = {
+            "identifier": identifier,
+            "name": "",
+            "formula": "",
+            "mass": "",
+            "charge": "",
+            "references": {"hmdb": [], "pubchem": []}
+        }
+    hubs = list(metabolites.keys())[0:6]
+    reactions = {}
+    for index in range(300):
+        identifier = "reaction_" + str(index)
+        compartment = generator.choice(list(compartments.keys()))
+        participants = []
+        transports = []
+        if (len(reactions) > 0) and (generator.random() < 0.2):
+            # Replicate metabolites of a previous reaction in another
+            # compartment.
+            base = reactions[generator.choice(list(reactions.keys()))]
+            for participant in base["participants"]:
+                participants.append({
+                    "metabolite": participant["metabolite"],
+                    "role": participant["role"],
+                    "compartment": compartment
+                })
+        elif generator.random() < 0.15:
+            # Transport a metabolite between compartments.
+            metabolite = generator.choice(list(metabolites.keys()))
+            source, target = generator.sample(list(compartments.keys()), 2)
+            participants.append({
+                "metabolite": metabolite,
+                "role": "reactant",
+                "compartment": source
+            })
+            participants.append({
+                "metabolite": metabolite,
+                "role": "product",
+                "compartment": target
+            })
+            transports.append({
+                "metabolite": metabolite,
+                "compartments": [source, target]
+            })
+        else:
+            for role in ["reactant", "product"]:
+                for count in range(generator.randint(1, 3)):
+                    if generator.random() < 0.3:
+                        metabolite = generator.choice(hubs)
+                    else:
+                        metabolite = generator.choice(
+                            list(metabolites.keys())
+                        )
+                    participants.append({
+                        "metabolite": metabolite,
+                        "role": role,
+                        "compartment": compartment
+                    })
+        reactions[identifier] = {
+            "identifier": identifier,
+            "name": "",
+            "reversibility": (generator.random() < 0.5),
+            "conversion": (len(transports) == 0),
+            "transport": (len(transports) > 0),
+            "transports": transports,
+            "participants": participants,
+            "processes": generator.sample(
+                list(processes.keys()), generator.randint(1, 2)
+            ),
+            "replicates": []
+        }
+    # Define replicates as reactions with the same metabolites.
+    families = {}
+    for reaction in reactions.values():
+        key = tuple(sorted(
+            (participant["role"], participant["metabolite"])
+            for participant in reaction["participants"]
+        ))
+        families.setdefault(key, []).append(reaction["identifier"])
+    for family in families.values():
+        for identifier in family:
+            reactions[identifier]["replicates"] = list(family)
+    # Write model to file.
+    path_model = os.path.join(directory, "model")
+    utility.confirm_path_directory(path_model)
+    model = {
+        "compartments": compartments,
+        "processes": processes,
+        "reactions": reactions,
+        "metabolites": metabolites
+    }
+    for name in model.keys():
+        path_file = os.path.join(path_model, (name + ".pickle"))
+        with open(path_file, "wb") as file_product:
+            pickle.dump(model[name], file_product)
+    # Write customization to file.
+    customization = {
+        "filtration_compartments": [
+            {"identifier": identifier, "name": "", "relevance": "True"}
+            for identifier in compartments.keys()
+        ],
+        "filtration_processes": [
+            {"identifier": identifier, "name": "", "relevance": "True"}
+            for identifier in processes.keys()
+        ],
+        "simplification_reactions": [
+            {"identifier": "reaction_0", "name": "", "omission": "True"}
+        ],
+        "simplification_metabolites": [
+            {
+                "metabolite": hubs[0], "compartment": "all",
+                "omission": "True", "replication": "False"
+            },
+            {
+                "metabolite": hubs[1], "compartment": "all",
+                "omission": "False", "replication": "True"
+            },
+            {
+                "metabolite": hubs[2], "compartment": "compartment_1",
+                "omission": "False", "replication": "True"
+            },
+        ]
+    }
+    write_customization(directory=directory, customization=customization)
+
+
+def write_customization(directory=None, customization=None):
+    """
+    Writes customization of a model to file.
+
+    arguments:
+        directory (str): path to directory for source and product files
+        customization (dict<list<dict>>): records of filtration and
+            simplification of the model
+
+    raises:
+
+    returns:
+
+    """
+
+    path = os.path.join(directory, "source", "customization")
+    utility.confirm_path_directory(path)
+    for name in customization.keys():
+        utility.write_file_table(
+            information=customization[name],
+            path_file=os.path.join(path, (name + ".tsv")),
+            names=customization[name][0].keys(),
+            delimiter="\t"
+        )
+
+
+def read_candidacy(directory=None):
+    """
+    Reads products of candidacy from file.
+
+    arguments:
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (dict): candidate reactions and metabolites and text of reports
+
+    """
+
+    path = os.path.join(directory, "candidacy")
+    collection = {}
+    for name in ["reactions", "metabolites"]:
+        with open(os.path.join(path, (name + ".pickle")), "rb") as file_source:
+            collection[name] = pickle.load(file_source)
+        with open(os.path.join(path, (name + ".tsv")), "r") as file_source:
+            collection[name + "_report"] = file_source.read()
+    return collection
+
+
+def test_candidacy_incrementation():
+    """
+    Tests incremental evaluation of candidacy against complete evaluation.
+
+    After each change to customization, incremental evaluation from the
+    previous evaluation must write the same products as complete evaluation.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    # Define changes to customization as the table, the record, and the
+    # logical value to reverse.
+    changes = [
+        ("filtration_compartments", 2, "relevance"),
+        ("filtration_processes", 5, "relevance"),
+        ("filtration_processes", 7, "relevance"),
+        ("simplification_reactions", 0, "omission"),
+        ("simplification_metabolites", 1, "replication"),
+        ("simplification_metabolites", 2, "omission"),
+        ("filtration_compartments", 2, "relevance"),
+    ]
+    for compartmentalization in [True, False]:
+        for simplification in [True, False]:
+            with tempfile.TemporaryDirectory() as directory:
+                incremental = os.path.join(directory, "incremental")
+                complete = os.path.join(directory, "complete")
+                for path in [incremental, complete]:
+                    define_random_model(directory=path, seed=3)
+                candidacy.execute_procedure(
+                    compartmentalization=compartmentalization,
+                    simplification=simplification,
+                    incrementation=True,
+                    directory=incremental
+                )
+                customization = candidacy.read_source(directory=complete)
+                for name, index, key in changes:
+                    record = customization[name][index]
+                    record[key] = str(record[key] != "True")
+                    for path in [incremental, complete]:
+                        write_customization(
+                            directory=path,
+                            customization={
+                                key: customization[key] for key in [
+                                    "filtration_compartments",
+                                    "filtration_processes",
+                                    "simplification_reactions",
+                                    "simplification_metabolites"
+                                ]
+                            }
+                        )
+                    candidacy.execute_procedure(
+                        compartmentalization=compartmentalization,
+                        simplification=simplification,
+                        incrementation=True,
+                        directory=incremental
+                    )
+                    candidacy.execute_procedure(
+                        compartmentalization=compartmentalization,
+                        simplification=simplification,
+                        incrementation=False,
+                        directory=complete
+                    )
+                    assert (
+                        read_candidacy(directory=incremental) ==
+                        read_candidacy(directory=complete)
+                    ), (compartmentalization, simplification, name)
+
+
+def test_sweep_configurations():
+    """
+    Tests that identical configurations of simplification give identical
+    reports in the comparison of a sweep.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        define_random_model(directory=directory, seed=5)
+        path_configurations = os.path.join(directory, "configurations")
+        utility.confirm_path_directory(path_configurations)
+        path_simplification = os.path.join(
+            directory, "source", "customization",
+            "simplification_metabolites.tsv"
+        )
+        for name in ["first", "second"]:
+            shutil.copyfile(
+                path_simplification,
+                os.path.join(path_configurations, (name + ".tsv"))
+            )
+        sweep.execute_procedure(
+            path_configurations=path_configurations,
+            compartmentalization=True,
+            component=True,
+            references=2,
+            directory=directory
+        )
+        comparison = utility.read_file_table(
+            path_file=os.path.join(directory, "sweep", "comparison.tsv"),
+            names=None,
+            delimiter="\t"
+        )
+        assert len(comparison) == 4
+        for first, second in zip(comparison[0:2], comparison[2:4]):
+            assert first["configuration"] == "first"
+            assert second["configuration"] == "second"
+            del first["configuration"]
+            del second["configuration"]
+            assert first == second, (first, second)
+
+
+def define_random_elements(seed=None):
+    """
+    Defines random nodes and links of a small bipartite network.
+
+    Few links relative to nodes give many components, often several of the
+    same order.
+
+    arguments:
+        seed (int): seed for random generator
+
+    raises:
+
+    returns:
+        (dict<dict<dict>>): information about network's nodes and links
+
+    """
+
+    generator = random.Random(seed)
+    nodes_reactions = {}
+    for index in range(generator.randint(1, 40)):
+        identifier = "reaction_" + str(index)
+        nodes_reactions[identifier] = {
+            "identifier": identifier, "entity": "reaction", "name": ""
+        }
+    nodes_metabolites = {}
+    for index in range(generator.randint(1, 40)):
+        identifier = "metabolite_" + str(index)
+        nodes_metabolites[identifier] = {
+            "identifier": identifier, "entity": "metabolite", "name": ""
+        }
+    links = {}
+    for index in range(generator.randint(0, 50)):
+        reaction = generator.choice(list(nodes_reactions.keys()))
+        metabolite = generator.choice(list(nodes_metabolites.keys()))
+        if generator.random() < 0.5:
+            source, target = reaction, metabolite
+        else:
+            source, target = metabolite, reaction
+        identifier = source + "_-_" + target
+        links[identifier] = {
+            "identifier": identifier,
+            "source": source,
+            "target": target,
+            "role": "",
+            "replication": False
+        }
+    return {
+        "nodes_reactions": nodes_reactions,
+        "nodes_metabolites": nodes_metabolites,
+        "links": links
+    }
+
+
+def select_component_networkx(
+    nodes_reactions=None,
+    nodes_metabolites=None,
+    links=None
+):
+    """
+    Selects the main component of a network in NetworkX.
+
+    Selection follows the original procedure with the largest of NetworkX's
+    connected components of the undirected network.
+
+    arguments:
+        nodes_reactions (dict<dict>): information about reactions' nodes
+        nodes_metabolites (dict<dict>): information about metabolites' nodes
+        links (dict<dict>): information about links between nodes for reactions
+            and metabolites
+
+    raises:
+
+    returns:
+        (dict<dict<dict>>): information about network's nodes and links
+
+    """
+
+    networkx = conversion.convert_networkx(
+        nodes_reactions=nodes_reactions,
+        nodes_metabolites=nodes_metabolites,
+        links=links
+    )
+    network = analysis.instantiate_networkx(
+        nodes=networkx["nodes"],
+        links=networkx["links"]
+    )
+    components = ntx.algorithms.components.connected_components(
+        network.to_undirected()
+    )
+    component_main = sorted(components, key=len, reverse=True)[0]
+    subnetwork = ntx.DiGraph.subgraph(network, list(component_main))
+    nodes_identifiers = [
+        data["identifier"] for node, data in subnetwork.nodes.items()
+    ]
+    links_identifiers = [
+        data["identifier"] for link, data in subnetwork.edges.items()
+    ]
+    return {
+        "nodes_reactions": utility.filter_entries_identifiers(
+            identifiers=nodes_identifiers,
+            entries_original=nodes_reactions
+        ),
+        "nodes_metabolites": utility.filter_entries_identifiers(
+            identifiers=nodes_identifiers,
+            entries_original=nodes_metabolites
+        ),
+        "links": utility.filter_entries_identifiers(
+            identifiers=links_identifiers,
+            entries_original=links
+        )
+    }
+
+
+def test_component_selection():
+    """
+    Tests selection of a network's main component against NetworkX.
+
+    Selection must choose the same component as NetworkX, including the
+    choice between components of the same order, and must keep the same
+    nodes and links in the same order.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(100):
+        elements = define_random_elements(seed=seed)
+        selection = network.select_network_component_elements(
+            component=True,
+            nodes_reactions=elements["nodes_reactions"],
+            nodes_metabolites=elements["nodes_metabolites"],
+            links=elements["links"]
+        )
+        reference = select_component_networkx(
+            nodes_reactions=elements["nodes_reactions"],
+            nodes_metabolites=elements["nodes_metabolites"],
+            links=elements["links"]
+        )
+        for key in ["nodes_reactions", "nodes_metabolites", "links"]:
+            assert list(selection[key].items()) == (
+                list(reference[key].items())
+            ), (seed, key)
+        # Compare disjoint sets to connected components.
+        identifiers = (
+            list(elements["nodes_reactions"].keys()) +
+            list(elements["nodes_metabolites"].keys())
+        )
+        components = utility.collect_disjoint_sets(
+            elements=identifiers,
+            pairs=[
+                (link["source"], link["target"])
+                for link in elements["links"].values()
+            ]
+        )
+        graph = ntx.Graph()
+        graph.add_nodes_from(identifiers)
+        graph.add_edges_from(
+            (link["source"], link["target"])
+            for link in elements["links"].values()
+        )
+        references = ntx.algorithms.components.connected_components(graph)
+        assert (
+            sorted(sorted(component) for component in components) ==
+            sorted(sorted(component) for component in references)
+        )
+
+
+def test_dymetabonet_shards_count():
+    """
+    Tests that shards of reactions require a count of at least one reaction
+    and that rejection of a count leaves files unchanged.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    information = {
+        "compartments": {"compartment_0": {"identifier": "compartment_0"}},
+        "reactions": {"reaction_0": {"identifier": "reaction_0"}}
+    }
+    with tempfile.TemporaryDirectory() as path:
+        metabocurator_conversion.write_dymetabonet_shards(
+            path=path, information=information, shards=1
+        )
+        contents = {}
+        for name in sorted(os.listdir(path)):
+            with open(os.path.join(path, name), "r") as file_source:
+                contents[name] = file_source.read()
+        for shards in [0, -2, None]:
+            try:
+                metabocurator_conversion.write_dymetabonet_shards(
+                    path=path,
+                    information={"compartments": {}, "reactions": {}},
+                    shards=shards
+                )
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("accepted shards: " + str(shards))
+            for name in contents.keys():
+                with open(os.path.join(path, name), "r") as file_source:
+                    assert file_source.read() == contents[name]
+            assert sorted(os.listdir(path)) == sorted(contents.keys())
+
+
+def test_cytoscape_stream():
+    """
+    Tests that streaming of network's elements for CytoScape writes the same
+    text as serialization of the complete elements.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(10):
+        elements = define_random_elements(seed=seed)
+        if seed == 0:
+            elements["nodes_reactions"] = {}
+            elements["nodes_metabolites"] = {}
+            elements["links"] = {}
+        for node in elements["nodes_metabolites"].values():
+            node["name"] = "α-D-glucose \"6-phosphate\""
+        reference = json.dumps(conversion.convert_cytoscape(
+            nodes_reactions=copy.deepcopy(elements["nodes_reactions"]),
+            nodes_metabolites=copy.deepcopy(elements["nodes_metabolites"]),
+            links=copy.deepcopy(elements["links"])
+        ))
+        for compression in [False, True]:
+            with tempfile.TemporaryDirectory() as path:
+                conversion.write_cytoscape(
+                    path=path,
+                    nodes_reactions=copy.deepcopy(elements["nodes_reactions"]),
+                    nodes_metabolites=copy.deepcopy(
+                        elements["nodes_metabolites"]
+                    ),
+                    links=copy.deepcopy(elements["links"]),
+                    compression=compression
+                )
+                if compression:
+                    path_file = os.path.join(path, "network_cytoscape.json.gz")
+                    with gzip.open(path_file, "rt") as file_source:
+                        text = file_source.read()
+                else:
+                    path_file = os.path.join(path, "network_cytoscape.json")
+                    with open(path_file, "r") as file_source:
+                        text = file_source.read()
+                assert text == reference, (seed, compression)
+
+
+def define_random_information(seed=None):
+    """
+    Defines random information about metabolic entities and sets for web
+    applications.
+
+    arguments:
+        seed (int): seed for random generator
+
+    raises:
+
+    returns:
+        (dict<dict<dict>>): information about metabolic entities and sets
+
+    """
+
+    generator = random.Random(seed)
+    information = {}
+    for section in ["compartments", "processes", "metabolites", "reactions"]:
+        entities = {}
+        for index in range(generator.randint(0, 25)):
+            identifier = section + "_" + str(index)
+            entities[identifier] = {
+                "identifier": identifier,
+                "name": "β-alanine \"" + str(index) + "\"",
+                "mass": generator.random(),
+                "reversibility": (generator.random() < 0.5),
+                "references": [
+                    str(value) for value in range(generator.randint(0, 3))
+                ],
+                "participants": [
+                    {"metabolite": "metabolites_0", "role": None}
+                ]
+            }
+        information[section] = entities
+    return information
+
+
+def test_dymetabonet_stream():
+    """
+    Tests that streaming of information for web applications writes the same
+    text as serialization of the complete information, both to a single file
+    and to files for sections and shards of reactions.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(10):
+        information = define_random_information(seed=seed)
+        with tempfile.TemporaryDirectory() as path:
+            path_file = os.path.join(path, "dymetabonet.json")
+            metabocurator_conversion.write_dymetabonet(
+                path_file=path_file, information=information
+            )
+            with open(path_file, "r") as file_source:
+                assert file_source.read() == json.dumps(information)
+            # Write shards.
+            path_shards = os.path.join(path, "dymetabonet")
+            metabocurator_conversion.write_dymetabonet_shards(
+                path=path_shards, information=information, shards=7
+            )
+            with open(os.path.join(path_shards, "index.json")) as file_source:
+                index = json.load(file_source)
+            reactions = {}
+            for section in information.keys():
+                entities = {}
+                for record in index["sections"][section]:
+                    path_section = os.path.join(path_shards, record["file"])
+                    with open(path_section, "r") as file_source:
+                        text = file_source.read()
+                    entities_file = json.loads(text)
+                    assert text == json.dumps(entities_file)
+                    assert len(entities_file) == record["count"]
+                    if section == "reactions":
+                        assert len(entities_file) <= 7
+                        for identifier in entities_file.keys():
+                            assert index["reactions"][identifier] == (
+                                record["file"]
+                            )
+                    entities.update(entities_file)
+                assert json.dumps(entities) == (
+                    json.dumps(information[section])
+                )
+
+
+def test_table_columns_text():
+    """
+    Tests that writes of tables in columnar format, including stable sort of
+    rows, give the same text as writes of equivalent records.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    values = [
+        "", "name", "tab\tseparated", "quote \"within\"", "line\nbreak",
+        "semi;colon", None, 0, -3, 1.5, 1e-17, float("nan"), True, False,
+        ["a", "b"],
+    ]
+    for seed in range(20):
+        generator = random.Random(seed)
+        names = ["identifier", "count", "first", "second"]
+        records = []
+        for index in range(generator.randint(0, 30)):
+            records.append({
+                "identifier": ("entity_" + str(index)),
+                "count": generator.randint(0, 3),
+                "first": generator.choice(values),
+                "second": generator.choice(values),
+            })
+        columns = {
+            name: utility.collect_value_from_records(
+                key=name, records=records
+            )
+            for name in names
+        }
+        records.sort(key=lambda record: record["count"], reverse=True)
+        columns = utility.sort_table_columns(
+            columns=columns, key="count", reverse=True
+        )
+        with tempfile.TemporaryDirectory() as path:
+            path_records = os.path.join(path, "records.tsv")
+            path_columns = os.path.join(path, "columns.tsv")
+            utility.write_file_table(
+                information=records,
+                path_file=path_records,
+                names=names,
+                delimiter="\t"
+            )
+            utility.write_file_table_columns(
+                columns=columns, path_file=path_columns, delimiter="\t"
+            )
+            with open(path_records, "rb") as file_source:
+                text_records = file_source.read()
+            with open(path_columns, "rb") as file_source:
+                assert file_source.read() == text_records
+
+
+def test_cache_keys():
+    """
+    Tests that the cache of metrics returns values for identical networks and
+    calculates values anew after changes to links, parameters, or version.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    version = cache.version
+    try:
+        for seed in range(10):
+            instance = define_random_network(seed=seed, bipartite=False)
+            calculations = []
+
+            def calculate():
+                calculations.append(None)
+                return len(calculations)
+
+            def determine(adjacency=None, parameters=None):
+                return cache.determine_value(
+                    adjacency=adjacency,
+                    name="metric",
+                    parameters=parameters,
+                    function=calculate
+                )
+
+            with tempfile.TemporaryDirectory() as path:
+                adjacency = topology.define_network_adjacency(
+                    network=instance["network"]
+                )
+                cache.attach_cache(adjacency=adjacency, path=path)
+                assert determine(adjacency=adjacency, parameters={"a": 1}) == 1
+                # Hit for identical network that derives anew.
+                adjacency = topology.define_network_adjacency(
+                    network=instance["network"].copy()
+                )
+                cache.attach_cache(adjacency=adjacency, path=path)
+                assert determine(adjacency=adjacency, parameters={"a": 1}) == 1
+                assert len(calculations) == 1
+                # Miss after change to parameters.
+                assert determine(adjacency=adjacency, parameters={"a": 2}) == 2
+                # Miss after change to version.
+                cache.version = version + 1
+                assert determine(adjacency=adjacency, parameters={"a": 1}) == 3
+                cache.version = version
+                assert determine(adjacency=adjacency, parameters={"a": 1}) == 1
+                # Miss after change to a single link.
+                network_change = instance["network"].copy()
+                nodes = list(network_change.nodes())
+                source = nodes[0]
+                target = nodes[-1]
+                if network_change.has_edge(source, target):
+                    network_change.remove_edge(source, target)
+                else:
+                    network_change.add_edge(source, target)
+                adjacency = topology.define_network_adjacency(
+                    network=network_change
+                )
+                cache.attach_cache(adjacency=adjacency, path=path)
+                assert determine(adjacency=adjacency, parameters={"a": 1}) == 4
+                assert len(calculations) == 4
+    finally:
+        cache.version = version
+
+
+def test_ranks():
+    """
+    Tests ranks of values in either order and with either method for ties
+    against simple references, and tests that ranks of nodes are insensitive
+    to differences in the last places of floating point.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    for seed in range(50):
+        generator = random.Random(seed)
+        count = generator.randint(0, 40)
+        values = [generator.randint(0, 5) / 7 for index in range(count)]
+        for descending in [False, True]:
+            keys = [(-value if descending else value) for value in values]
+            # Ordinal ranks follow a stable sort.
+            order = sorted(range(count), key=keys.__getitem__)
+            references = [None] * count
+            for position, index in enumerate(order):
+                references[index] = position + 1
+            ranks = analysis.determine_ranks(
+                values=values, descending=descending, ties=None
+            )
+            assert ranks.tolist() == references
+            ranks = analysis.determine_ranks(
+                values=values, descending=descending, ties="ordinal"
+            )
+            assert ranks.tolist() == references
+            # Minimal ranks of ties count values before them.
+            references = [
+                1 + len([other for other in keys if other < key])
+                for key in keys
+            ]
+            ranks = analysis.determine_ranks(
+                values=values, descending=descending, ties="minimum"
+            )
+            assert ranks.tolist() == references
+        # Differences in the last places of centralities do not break ties.
+        degrees = {
+            "degree": numpy.array(
+                [generator.randint(0, 5) for index in range(count)],
+                dtype=numpy.int64
+            )
+        }
+        centralities = {}
+        centralities_noise = {}
+        for key in ["degree", "closeness", "betweenness"]:
+            centralities[key] = numpy.array(
+                [generator.randint(0, 5) / 7 for index in range(count)],
+                dtype=numpy.float64
+            )
+            directions = numpy.array(
+                [generator.choice([-1.0, 0.0, 1.0]) for index in range(count)],
+                dtype=numpy.float64
+            )
+            # Sums of positive terms give exact zeros.
+            directions[centralities[key] == 0] = 0
+            centralities_noise[key] = numpy.nextafter(
+                centralities[key], (centralities[key] + directions)
+            )
+        for ties in ["ordinal", "minimum"]:
+            ranks = analysis.determine_network_nodes_ranks(
+                degrees=degrees, centralities=centralities, ties=ties
+            )
+            ranks_noise = analysis.determine_network_nodes_ranks(
+                degrees=degrees, centralities=centralities_noise, ties=ties
+            )
+            for key in ranks.keys():
+                assert ranks[key].tolist() == ranks_noise[key].tolist()
+    try:
+        analysis.determine_ranks(values=[1, 2], descending=True, ties="mean")
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_service_requests():
+    """
+    Tests responses of the service to requests about metabolites by
+    identifiers of nodes, identifiers of metabolites, and names, and its
+    responses to invalid requests.
+
+    arguments:
+
+    raises:
+
+    returns:
+
+    """
+
+    source = {
+        "compartments": {
+            "cytosol": {"identifier": "cytosol", "name": "Cytosol"},
+            "mitochondrion": {
+                "identifier": "mitochondrion", "name": "Mitochondrion"
+            }
+        },
+        "processes": {
+            "glycolysis": {"identifier": "glycolysis", "name": "Glycolysis"},
+            "transport": {"identifier": "transport", "name": "Transport"}
+        },
+        "metabolites": {
+            "glucose": {"identifier": "glucose", "name": "Glucose"},
+            "pyruvate": {"identifier": "pyruvate", "name": "Pyruvate"}
+        },
+        "reactions": {
+            "hexokinase": {
+                "identifier": "hexokinase",
+                "participants": [
+                    {
+                        "metabolite": "glucose",
+                        "role": "reactant",
+                        "compartment": "cytosol"
+                    },
+                    {
+                        "metabolite": "pyruvate",
+                        "role": "product",
+                        "compartment": "cytosol"
+                    }
+                ],
+                "processes": ["glycolysis"]
+            },
+            "carrier": {
+                "identifier": "carrier",
+                "participants": [
+                    {
+                        "metabolite": "glucose",
+                        "role": "reactant",
+                        "compartment": "cytosol"
+                    },
+                    {
+                        "metabolite": "glucose",
+                        "role": "product",
+                        "compartment": "mitochondrion"
+                    }
+                ],
+                "processes": ["transport"]
+            }
+        },
+        "nodes_metabolites": {
+            "glucose_cytosol": {"entity": "glucose", "name": "Glucose"},
+            "glucose_mitochondrion": {"entity": "glucose", "name": "Glucose"},
+            "pyruvate_cytosol": {"entity": "pyruvate", "name": "Pyruvate"}
+        },
+        "nodes_reactions": {
+            "hexokinase": {"entity": "hexokinase", "name": "Hexokinase"},
+            "carrier": {"entity": "carrier", "name": "Carrier"}
+        },
+        "links": [
+            ("glucose_cytosol", "hexokinase", {"role": "reactant"}),
+            ("hexokinase", "pyruvate_cytosol", {"role": "product"}),
+            ("glucose_cytosol", "carrier", {"role": "reactant"}),
+            ("carrier", "glucose_mitochondrion", {"role": "product"})
+        ]
+    }
+    index = service.define_query_index(source=source)
+
+    def respond(request=None):
+        # Requests and responses pass through JSON, as through the socket.
+        response = service.respond_request(
+            request=json.loads(json.dumps(request)), index=index
+        )
+        return json.loads(json.dumps(response))
+
+    # Query by identifier of node.
+    response = respond(
+        request={"query": "all", "metabolites": ["glucose_mitochondrion"]}
+    )
+    assert response == {
+        "status": "success",
+        "results": [{
+            "metabolite": "glucose_mitochondrion",
+            "nodes": ["glucose_mitochondrion"],
+            "reactions": [
+                {
+                    "identifier": "carrier",
+                    "name": "Carrier",
+                    "roles": ["product"]
+                }
+            ],
+            "compartments": [
+                {"identifier": "cytosol", "name": "Cytosol"},
+                {"identifier": "mitochondrion", "name": "Mitochondrion"}
+            ],
+            "processes": [{"identifier": "transport", "name": "Transport"}]
+        }]
+    }
+    # Query by identifier of metabolite and by name regardless of case.
+    reactions = [
+        {
+            "identifier": "hexokinase",
+            "name": "Hexokinase",
+            "roles": ["reactant"]
+        },
+        {
+            "identifier": "carrier",
+            "name": "Carrier",
+            "roles": ["reactant", "product"]
+        }
+    ]
+    for metabolite in ["glucose", "Glucose", "gLUCOSE"]:
+        response = respond(
+            request={"query": "reactions", "metabolites": [metabolite]}
+        )
+        assert response == {
+            "status": "success",
+            "results": [{
+                "metabolite": metabolite,
+                "nodes": ["glucose_cytosol", "glucose_mitochondrion"],
+                "reactions": reactions
+            }]
+        }
+    # Query for processes of multiple metabolites, including an unknown
+    # metabolite, with the default kind of query.
+    response = respond(request={"metabolites": ["pyruvate", "lactate"]})
+    assert response["status"] == "success"
+    assert [result["nodes"] for result in response["results"]] == [
+        ["pyruvate_cytosol"], []
+    ]
+    assert response["results"][0]["processes"] == [
+        {"identifier": "glycolysis", "name": "Glycolysis"}
+    ]
+    assert response["results"][1]["reactions"] == []
+    # Invalid requests.
+    response = respond(request={"query": "volume", "metabolites": ["glucose"]})
+    assert response == {"status": "error", "message": "unknown query: volume"}
+    for metabolites in ["glucose", [1], ["glucose", None], None]:
+        response = respond(
+            request={"query": "all", "metabolites": metabolites}
+        )
+        assert response == {
+            "status": "error",
+            "message": "metabolites are not a list of text"
+        }
+    response = respond(request=["glucose"])
+    assert response == {
+        "status": "error",
+        "message": "request is not an object"
+    }
+
+
 ###############################################################################
 # Procedure
 
@@ -58,6 +1538,8 @@ def execute_procedure():
     """
     Function to execute module's main behavior.
 
+    The purpose of this procedure is to execute all tests of the module.
+
     arguments:
 
     returns:
@@ -67,8 +1549,29 @@ def execute_procedure():
     """
 
     print("accessed test module in metabonet package!")
-
-    pass
+    tests = [
+        test_closeness_centrality,
+        test_betweenness_centrality,
+        test_betweenness_estimation,
+        test_mean_path_length,
+        test_eccentricity_reachability,
+        test_clustering,
+        test_projection_assortativity,
+        test_connectivity,
+        test_candidacy_incrementation,
+        test_sweep_configurations,
+        test_component_selection,
+        test_dymetabonet_shards_count,
+        test_cytoscape_stream,
+        test_dymetabonet_stream,
+        test_table_columns_text,
+        test_cache_keys,
+        test_ranks,
+        test_service_requests,
+    ]
+    for test in tests:
+        test()
+        print("... passed " + test.__name__ + " ...")
 
 
 if (__name__ == "__main__"):
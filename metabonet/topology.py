@@ -0,0 +1,1424 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to measure the topology of bipartite
+# networks with sparse matrices of adjacency rather than with traversals of
+# nodes in NetworkX.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import multiprocessing
+
+# Relevant
+import numpy
+import scipy.sparse
+import scipy.stats
+
+# Custom
+import metabonet.utility as utility
+import metabonet.cache as cache
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Matrix of adjacency that each worker process receives once.
+reference_topology = {}
+
+
+# Adjacency.
+
+
+def define_adjacency(identifiers=None, sources=None, targets=None):
+    """
+    Defines a sparse matrix of adjacency for a directional network.
+
+    Rows of the matrix correspond to sources of links and columns correspond
+    to targets of links.
+
+    arguments:
+        identifiers (list<str>): identifiers of nodes in order of indices
+        sources (numpy.ndarray<int>): indices of links' source nodes
+        targets (numpy.ndarray<int>): indices of links' target nodes
+
+    raises:
+
+    returns:
+        (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    """
+
+    count = len(identifiers)
+    matrix = scipy.sparse.csr_matrix(
+        (
+            numpy.ones(len(sources), dtype=numpy.int32),
+            (sources, targets)
+        ),
+        shape=(count, count)
+    )
+    # Collapse any redundant links.
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return {
+        "identifiers": list(identifiers),
+        "indices": {
+            identifier: index for index, identifier in enumerate(identifiers)
+        },
+        "matrix": matrix
+    }
+
+
+def define_network_adjacency(network=None):
+    """
+    Defines a sparse matrix of adjacency for a network in NetworkX.
+
+    arguments:
+        network (object): instance of network in NetworkX
+
+    raises:
+
+    returns:
+        (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    """
+
+    identifiers = list(network.nodes())
+    indices = {
+        identifier: index for index, identifier in enumerate(identifiers)
+    }
+    sources = numpy.fromiter(
+        (indices[source] for source, target in network.edges()),
+        dtype=numpy.int64,
+        count=network.number_of_edges()
+    )
+    targets = numpy.fromiter(
+        (indices[target] for source, target in network.edges()),
+        dtype=numpy.int64,
+        count=network.number_of_edges()
+    )
+    return define_adjacency(
+        identifiers=identifiers, sources=sources, targets=targets
+    )
+
+
+def define_compact_adjacency(network=None):
+    """
+    Defines a sparse matrix of adjacency for a compact network.
+
+    The matrix uses copies of the compact network's arrays of out-links, since
+    arrays in memory map are read-only.
+
+    arguments:
+        network (object): compact representation of network
+
+    raises:
+
+    returns:
+        (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    """
+
+    count = network.count_nodes()
+    matrix = scipy.sparse.csr_matrix(
+        (
+            numpy.ones(network.count_links(), dtype=numpy.int32),
+            numpy.array(network.out_neighbors),
+            numpy.array(network.out_pointers)
+        ),
+        shape=(count, count)
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    identifiers = [str(identifier) for identifier in network.identifiers]
+    return {
+        "identifiers": identifiers,
+        "indices": {
+            identifier: index for index, identifier in enumerate(identifiers)
+        },
+        "matrix": matrix
+    }
+
+
+# Connectivity.
+
+
+def collect_weak_components(adjacency=None):
+    """
+    Collects weakly connected components of a network.
+
+    Weak components disregard direction of links, so a union-find structure
+    over links determines them without an undirected copy of the network.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    raises:
+
+    returns:
+        (list<set<int>>): indices of nodes in each weak component
+
+    """
+
+    links = adjacency["matrix"].tocoo()
+    return utility.collect_disjoint_sets(
+        elements=range(len(adjacency["identifiers"])),
+        pairs=zip(links.row.tolist(), links.col.tolist())
+    )
+
+
+def count_strong_components(adjacency=None):
+    """
+    Counts strongly connected components of a network.
+
+    Tarjan's algorithm proceeds iteratively with an explicit stack of nodes
+    and positions in their links, so depth of search has no limit from
+    recursion.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    raises:
+
+    returns:
+        (int): count of strong components
+
+    """
+
+    matrix = adjacency["matrix"]
+    pointers = matrix.indptr.tolist()
+    targets = matrix.indices.tolist()
+    order = len(pointers) - 1
+    indices = [-1] * order
+    lows = [0] * order
+    stacked = [False] * order
+    stack = []
+    counter = 0
+    count = 0
+    for root in range(order):
+        if indices[root] != -1:
+            continue
+        indices[root] = counter
+        lows[root] = counter
+        counter += 1
+        stack.append(root)
+        stacked[root] = True
+        work = [(root, pointers[root])]
+        while work:
+            node, position = work[-1]
+            end = pointers[node + 1]
+            descent = False
+            while position < end:
+                target = targets[position]
+                position += 1
+                if indices[target] == -1:
+                    # Descend to target and resume node later.
+                    work[-1] = (node, position)
+                    indices[target] = counter
+                    lows[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    stacked[target] = True
+                    work.append((target, pointers[target]))
+                    descent = True
+                    break
+                elif stacked[target]:
+                    lows[node] = min(lows[node], indices[target])
+            if descent:
+                continue
+            # Complete node.
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lows[parent] = min(lows[parent], lows[node])
+            if lows[node] == indices[node]:
+                # Node is root of a strong component.
+                while True:
+                    member = stack.pop()
+                    stacked[member] = False
+                    if member == node:
+                        break
+                count += 1
+    return count
+
+
+def determine_bipartite(adjacency=None):
+    """
+    Determines whether a network is bipartite.
+
+    Searches assign alternate colors to neighbors by links in either
+    direction.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    raises:
+
+    returns:
+        (bool): whether network is bipartite
+
+    """
+
+    matrix = adjacency["matrix"]
+    transpose = matrix.transpose().tocsr()
+    pointers = (matrix.indptr.tolist(), transpose.indptr.tolist())
+    targets = (matrix.indices.tolist(), transpose.indices.tolist())
+    order = len(pointers[0]) - 1
+    colors = [-1] * order
+    for root in range(order):
+        if colors[root] != -1:
+            continue
+        colors[root] = 0
+        queue = [root]
+        while queue:
+            node = queue.pop()
+            for direction in range(2):
+                start = pointers[direction][node]
+                end = pointers[direction][node + 1]
+                for target in targets[direction][start:end]:
+                    if colors[target] == -1:
+                        colors[target] = 1 - colors[node]
+                        queue.append(target)
+                    elif colors[target] == colors[node]:
+                        return False
+    return True
+
+
+def determine_connectivity(adjacency=None):
+    """
+    Determines connectivity and components of a network.
+
+    Connectivity is independent of bipartite sets, so determination occurs
+    once for each matrix of adjacency.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+
+    raises:
+
+    returns:
+        (dict): information about connectivity of network
+
+    """
+
+    if "connectivity" not in adjacency:
+        components = collect_weak_components(adjacency=adjacency)
+        orders = sorted((len(component) for component in components))
+        adjacency["connectivity"] = {
+            "connection_weak": (len(components) == 1),
+            "connection_strong": (
+                count_strong_components(adjacency=adjacency) == 1
+            ),
+            "components_count": len(components),
+            "components_orders": list(reversed(orders)),
+            "bipartite": determine_bipartite(adjacency=adjacency)
+        }
+    return adjacency["connectivity"]
+
+
+# Distance.
+
+
+def determine_batch(count=None, width=None, memory=None):
+    """
+    Determines the count of sources to search together from the order of a
+    network.
+
+    Searches from each batch of sources hold dense arrays with a row for each
+    source and a column for each node of the network, so memory for each
+    batch is proportional to the product of the count of sources and the
+    order of the network. The batch is the greatest count of sources for
+    which these arrays fit within a budget of memory, between 1 and 256.
+
+    arguments:
+        count (int): count of nodes in network
+        width (int): count of bytes in dense arrays for each pair of source
+            and node
+        memory (int): budget of memory in bytes for dense arrays of each
+            batch, by default 64 mebibytes
+
+    raises:
+
+    returns:
+        (int): count of sources to search together
+
+    """
+
+    if memory is None:
+        memory = 64 * 1024 * 1024
+    batch = int(memory // max(1, (count * width)))
+    return max(1, min(256, batch))
+
+
+def collect_breadth_first_distances(
+    adjacency=None,
+    sources=None,
+    targets=None,
+    groups=None,
+    batch=None
+):
+    """
+    Collects sums and counts of distances from sources to reachable nodes.
+
+    Breadth first searches from many sources proceed together as rows of a
+    sparse matrix of frontiers. Multiplication of frontiers by the matrix of
+    adjacency advances all searches by one step. Searches follow direction of
+    links. Memory is proportional to the count of sources in each batch times
+    the count of nodes, not to the count of pairs of nodes, and the batch
+    shrinks as the order of the network grows.
+
+    The same searches also determine each source's eccentricity, the maximal
+    distance to any reachable node, and, if groups are available, sums and
+    counts of distances to nodes in the source's own group.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        sources (numpy.ndarray<int>): indices of source nodes
+        targets (numpy.ndarray<bool>): mask of nodes to include in counts and
+            sums, or None for all nodes
+        groups (numpy.ndarray<int>): group of each node, or None
+        batch (int): count of sources to search together, or None to
+            determine from the order of the network with one byte for each
+            node in each search's mask of visits
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<int>>): for each source, count of reachable target
+            nodes including the source, sum of distances to these nodes, and
+            eccentricity
+
+    """
+
+    matrix = adjacency["matrix"]
+    count = matrix.shape[0]
+    if batch is None:
+        batch = determine_batch(count=count, width=1)
+    sources = numpy.asarray(sources, dtype=numpy.int64)
+    if targets is None:
+        counts = numpy.ones(len(sources), dtype=numpy.int64)
+    else:
+        counts = targets[sources].astype(numpy.int64)
+    sums = numpy.zeros(len(sources), dtype=numpy.int64)
+    eccentricities = numpy.zeros(len(sources), dtype=numpy.int64)
+    if groups is not None:
+        counts_group = numpy.ones(len(sources), dtype=numpy.int64)
+        sums_group = numpy.zeros(len(sources), dtype=numpy.int64)
+    for start in range(0, len(sources), batch):
+        block = sources[start:(start + batch)]
+        size = len(block)
+        rows = numpy.arange(size)
+        visits = numpy.zeros((size, count), dtype=bool)
+        visits[rows, block] = True
+        frontier = scipy.sparse.csr_matrix(
+            (numpy.ones(size, dtype=numpy.int32), (rows, block)),
+            shape=(size, count)
+        )
+        level = 0
+        while frontier.nnz > 0:
+            level += 1
+            # Advance frontiers and keep only nodes without previous visits.
+            reach = (frontier @ matrix).tocoo()
+            novel = numpy.logical_not(visits[reach.row, reach.col])
+            rows_novel = reach.row[novel]
+            columns_novel = reach.col[novel]
+            visits[rows_novel, columns_novel] = True
+            if targets is None:
+                counts_level = numpy.bincount(rows_novel, minlength=size)
+            else:
+                counts_level = numpy.bincount(
+                    rows_novel[targets[columns_novel]], minlength=size
+                )
+            counts[start:(start + size)] += counts_level
+            sums[start:(start + size)] += (level * counts_level)
+            eccentricities[start + rows_novel] = level
+            if groups is not None:
+                same = groups[columns_novel] == groups[block[rows_novel]]
+                counts_level = numpy.bincount(
+                    rows_novel[same], minlength=size
+                )
+                counts_group[start:(start + size)] += counts_level
+                sums_group[start:(start + size)] += (level * counts_level)
+            frontier = scipy.sparse.csr_matrix(
+                (
+                    numpy.ones(len(rows_novel), dtype=numpy.int32),
+                    (rows_novel, columns_novel)
+                ),
+                shape=(size, count)
+            )
+    collection = {
+        "counts": counts,
+        "sums": sums,
+        "eccentricities": eccentricities
+    }
+    if groups is not None:
+        collection["counts_group"] = counts_group
+        collection["sums_group"] = sums_group
+    return collection
+
+
+def define_groups(adjacency=None, sets=None):
+    """
+    Defines the group of each node from sets of nodes.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        sets (list<list<str>>): identifiers of nodes in each set
+
+    raises:
+
+    returns:
+        (numpy.ndarray<int>): index of set for each node, or -1 for nodes in
+            no set
+
+    """
+
+    groups = numpy.full(len(adjacency["identifiers"]), -1, dtype=numpy.int64)
+    for index, nodes in enumerate(sets):
+        groups[[adjacency["indices"][node] for node in nodes]] = index
+    return groups
+
+
+def determine_breadth_first_distances(
+    adjacency=None,
+    sets=None,
+    processes=None
+):
+    """
+    Determines sums and counts of distances from all nodes.
+
+    Distances are independent of bipartite sets, so searches occur once for
+    each matrix of adjacency. A single pass of searches serves closeness,
+    eccentricity, reachability, and mean lengths of paths within each set.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        sets (list<list<str>>): identifiers of nodes in each bipartite set for
+            sums of distances within sets, or None
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<int>>): for each node, count of reachable nodes
+            including the node, sum of distances to these nodes, and
+            eccentricity
+
+    """
+
+    if "distances" in adjacency:
+        if (sets is None) or ("groups" in adjacency["distances"]):
+            return adjacency["distances"]
+    if sets is None:
+        groups = None
+        keys = None
+    else:
+        groups = define_groups(adjacency=adjacency, sets=sets)
+        keys = [cache.define_nodes_key(nodes=nodes) for nodes in sets]
+    def calculate():
+        sources = numpy.arange(len(adjacency["identifiers"]))
+        if (processes is not None) and (processes > 1) and (len(sources) > 1):
+            count = min(processes, len(sources))
+            parameters = []
+            for index in range(count):
+                parameters.append({
+                    "sources": sources[index::count],
+                    "targets": None,
+                    "groups": groups
+                })
+            with multiprocessing.Pool(
+                processes=count,
+                initializer=initialize_worker,
+                initargs=(adjacency["matrix"],)
+            ) as pool:
+                collection = pool.map(
+                    collect_breadth_first_distances_worker, parameters
+                )
+            # Restore order of nodes from interleaved partitions.
+            distances = {}
+            for key in collection[0].keys():
+                distances[key] = numpy.zeros(len(sources), dtype=numpy.int64)
+                for index, record in enumerate(collection):
+                    distances[key][index::count] = record[key]
+        else:
+            distances = collect_breadth_first_distances(
+                adjacency=adjacency,
+                sources=sources,
+                groups=groups
+            )
+        if groups is not None:
+            distances["groups"] = groups
+        return distances
+    # Read distances from cache if possible.
+    adjacency["distances"] = cache.determine_value(
+        adjacency=adjacency,
+        name="distances",
+        parameters={"sets": keys},
+        function=calculate
+    )
+    return adjacency["distances"]
+
+
+# Centrality.
+
+
+def calculate_bipartite_degree_centrality(adjacency=None, nodes=None):
+    """
+    Calculates degree centralities of nodes in a bipartite network.
+
+    Degree centrality of a node is its degree, as the sum of in-links and
+    out-links, relative to the order of the other bipartite set, as in
+    NetworkX.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+
+    raises:
+
+    returns:
+        (dict<float>): degree centralities of all nodes in network
+
+    """
+
+    matrix = adjacency["matrix"]
+    order = len(adjacency["identifiers"])
+    degrees = (
+        numpy.diff(matrix.indptr) +
+        numpy.bincount(matrix.indices, minlength=order)
+    ).tolist()
+    top = numpy.zeros(order, dtype=bool)
+    top[[adjacency["indices"][node] for node in set(nodes)]] = True
+    count_top = int(numpy.count_nonzero(top))
+    factor_top = 1.0 / (order - count_top)
+    factor_bottom = 1.0 / count_top
+    centrality = {}
+    for index, identifier in enumerate(adjacency["identifiers"]):
+        if top[index]:
+            centrality[identifier] = degrees[index] * factor_top
+        else:
+            centrality[identifier] = degrees[index] * factor_bottom
+    return centrality
+
+
+def calculate_bipartite_closeness_centrality(
+    adjacency=None,
+    nodes=None,
+    normalized=None
+):
+    """
+    Calculates closeness centralities of nodes in a bipartite network.
+
+    Closeness has normalization by the minimal distances in a bipartite
+    network as in NetworkX. For nodes in the set other than the focal set,
+    normalization to the order of the node's component cancels.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+        normalized (bool): whether to normalize to the order of each node's
+            component
+
+    raises:
+
+    returns:
+        (dict<float>): closeness centralities of all nodes in network
+
+    """
+
+    identifiers = adjacency["identifiers"]
+    distances = determine_breadth_first_distances(adjacency=adjacency)
+    counts = distances["counts"].tolist()
+    sums = distances["sums"].tolist()
+    order = len(identifiers)
+    top = numpy.zeros(order, dtype=bool)
+    top[[adjacency["indices"][node] for node in set(nodes)]] = True
+    n = float(numpy.count_nonzero(top))
+    m = float(order - n)
+    # Determine indices of nodes in the focal set before nodes in the other
+    # set.
+    indices = numpy.concatenate(
+        (numpy.flatnonzero(top), numpy.flatnonzero(numpy.logical_not(top)))
+    ).tolist()
+    closeness = {}
+    for index in indices:
+        totsp = sums[index]
+        if totsp > 0.0 and order > 1:
+            s = (counts[index] - 1.0) / (order - 1)
+            if top[index]:
+                value = (m + 2 * (n - 1)) / totsp
+                if normalized:
+                    value *= s
+            else:
+                value = (n + 2 * (m - 1)) / totsp
+                if normalized:
+                    value = (value / s)
+                    value *= s
+        else:
+            value = 0.0
+        closeness[identifiers[index]] = value
+    return closeness
+
+
+def initialize_worker(matrix=None):
+    """
+    Stores the matrix of adjacency within a worker process.
+
+    arguments:
+        matrix (object): sparse matrix of adjacency
+
+    raises:
+
+    returns:
+
+    """
+
+    reference_topology["adjacency"] = {"matrix": matrix}
+
+
+def collect_breadth_first_distances_worker(parameters=None):
+    """
+    Collects sums and counts of distances from sources to reachable nodes
+    within a worker process.
+
+    arguments:
+        parameters (dict): indices of source nodes, mask of target nodes, and
+            groups of nodes
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<int>>): for each source, count of reachable target
+            nodes including the source, sum of distances to these nodes, and
+            eccentricity
+
+    """
+
+    return collect_breadth_first_distances(
+        adjacency=reference_topology["adjacency"],
+        sources=parameters["sources"],
+        targets=parameters["targets"],
+        groups=parameters["groups"]
+    )
+
+
+def calculate_mean_path_length(
+    adjacency=None,
+    nodes=None,
+    processes=None
+):
+    """
+    Calculates the mean length of shortest paths between all pairs of nodes in
+    a single bipartite set.
+
+    Searches from each node in the set accumulate only lengths of paths to
+    other nodes in the set. Partitions of sources across worker processes are
+    optional. If a previous pass of searches from all nodes has determined
+    distances within the same set, these distances serve instead.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (dict): sum and count of lengths of paths, including paths from each
+            node to itself
+
+    """
+
+    sources = numpy.unique(numpy.array(
+        [adjacency["indices"][node] for node in nodes], dtype=numpy.int64
+    ))
+    targets = numpy.zeros(len(adjacency["identifiers"]), dtype=bool)
+    targets[sources] = True
+    # Use distances within groups from previous searches if the set matches
+    # a group.
+    if ("distances" in adjacency) and (len(sources) > 0):
+        distances = adjacency["distances"]
+        if "groups" in distances:
+            groups = distances["groups"]
+            if numpy.array_equal(targets, (groups == groups[sources[0]])):
+                return {
+                    "sum": int(distances["sums_group"][sources].sum()),
+                    "count": int(distances["counts_group"][sources].sum())
+                }
+    if (processes is not None) and (processes > 1) and (len(sources) > 1):
+        count = min(processes, len(sources))
+        parameters = []
+        for index in range(count):
+            parameters.append({
+                "sources": sources[index::count],
+                "targets": targets,
+                "groups": None
+            })
+        with multiprocessing.Pool(
+            processes=count,
+            initializer=initialize_worker,
+            initargs=(adjacency["matrix"],)
+        ) as pool:
+            collection = pool.map(
+                collect_breadth_first_distances_worker, parameters
+            )
+    else:
+        collection = [collect_breadth_first_distances(
+            adjacency=adjacency,
+            sources=sources,
+            targets=targets
+        )]
+    return {
+        "sum": int(sum(int(record["sums"].sum()) for record in collection)),
+        "count": int(
+            sum(int(record["counts"].sum()) for record in collection)
+        )
+    }
+
+
+def collect_betweenness_dependencies(
+    adjacency=None,
+    sources=None,
+    batch=None
+):
+    """
+    Collects sums of dependencies of sources on all nodes by Brandes's
+    algorithm.
+
+    Searches from many sources proceed together as rows of sparse matrices.
+    Forward steps count shortest paths level by level, and backward steps
+    accumulate dependencies from each level to the previous level.
+    Dependencies exclude each search's source as do those in NetworkX.
+    Sums of squares of dependencies support estimates of variance from
+    samples of sources. Memory for each process is proportional to the count
+    of sources in each batch times the count of nodes, and the batch shrinks
+    as the order of the network grows.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        sources (numpy.ndarray<int>): indices of source nodes
+        batch (int): count of sources to search together, or None to
+            determine from the order of the network with twenty bytes for
+            each node in each search's depths, paths, and dependencies
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<float>>): sums and sums of squares of
+            dependencies of sources on each node
+
+    """
+
+    matrix = adjacency["matrix"].astype(numpy.float64)
+    transpose = matrix.transpose().tocsr()
+    count = matrix.shape[0]
+    if batch is None:
+        batch = determine_batch(count=count, width=20)
+    sources = numpy.asarray(sources, dtype=numpy.int64)
+    sums = numpy.zeros(count, dtype=numpy.float64)
+    squares = numpy.zeros(count, dtype=numpy.float64)
+    for start in range(0, len(sources), batch):
+        block = sources[start:(start + batch)]
+        size = len(block)
+        rows = numpy.arange(size)
+        depths = numpy.full((size, count), -1, dtype=numpy.int32)
+        paths = numpy.zeros((size, count), dtype=numpy.float64)
+        depths[rows, block] = 0
+        paths[rows, block] = 1.0
+        frontier = scipy.sparse.csr_matrix(
+            (numpy.ones(size, dtype=numpy.float64), (rows, block)),
+            shape=(size, count)
+        )
+        levels = [(rows, block)]
+        # Count shortest paths to nodes at each level.
+        while True:
+            reach = (frontier @ matrix).tocoo()
+            novel = depths[reach.row, reach.col] < 0
+            if not numpy.any(novel):
+                break
+            rows_novel = reach.row[novel]
+            columns_novel = reach.col[novel]
+            paths_novel = reach.data[novel]
+            depths[rows_novel, columns_novel] = len(levels)
+            paths[rows_novel, columns_novel] = paths_novel
+            levels.append((rows_novel, columns_novel))
+            frontier = scipy.sparse.csr_matrix(
+                (paths_novel, (rows_novel, columns_novel)),
+                shape=(size, count)
+            )
+        # Accumulate dependencies from deepest level to source.
+        deltas = numpy.zeros((size, count), dtype=numpy.float64)
+        for level in range((len(levels) - 1), 0, -1):
+            rows_level, columns_level = levels[level]
+            coefficients = scipy.sparse.csr_matrix(
+                (
+                    (
+                        (1.0 + deltas[rows_level, columns_level]) /
+                        paths[rows_level, columns_level]
+                    ),
+                    (rows_level, columns_level)
+                ),
+                shape=(size, count)
+            )
+            back = (coefficients @ transpose).tocoo()
+            previous = depths[back.row, back.col] == (level - 1)
+            rows_previous = back.row[previous]
+            columns_previous = back.col[previous]
+            deltas[rows_previous, columns_previous] += (
+                paths[rows_previous, columns_previous] * back.data[previous]
+            )
+        deltas[rows, block] = 0.0
+        sums += deltas.sum(axis=0)
+        squares += numpy.square(deltas).sum(axis=0)
+    return {
+        "sums": sums,
+        "squares": squares
+    }
+
+
+def collect_betweenness_dependencies_worker(sources=None):
+    """
+    Collects sums of dependencies of sources on all nodes within a worker
+    process.
+
+    arguments:
+        sources (numpy.ndarray<int>): indices of source nodes
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<float>>): sums and sums of squares of
+            dependencies of sources on each node
+
+    """
+
+    return collect_betweenness_dependencies(
+        adjacency=reference_topology["adjacency"],
+        sources=sources
+    )
+
+
+def determine_betweenness_dependencies(
+    adjacency=None,
+    sources=None,
+    processes=None
+):
+    """
+    Determines sums of dependencies of sources on all nodes.
+
+    Partitions of sources across worker processes interleave so that each
+    worker receives sources from both bipartite sets.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        sources (numpy.ndarray<int>): indices of source nodes
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (dict<numpy.ndarray<float>>): sums and sums of squares of
+            dependencies of sources on each node
+
+    """
+
+    sources = numpy.asarray(sources, dtype=numpy.int64)
+    if (processes is not None) and (processes > 1) and (len(sources) > 1):
+        count = min(processes, len(sources))
+        partitions = [sources[index::count] for index in range(count)]
+        with multiprocessing.Pool(
+            processes=count,
+            initializer=initialize_worker,
+            initargs=(adjacency["matrix"],)
+        ) as pool:
+            collection = pool.map(
+                collect_betweenness_dependencies_worker, partitions
+            )
+        return {
+            "sums": numpy.sum(
+                [record["sums"] for record in collection], axis=0
+            ),
+            "squares": numpy.sum(
+                [record["squares"] for record in collection], axis=0
+            )
+        }
+    else:
+        return collect_betweenness_dependencies(
+            adjacency=adjacency,
+            sources=sources
+        )
+
+
+def estimate_betweenness(
+    adjacency=None,
+    samples=None,
+    tolerance=None,
+    processes=None
+):
+    """
+    Estimates non-normal betweenness centralities of all nodes from samples of
+    source nodes.
+
+    Sums of dependencies from a random sample of sources, scaled by the ratio
+    of all nodes to sampled sources, estimate betweenness without bias.
+    Variances of dependencies across sampled sources, with correction for
+    sampling without replacement from a finite set of sources, give standard
+    errors of estimates. Error of all estimates is the ratio of the norm of
+    standard errors to the norm of estimates, so it weighs nodes of high
+    betweenness most. An adaptive count of samples doubles until error is
+    within tolerance.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        samples (int): count of source nodes to sample, or None to determine
+            count adaptively
+        tolerance (float): maximal relative error of estimates for adaptive
+            count of samples, or None for 0.05
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (dict): estimates of betweenness centralities, count of samples, and
+            relative error of estimates
+
+    """
+
+    if tolerance is None:
+        tolerance = 0.05
+    count = len(adjacency["identifiers"])
+    # Define counts of samples for successive estimates.
+    if samples is not None:
+        sizes = [min(count, max(2, samples))]
+    else:
+        sizes = []
+        size = min(count, 64)
+        while size < count:
+            sizes.append(size)
+            size *= 2
+        sizes.append(count)
+    # Sample sources in random order with a constant seed.
+    generator = numpy.random.default_rng(3141593)
+    order = generator.permutation(count)
+    sums = numpy.zeros(count, dtype=numpy.float64)
+    squares = numpy.zeros(count, dtype=numpy.float64)
+    used = 0
+    for size in sizes:
+        dependencies = determine_betweenness_dependencies(
+            adjacency=adjacency,
+            sources=order[used:size],
+            processes=processes
+        )
+        sums += dependencies["sums"]
+        squares += dependencies["squares"]
+        used = size
+        # Estimate betweenness and relative error.
+        estimates = sums * (count / used)
+        if used < 2:
+            error = 1.0
+        else:
+            means = sums / used
+            variances = numpy.maximum(
+                ((squares - (used * numpy.square(means))) / (used - 1)), 0.0
+            )
+            errors = (
+                numpy.square(count) * (1.0 - (used / count)) *
+                (variances / used)
+            )
+            norm = numpy.sqrt(numpy.sum(numpy.square(estimates)))
+            if norm > 0.0:
+                error = float(numpy.sqrt(numpy.sum(errors)) / norm)
+            else:
+                error = 0.0
+        if error <= tolerance:
+            break
+    return {
+        "betweenness": estimates,
+        "samples": used,
+        "error": error
+    }
+
+
+def determine_betweenness(
+    adjacency=None,
+    approximate=None,
+    samples=None,
+    tolerance=None,
+    processes=None
+):
+    """
+    Determines non-normal betweenness centralities of all nodes.
+
+    Betweenness is independent of bipartite sets, so searches occur once for
+    each matrix of adjacency. Estimation of approximate betweenness stores
+    the count of samples and the error of estimates with the matrix.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        approximate (bool): whether to estimate betweenness from samples of
+            source nodes
+        samples (int): count of source nodes to sample, or None to determine
+            count adaptively
+        tolerance (float): maximal relative error of estimates for adaptive
+            count of samples, or None for 0.05
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (numpy.ndarray<float>): non-normal betweenness centrality of each node
+
+    """
+
+    if "betweenness" not in adjacency:
+        def calculate():
+            if approximate:
+                estimation = estimate_betweenness(
+                    adjacency=adjacency,
+                    samples=samples,
+                    tolerance=tolerance,
+                    processes=processes
+                )
+                return {
+                    "betweenness": estimation["betweenness"],
+                    "estimation": {
+                        "samples": estimation["samples"],
+                        "error": estimation["error"]
+                    }
+                }
+            else:
+                dependencies = determine_betweenness_dependencies(
+                    adjacency=adjacency,
+                    sources=numpy.arange(len(adjacency["identifiers"])),
+                    processes=processes
+                )
+                return {
+                    "betweenness": dependencies["sums"],
+                    "estimation": None
+                }
+        # Read betweenness from cache if possible.
+        betweenness = cache.determine_value(
+            adjacency=adjacency,
+            name="betweenness",
+            parameters={
+                "approximate": bool(approximate),
+                "samples": samples,
+                "tolerance": tolerance
+            },
+            function=calculate
+        )
+        adjacency["betweenness"] = betweenness["betweenness"]
+        if betweenness["estimation"] is not None:
+            adjacency["betweenness_estimation"] = betweenness["estimation"]
+    return adjacency["betweenness"]
+
+
+def calculate_bipartite_betweenness_centrality(
+    adjacency=None,
+    nodes=None,
+    processes=None
+):
+    """
+    Calculates betweenness centralities of nodes in a bipartite network.
+
+    Betweenness has normalization by the maximal betweenness in a bipartite
+    network as in NetworkX.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+        processes (int): count of parallel worker processes
+
+    raises:
+
+    returns:
+        (dict<float>): betweenness centralities of all nodes in network
+
+    """
+
+    identifiers = adjacency["identifiers"]
+    values = determine_betweenness(
+        adjacency=adjacency, processes=processes
+    ).tolist()
+    top = set(nodes)
+    n = len(top)
+    m = len(identifiers) - n
+    s, t = divmod(n - 1, m)
+    maximum_top = (
+        ((m**2) * ((s + 1) ** 2)) +
+        (m * (s + 1) * (2 * t - s - 1)) -
+        (t * ((2 * s) - t + 3))
+    ) / 2.0
+    p, r = divmod(m - 1, n)
+    maximum_bottom = (
+        ((n**2) * ((p + 1) ** 2)) +
+        (n * (p + 1) * (2 * r - p - 1)) -
+        (r * ((2 * p) - r + 3))
+    ) / 2.0
+    betweenness = {}
+    for index, identifier in enumerate(identifiers):
+        if identifier in top:
+            betweenness[identifier] = values[index] / maximum_top
+        else:
+            betweenness[identifier] = values[index] / maximum_bottom
+    return betweenness
+
+
+# Cluster.
+
+
+def calculate_bipartite_clustering(
+    adjacency=None,
+    nodes=None,
+    batch=None
+):
+    """
+    Calculates cluster coefficients of nodes in a bipartite network.
+
+    Cluster coefficients follow the "dot" mode of Latapy's coefficients for
+    bipartite networks as in NetworkX. For each node, the coefficient is the
+    mean over its second neighbors of the count of neighbors that both nodes
+    share relative to the count of neighbors of either node, in which
+    neighbors follow direction of links. The product of the matrix of
+    adjacency with its transpose gives overlaps of neighbors for all pairs of
+    nodes together, and the product of the matrix with itself restricts these
+    pairs to second neighbors. Products proceed for batches of nodes to limit
+    memory.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+        batch (int): count of nodes to consider together
+
+    raises:
+
+    returns:
+        (dict<float>): cluster coefficients of nodes in bipartite set
+
+    """
+
+    if batch is None:
+        batch = 256
+    matrix = adjacency["matrix"]
+    transpose = matrix.transpose().tocsr()
+    degrees = numpy.diff(matrix.indptr).astype(numpy.float64)
+    indices = numpy.array(
+        [adjacency["indices"][node] for node in nodes], dtype=numpy.int64
+    )
+    coefficients = numpy.zeros(len(indices), dtype=numpy.float64)
+    for start in range(0, len(indices), batch):
+        block = indices[start:(start + batch)]
+        size = len(block)
+        rows = matrix[block]
+        # Determine second neighbors of each node other than the node itself.
+        neighbors = (rows @ matrix).tocoo()
+        keep = neighbors.col != block[neighbors.row]
+        neighbors = scipy.sparse.csr_matrix(
+            (
+                numpy.ones(numpy.count_nonzero(keep), dtype=numpy.int32),
+                (neighbors.row[keep], neighbors.col[keep])
+            ),
+            shape=(size, matrix.shape[0])
+        )
+        counts = numpy.diff(neighbors.indptr)
+        # Determine overlaps of neighbors between nodes and second neighbors.
+        # Pairs without overlap contribute zero.
+        overlaps = neighbors.multiply(rows @ transpose).tocoo()
+        shares = overlaps.data.astype(numpy.float64)
+        unions = (
+            degrees[block[overlaps.row]] + degrees[overlaps.col] - shares
+        )
+        sums = numpy.bincount(
+            overlaps.row, weights=(shares / unions), minlength=size
+        )
+        positive = sums > 0.0
+        values = numpy.zeros(size, dtype=numpy.float64)
+        values[positive] = sums[positive] / counts[positive]
+        coefficients[start:(start + size)] = values
+    coefficients = coefficients.tolist()
+    return {node: coefficients[index] for index, node in enumerate(nodes)}
+
+
+def calculate_bipartite_average_clustering(
+    adjacency=None,
+    nodes=None
+):
+    """
+    Calculates the mean of cluster coefficients of nodes in a bipartite set.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+
+    raises:
+
+    returns:
+        (float): mean cluster coefficient
+
+    """
+
+    coefficients = calculate_bipartite_clustering(
+        adjacency=adjacency, nodes=nodes
+    )
+    return sum(coefficients[node] for node in nodes) / len(nodes)
+
+
+# Assortativity.
+
+
+def calculate_projection_degree_assortativity(
+    adjacency=None,
+    nodes=None
+):
+    """
+    Calculates degree assortativity of the projection of a bipartite network
+    onto a single bipartite set without definition of the projection.
+
+    The projection is the directional multigraph from NetworkX's
+    projected_graph with multigraph=True. It has a link from node u to node v
+    for each intermediate node w with links from u to w and from w to v,
+    where v differs from u. Degrees of nodes in the projection and counts of
+    links between classes of degree derive from products of sparse matrices
+    in which memory is proportional to the count of links in the bipartite
+    network. Assortativity compares out degrees of sources to in degrees of
+    targets, as NetworkX's degree_assortativity_coefficient with x="out" and
+    y="in", and follows the same order of operations for identical values.
+
+    arguments:
+        adjacency (dict): identifiers of nodes, indices of nodes, and matrix of
+            adjacency
+        nodes (list<str>): identifiers of nodes in a bipartite set
+
+    raises:
+
+    returns:
+        (float): degree assortativity of projection
+
+    """
+
+    matrix = adjacency["matrix"].astype(numpy.int64)
+    transpose = matrix.transpose().tocsr()
+    order = matrix.shape[0]
+    indices = [adjacency["indices"][node] for node in nodes]
+    top = numpy.zeros(order, dtype=numpy.int64)
+    top[indices] = 1
+    # Count paths from each node to itself through a single intermediate node,
+    # since the projection excludes these paths.
+    returns = numpy.asarray(
+        matrix.multiply(transpose).sum(axis=1)
+    ).ravel().astype(numpy.int64)
+    # Determine out degrees and in degrees in the projection.
+    degrees_out = top * (
+        (matrix @ numpy.asarray(matrix.sum(axis=1)).ravel()) - returns
+    )
+    degrees_in = (transpose @ (transpose @ top)) - (top * returns)
+    # Include nodes outside the bipartite set that are targets of links in
+    # the projection after the nodes in the set.
+    others = numpy.flatnonzero((degrees_in > 0) & (top == 0)).tolist()
+    order_projection = indices + others
+    degrees_in_projection = degrees_in[order_projection].tolist()
+    degrees_out_projection = degrees_out[order_projection].tolist()
+    # Define classes of degree in the same order as NetworkX.
+    degrees = set.union(
+        {degree for degree in degrees_in_projection},
+        {degree for degree in degrees_out_projection}
+    )
+    mapping = {degree: index for index, degree in enumerate(degrees)}
+    count = len(mapping)
+    classes = numpy.zeros(
+        (max(max(degrees_in.max(), degrees_out.max()) + 1, 1)),
+        dtype=numpy.int64
+    )
+    classes[list(mapping.keys())] = list(mapping.values())
+    classes_out = classes[degrees_out]
+    classes_in = classes[degrees_in]
+    # Count links in the projection between classes of out degree of sources
+    # and classes of in degree of targets.
+    nodes_range = numpy.arange(order)
+    indicator_out = scipy.sparse.csr_matrix(
+        (top, (classes_out, nodes_range)), shape=(count, order)
+    )
+    indicator_in = scipy.sparse.csr_matrix(
+        (numpy.ones(order, dtype=numpy.int64), (nodes_range, classes_in)),
+        shape=(order, count)
+    )
+    counts = (indicator_out @ (matrix @ (matrix @ indicator_in))).toarray()
+    # Remove paths from each node to itself.
+    numpy.subtract.at(
+        counts, (classes_out, classes_in), (top * returns)
+    )
+    # Calculate numeric assortativity coefficient as in NetworkX.
+    mixing = counts.astype(numpy.float64)
+    mixing = mixing / mixing.sum()
+    if mixing.sum() != 1.0:
+        mixing = mixing / mixing.sum()
+    x = numpy.array(list(mapping.keys()))
+    y = x
+    positions = list(mapping.values())
+    a = mixing.sum(axis=0)
+    b = mixing.sum(axis=1)
+    variance_a = (a[positions] * x**2).sum() - ((a[positions] * x).sum()) ** 2
+    variance_b = (b[positions] * y**2).sum() - ((b[positions] * y).sum()) ** 2
+    xy = numpy.outer(x, y)
+    ab = numpy.outer(a[positions], b[positions])
+    return float(
+        (xy * (mixing - ab)).sum() / numpy.sqrt(variance_a * variance_b)
+    )
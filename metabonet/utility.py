@@ -46,6 +46,7 @@ import textwrap
 import string
 
 # Relevant
+import numpy
 
 # Custom
 
@@ -199,6 +200,180 @@ def write_file_table(
         writer.writerows(information)
 
 
+def collect_reference_values(key=None, reference=None):
+    """
+    Collects a single value from all records in a reference.
+
+    Map from identifiers to values avoids repetitive access of records for
+    each row of a report.
+
+    arguments:
+        key (str): key of value in record
+        reference (dict<dict<str>>): reference of records
+
+    raises:
+
+    returns:
+        (dict<str>): values from records by identifiers
+
+    """
+
+    return {
+        identifier: record[key] for identifier, record in reference.items()
+    }
+
+
+def sort_table_columns(columns=None, key=None, reverse=None):
+    """
+    Sorts rows of a table in columnar format by values in a single column.
+
+    Sort is stable, as it is for sort of records.
+
+    arguments:
+        columns (dict<list>): values of each column in order of rows
+        key (str): name of column by which to sort rows
+        reverse (bool): whether to sort in descending order
+
+    raises:
+
+    returns:
+        (dict<list>): values of each column in order of rows
+
+    """
+
+    values = columns[key]
+    order = sorted(
+        range(len(values)), key=values.__getitem__, reverse=reverse
+    )
+    return {
+        name: [column[index] for index in order]
+        for name, column in columns.items()
+    }
+
+
+def write_file_table_columns(
+    columns=None, path_file=None, delimiter=None
+):
+    """
+    Writes a table in columnar format to file.
+
+    Product is identical to that from writes of equivalent records.
+
+    arguments:
+        columns (dict<list>): values of each column in order of rows
+        path_file (str): path to directory and file
+        delimiter (str): delimiter between values in the table
+
+    returns:
+
+    raises:
+
+    """
+
+    # Write information to file in large blocks.
+    with open(path_file, "w", buffering=(2 ** 20)) as file_product:
+        writer = csv.writer(file_product, delimiter=delimiter)
+        writer.writerow(list(columns.keys()))
+        writer.writerows(zip(*columns.values()))
+
+
+def define_table_array(columns=None):
+    """
+    Defines a structured array for a table in columnar format.
+
+    Each column of the structured array has the type of its values, such that
+    text has a fixed width of its longest value.
+
+    arguments:
+        columns (dict<list>): values of each column in order of rows
+
+    raises:
+
+    returns:
+        (object): structured array of table
+
+    """
+
+    arrays = {name: numpy.asarray(values) for name, values in columns.items()}
+    count = len(next(iter(arrays.values()))) if len(arrays) > 0 else 0
+    table = numpy.empty(
+        count,
+        dtype=[(name, array.dtype) for name, array in arrays.items()]
+    )
+    for name, array in arrays.items():
+        table[name] = array
+    return table
+
+
+def collect_table_array_columns(table=None):
+    """
+    Collects columns of a structured array as values in a table in columnar
+    format.
+
+    arguments:
+        table (object): structured array of table
+
+    raises:
+
+    returns:
+        (dict<list>): values of each column in order of rows
+
+    """
+
+    return {name: table[name].tolist() for name in table.dtype.names}
+
+
+def read_file_table_array(path_file=None):
+    """
+    Reads a table in binary columnar format from file.
+
+    arguments:
+        path_file (str): path to directory and file
+
+    returns:
+        (object): structured array of table
+
+    raises:
+
+    """
+
+    # Read columns from file without unpickling objects.
+    with numpy.load(path_file, allow_pickle=False) as file_source:
+        columns = {name: file_source[name] for name in file_source.files}
+    # Order columns as in original table.
+    names = [str(name) for name in columns.pop("names")]
+    return define_table_array(
+        columns={name: columns[name] for name in names}
+    )
+
+
+def write_file_table_array(table=None, path_file=None):
+    """
+    Writes a table in binary columnar format to file.
+
+    The file is an uncompressed archive of one array for each column, along
+    with names of columns in their original order.
+
+    arguments:
+        table (object): structured array of table
+        path_file (str): path to directory and file
+
+    returns:
+
+    raises:
+
+    """
+
+    # Write information to file.
+    columns = {name: table[name] for name in table.dtype.names}
+    with open(path_file, "wb") as file_product:
+        numpy.savez(
+            file_product,
+            names=numpy.array(table.dtype.names, dtype=str),
+            **columns
+        )
+
+
 def find(match=None, sequence=None):
     """
     Finds the first element in a sequence to match a condition, otherwise none
@@ -540,6 +715,74 @@ def filter_entries_identifiers(
     return entries_novel
 
 
+def determine_disjoint_set_root(element=None, parents=None):
+    """
+    Determines the root element of an element's disjoint set.
+
+    This function halves the path from the element to its root.
+
+    arguments:
+        element (object): element
+        parents (dict): parent of each element
+
+    raises:
+
+    returns:
+        (object): root element of element's set
+
+    """
+
+    while parents[element] != element:
+        parents[element] = parents[parents[element]]
+        element = parents[element]
+    return element
+
+
+def collect_disjoint_sets(elements=None, pairs=None):
+    """
+    Collects disjoint sets of elements that pairs connect.
+
+    This function uses a union-find structure, so its memory is proportional
+    to the counts of elements and sets.
+    Order of sets follows order of each set's first element.
+
+    arguments:
+        elements (iterable): elements
+        pairs (iterable<tuple>): pairs of elements to connect
+
+    raises:
+
+    returns:
+        (list<set>): disjoint sets of elements
+
+    """
+
+    parents = {}
+    sizes = {}
+    for element in elements:
+        parents.setdefault(element, element)
+        sizes.setdefault(element, 1)
+    for one, two in pairs:
+        for element in (one, two):
+            if element not in parents:
+                parents[element] = element
+                sizes[element] = 1
+        root_one = determine_disjoint_set_root(element=one, parents=parents)
+        root_two = determine_disjoint_set_root(element=two, parents=parents)
+        if root_one != root_two:
+            # Attach smaller set to larger set.
+            if sizes[root_one] < sizes[root_two]:
+                root_one, root_two = root_two, root_one
+            parents[root_two] = root_one
+            sizes[root_one] += sizes[root_two]
+    # Collect sets in order of each set's first element.
+    sets = {}
+    for element in parents:
+        root = determine_disjoint_set_root(element=element, parents=parents)
+        sets.setdefault(root, set()).add(element)
+    return list(sets.values())
+
+
 # Human Metabolome Database (HMDB).
 
 
@@ -0,0 +1,417 @@
+"""
+Author:
+
+    Thomas Cameron Waller
+    tcameronwaller@gmail.com
+    Department of Biochemistry
+    University of Utah
+    Room 4100, Emma Eccles Jones Medical Research Building
+    15 North Medical Drive East
+    Salt Lake City, Utah 84112
+    United States of America
+
+License:
+
+    This file is part of MetaboNet
+    (https://github.com/tcameronwaller/metabonet/).
+
+    MetaboNet supports definition and analysis of custom metabolic networks.
+    Copyright (C) 2019 Thomas Cameron Waller
+
+    MetaboNet is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the Free
+    Software Foundation, either version 3 of the License, or (at your option)
+    any later version.
+
+    MetaboNet is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+    more details.
+
+    You should have received a copy of the GNU General Public License along
+    with MetaboNet. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+###############################################################################
+# Notes
+
+# The purpose of this procedure is to define multiple variants of a network
+# from a single reading of the metabolic model.
+# Variants differ by compartmentalization and simplification of hubs.
+
+###############################################################################
+# Installation and importation
+
+# Standard
+import os
+import pickle
+import multiprocessing
+
+# Relevant
+
+# Custom
+import metabonet.utility as utility
+import metabonet.candidacy as candidacy
+import metabonet.network as network
+import metabonet.conversion as conversion
+import metabonet.compact as compact
+
+#dir()
+#importlib.reload()
+
+###############################################################################
+# Functionality
+
+
+# Reference information that worker processes share.
+reference_variants = {}
+
+
+def define_variants(variants=None):
+    """
+    Defines parameters for variants of a network.
+
+    arguments:
+        variants (str): selection of variants, currently only "all"
+
+    raises:
+
+    returns:
+        (list<dict>): parameters for variants of a network
+
+    """
+
+    records = []
+    if variants == "all":
+        for compartmentalization in [True, False]:
+            for hubs in [True, False]:
+                record = {
+                    "name": determine_variant_name(
+                        compartmentalization=compartmentalization,
+                        hubs=hubs
+                    ),
+                    "compartmentalization": compartmentalization,
+                    # Simplification removes or replicates hub metabolites.
+                    "simplification": not hubs
+                }
+                records.append(record)
+    return records
+
+
+def determine_variant_name(compartmentalization=None, hubs=None):
+    """
+    Determines name of a network's variant.
+
+    arguments:
+        compartmentalization (bool): whether compartmentalization is relevant
+        hubs (bool): whether network includes hub metabolites without
+            simplification
+
+    raises:
+
+    returns:
+        (str): name of variant
+
+    """
+
+    return (
+        "compartments-" + str(compartmentalization).lower() + "_" +
+        "hubs-" + str(hubs).lower()
+    )
+
+
+def initialize_worker(source=None, reference=None):
+    """
+    Initializes reference information within a worker process.
+
+    arguments:
+        source (dict): source information about model and customization
+        reference (dict<dict>): reference information for evaluation of
+            candidacy
+
+    raises:
+
+    returns:
+
+    """
+
+    reference_variants["source"] = source
+    reference_variants["reference"] = reference
+
+
+def report_variant_status(name=None, status=None):
+    """
+    Reports status of a variant from a worker process.
+
+    Each report is a single complete line with the variant's name, such that
+    reports from parallel workers remain distinguishable.
+
+    arguments:
+        name (str): name of variant
+        status (str): status to report
+
+    raises:
+
+    returns:
+
+    """
+
+    print("... variant " + name + ": " + status + " ...", flush=True)
+
+
+def execute_variant(
+    variant=None,
+    component=None,
+    convert=None,
+    compression=None,
+    directory=None
+):
+    """
+    Defines and writes a single variant of a network.
+
+    arguments:
+        variant (dict): parameters for variant of network
+        component (bool): whether to select network's main component
+        convert (bool): whether to convert network's elements to formats for
+            NetworkX and CytoScape
+        compression (bool): whether to compress converted files in GZIP format
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+        (str): name of variant
+
+    """
+
+    source = reference_variants["source"]
+    reference = reference_variants["reference"]
+    # Evaluate candidacy of reactions and metabolites.
+    report_variant_status(name=variant["name"], status="evaluating candidacy")
+    information_candidacy = candidacy.collect_candidacy(
+        source=source,
+        reference=reference,
+        compartmentalization=variant["compartmentalization"],
+        simplification=variant["simplification"]
+    )
+    # Define network's nodes and links.
+    report_variant_status(name=variant["name"], status="defining network")
+    information_network = network.define_network_elements(
+        component=component,
+        reactions_candidacy=information_candidacy["reactions"],
+        metabolites_candidacy=information_candidacy["metabolites"],
+        reactions=source["reactions"],
+        metabolites=source["metabolites"],
+        compartments=source["compartments"],
+        processes=source["processes"]
+    )
+    # Define compact representation of network.
+    information_network["network_compact"] = compact.define_compact_network(
+        nodes_reactions=information_network["nodes_reactions"],
+        nodes_metabolites=information_network["nodes_metabolites"],
+        links=information_network["links"]
+    )
+    # Write product information to file.
+    path = os.path.join(directory, variant["name"])
+    candidacy.write_product(directory=path, information=information_candidacy)
+    write_product_network(path=path, information=information_network)
+    # Convert information about network's elements.
+    # Conversion for CytoScape includes novel keys in nodes and links, so it
+    # follows storage of network's elements.
+    if convert:
+        report_variant_status(name=variant["name"], status="converting")
+        information_conversion = {
+            "networkx": conversion.convert_networkx(
+                nodes_reactions=information_network["nodes_reactions"],
+                nodes_metabolites=information_network["nodes_metabolites"],
+                links=information_network["links"]
+            ),
+            "nodes_reactions": information_network["nodes_reactions"],
+            "nodes_metabolites": information_network["nodes_metabolites"],
+            "links": information_network["links"]
+        }
+        write_product_conversion(
+            path=path,
+            information=information_conversion,
+            compression=compression
+        )
+    report_variant_status(name=variant["name"], status="complete")
+    return variant["name"]
+
+
+def execute_variant_worker(parameters=None):
+    """
+    Defines and writes a single variant of a network within a worker process.
+
+    arguments:
+        parameters (dict): parameters for variant of network
+
+    raises:
+
+    returns:
+        (str): name of variant
+
+    """
+
+    return execute_variant(
+        variant=parameters["variant"],
+        component=parameters["component"],
+        convert=parameters["convert"],
+        compression=parameters["compression"],
+        directory=parameters["directory"]
+    )
+
+
+def write_product_network(path=None, information=None):
+    """
+    Writes information about network's elements to file.
+
+    The directory for a variant of a network has the same organization as the
+    directory for a single network.
+
+    arguments:
+        path (str): directory for product files
+        information (object): information to write to file
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    utility.confirm_path_directory(path)
+    path_nodes_reactions = os.path.join(path, "nodes_reactions.pickle")
+    path_nodes_metabolites = os.path.join(path, "nodes_metabolites.pickle")
+    path_links = os.path.join(path, "links.pickle")
+    # Write information to file.
+    with open(path_nodes_reactions, "wb") as file_product:
+        pickle.dump(information["nodes_reactions"], file_product)
+    with open(path_nodes_metabolites, "wb") as file_product:
+        pickle.dump(information["nodes_metabolites"], file_product)
+    with open(path_links, "wb") as file_product:
+        pickle.dump(information["links"], file_product)
+    compact.write_compact_network(
+        path=path, network=information["network_compact"]
+    )
+    compact.write_network_store(
+        path=path, network=information["network_compact"]
+    )
+
+
+def write_product_conversion(path=None, information=None, compression=None):
+    """
+    Writes information about network's elements in versatile formats to file.
+
+    arguments:
+        path (str): directory for product files
+        information (object): information to write to file
+        compression (bool): whether to compress files in GZIP format
+
+    raises:
+
+    returns:
+
+    """
+
+    # Specify directories and files.
+    utility.confirm_path_directory(path)
+    # Write information to file.
+    conversion.write_cytoscape(
+        path=path,
+        nodes_reactions=information["nodes_reactions"],
+        nodes_metabolites=information["nodes_metabolites"],
+        links=information["links"],
+        compression=compression
+    )
+    conversion.write_networkx(
+        path=path,
+        information=information["networkx"],
+        compression=compression
+    )
+
+
+###############################################################################
+# Procedure
+
+
+def execute_procedure(
+    variants=None,
+    component=None,
+    convert=None,
+    compression=None,
+    processes=None,
+    directory=None
+):
+    """
+    Function to execute module's main behavior.
+
+    The purpose of this procedure is to evaluate candidacy and to define
+    network's elements for multiple variants of a network.
+    The procedure reads the model and prepares reference information that is
+    independent of parameters only once for all variants.
+
+    Each variant has a directory with the same organization as the directory
+    for a single network, including a directory for candidacy.
+
+    /root/compartments-true_hubs-true/
+        candidacy/
+        nodes_reactions.pickle
+        nodes_metabolites.pickle
+        links.pickle
+
+    arguments:
+        variants (str): selection of variants, currently only "all"
+        component (bool): whether to select network's main component
+        convert (bool): whether to convert network's elements to formats for
+            NetworkX and CytoScape
+        compression (bool): whether to compress converted files in GZIP format
+        processes (int): count of parallel worker processes
+        directory (str): path to directory for source and product files
+
+    raises:
+
+    returns:
+
+    """
+
+    # Read source information from file.
+    source = candidacy.read_source(directory=directory)
+    # Prepare reference information for evaluation of candidacy.
+    reference = candidacy.prepare_candidacy_reference(
+        reactions=source["reactions"],
+        filtration_compartments=source["filtration_compartments"],
+        filtration_processes=source["filtration_processes"],
+        simplification_reactions=source["simplification_reactions"],
+        simplification_metabolites=source["simplification_metabolites"]
+    )
+    # Define parameters for variants.
+    parameters = []
+    for variant in define_variants(variants=variants):
+        record = {
+            "variant": variant,
+            "component": component,
+            "convert": convert,
+            "compression": compression,
+            "directory": directory
+        }
+        parameters.append(record)
+    # Define and write variants.
+    if (processes is not None) and (processes > 1):
+        # Worker processes receive reference information once at
+        # initialization.
+        with multiprocessing.Pool(
+            processes=min(processes, len(parameters)),
+            initializer=initialize_worker,
+            initargs=(source, reference)
+        ) as pool:
+            pool.map(execute_variant_worker, parameters)
+    else:
+        initialize_worker(source=source, reference=reference)
+        for record in parameters:
+            execute_variant_worker(parameters=record)
+
+
+if (__name__ == "__main__"):
+    execute_procedure()
@@ -81,6 +81,7 @@ def execute_procedure():
         install_requires=[
             "pandas",
             "numpy",
+            "scipy",
             "networkx",
             "matplotlib",
             "wordcloud",